@@ -353,7 +353,7 @@ async def delete_allowlist(name: str) -> dict[str, str]:
         raise HTTPException(status_code=404, detail=f"Allowlist '{name}' not found")
 
     # Remove from registry
-    del registry._allowlists[name]
+    registry.unregister(name)
 
     # Clear cache
     clear_caches()
@@ -49,8 +49,12 @@ from pii_airlock.metrics.collectors import (
     DEANONYMIZATION_DURATION,
     SECRET_SCAN_DURATION,
 )
-from pii_airlock.cache.llm_cache import LLMCache, get_cache_key, CACHE_HITS, CACHE_MISSES
-from pii_airlock.auth.quota import QuotaType, check_quota as check_quota_limit
+from pii_airlock.cache.llm_cache import LLMCache, cache_metrics, get_cache_key
+from pii_airlock.auth.quota import (
+    QuotaType,
+    check_quota as check_quota_limit,
+    quota_check_context,
+)
 
 # Audit logging (lazy import to avoid circular dependencies)
 _audit_logger = None
@@ -209,35 +213,51 @@ class ProxyService:
         # Track PII counts by type for metrics
         pii_counts: dict[str, int] = {}
 
-        for msg in messages:
-            # Skip system messages (don't anonymize instructions)
-            if msg.role == "system":
-                anonymized_messages.append(msg)
-                continue
-
-            result = anonymizer.anonymize(msg.content, session_id=request_id)
-
-            # Merge mappings and track PII counts
-            for entry in result.mapping._entries:
-                if not combined_mapping.get_placeholder(
-                    entry.entity_type, entry.original_value
-                ):
-                    combined_mapping.add(
-                        entry.entity_type,
-                        entry.original_value,
-                        entry.placeholder,
-                    )
-                    # Track PII counts
-                    pii_counts[entry.entity_type] = pii_counts.get(entry.entity_type, 0) + 1
-
-            anonymized_messages.append(
-                Message(
-                    role=msg.role,
-                    content=result.text,
-                    name=msg.name,
+        try:
+            # Skip system messages (don't anonymize instructions); the rest are
+            # analyzed together so the NLP pipeline runs once per request
+            user_messages = [msg for msg in messages if msg.role != "system"]
+            results = iter(
+                anonymizer.anonymize_batch(
+                    [msg.content for msg in user_messages],
+                    session_ids=[request_id] * len(user_messages),
                 )
             )
 
+            for msg in messages:
+                if msg.role == "system":
+                    anonymized_messages.append(msg)
+                    continue
+
+                result = next(results)
+
+                # Merge mappings and track PII counts
+                for entry in result.mapping._entries:
+                    if not combined_mapping.get_placeholder(
+                        entry.entity_type, entry.original_value
+                    ):
+                        combined_mapping.add(
+                            entry.entity_type,
+                            entry.original_value,
+                            entry.placeholder,
+                        )
+                        # Track PII counts
+                        pii_counts[entry.entity_type] = (
+                            pii_counts.get(entry.entity_type, 0) + 1
+                        )
+
+                anonymized_messages.append(
+                    Message(
+                        role=msg.role,
+                        content=result.text,
+                        name=msg.name,
+                    )
+                )
+        finally:
+            # The combined mapping holds this request's values; drop the
+            # session copy even if anonymization fails
+            anonymizer.clear_session(request_id)
+
         # OPS-006: Record anonymization latency
         ANONYMIZATION_DURATION.observe(time.time() - start_time)
 
@@ -484,7 +504,7 @@ class ProxyService:
         entry = self.cache.get(cache_key, tenant_id)
         if entry:
             # OPS-004: Record cache hit
-            CACHE_HITS.labels(tenant_id=tenant_id, model=model).inc()
+            cache_metrics(tenant_id, model)[0].inc()
             logger.info(
                 "Cache hit for request",
                 extra={
@@ -497,7 +517,7 @@ class ProxyService:
             return entry.response_data
 
         # OPS-004: Record cache miss
-        CACHE_MISSES.labels(tenant_id=tenant_id, model=model).inc()
+        cache_metrics(tenant_id, model)[1].inc()
         return None
 
     def _store_cache(
@@ -551,41 +571,44 @@ class ProxyService:
         Raises:
             QuotaExceededError: If quota limit is exceeded.
         """
-        # Check request quota
-        allowed, limit = check_quota_limit(tenant_id, QuotaType.REQUESTS, 1)
-        if not allowed:
-            QUOTA_EXCEEDED.labels(tenant_id=tenant_id, quota_type="requests").inc()
-            logger.warning(
-                "Request quota exceeded",
-                extra={
-                    "event": "quota_exceeded",
-                    "tenant_id": tenant_id,
-                    "quota_type": "requests",
-                },
-            )
-            return False
-
-        # Check token quota if tokens provided
-        if token_count > 0:
-            allowed, limit = check_quota_limit(tenant_id, QuotaType.TOKENS, token_count)
+        # Check and record share one memo, so record_usage() reuses the
+        # windows resolved by the REQUESTS check
+        with quota_check_context():
+            # Check request quota
+            allowed, limit = check_quota_limit(tenant_id, QuotaType.REQUESTS, 1)
             if not allowed:
-                QUOTA_EXCEEDED.labels(tenant_id=tenant_id, quota_type="tokens").inc()
+                QUOTA_EXCEEDED.labels(tenant_id=tenant_id, quota_type="requests").inc()
                 logger.warning(
-                    "Token quota exceeded",
+                    "Request quota exceeded",
                     extra={
                         "event": "quota_exceeded",
                         "tenant_id": tenant_id,
-                        "quota_type": "tokens",
+                        "quota_type": "requests",
                     },
                 )
                 return False
 
-        # Record usage (we'll update with actual token count later)
-        from pii_airlock.auth.quota import get_quota_store
-        quota_store = get_quota_store()
-        quota_store.record_usage(tenant_id, QuotaType.REQUESTS, 1)
+            # Check token quota if tokens provided
+            if token_count > 0:
+                allowed, limit = check_quota_limit(tenant_id, QuotaType.TOKENS, token_count)
+                if not allowed:
+                    QUOTA_EXCEEDED.labels(tenant_id=tenant_id, quota_type="tokens").inc()
+                    logger.warning(
+                        "Token quota exceeded",
+                        extra={
+                            "event": "quota_exceeded",
+                            "tenant_id": tenant_id,
+                            "quota_type": "tokens",
+                        },
+                    )
+                    return False
+
+            # Record usage (we'll update with actual token count later)
+            from pii_airlock.auth.quota import get_quota_store
+            quota_store = get_quota_store()
+            quota_store.record_usage(tenant_id, QuotaType.REQUESTS, 1)
 
-        return True
+            return True
 
     async def chat_completion(
         self,
@@ -441,19 +441,21 @@ async def create_embeddings(
         request_id = str(uuid.uuid4())
         anonymizer = proxy._ensure_anonymizer()
 
-        # Handle both string and list inputs
-        if isinstance(body.input, str):
-            result = anonymizer.anonymize(body.input, session_id=request_id)
-            anonymized_input = result.text
-            pii_count = len(result.entities)
-        else:
-            # List of strings
-            anonymized_input = []
-            pii_count = 0
-            for text in body.input:
-                result = anonymizer.anonymize(text, session_id=request_id)
-                anonymized_input.append(result.text)
-                pii_count += len(result.entities)
+        try:
+            # Handle both string and list inputs
+            if isinstance(body.input, str):
+                result = anonymizer.anonymize(body.input, session_id=request_id)
+                anonymized_input = result.text
+                pii_count = len(result.entities)
+            else:
+                # List of strings, analyzed in one batched NLP pass
+                results = anonymizer.anonymize_batch(
+                    body.input, session_ids=[request_id] * len(body.input)
+                )
+                anonymized_input = [result.text for result in results]
+                pii_count = sum(len(result.entities) for result in results)
+        finally:
+            anonymizer.clear_session(request_id)
 
         # Log PII anonymization for embeddings
         if pii_count > 0:
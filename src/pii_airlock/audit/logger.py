@@ -183,6 +183,32 @@ class AuditLogger:
             if len(self._pending_events) >= self._batch_size:
                 await self._flush_unlocked()
 
+    async def log_batch(
+        self,
+        event_type: AuditEventType,
+        events: list[dict[str, Any]],
+    ) -> None:
+        """批量记录同一类型的审计事件
+
+        所有事件在一次加锁中入队，避免逐条调用 log() 的任务和锁开销。
+
+        Args:
+            event_type: 事件类型
+            events: 每个事件的属性（与 log() 的关键字参数相同，会与当前上下文合并）
+        """
+        if not self._enabled or not events:
+            return
+
+        batch = [
+            create_event(event_type=event_type, **self._merge_context(fields))
+            for fields in events
+        ]
+
+        async with self._lock:
+            self._pending_events.extend(batch)
+            if len(self._pending_events) >= self._batch_size:
+                await self._flush_unlocked()
+
     async def _flush_unlocked(self) -> None:
         """刷新缓冲区（不加锁版本）"""
         if not self._pending_events:
@@ -22,6 +22,7 @@ class AuditEventType(str, Enum):
     PII_DEANONYMIZED = "pii_deanonymized"
     PII_MAPPING_CREATED = "pii_mapping_created"
     PII_MAPPING_DELETED = "pii_mapping_deleted"
+    ALLOWLIST_EXEMPT = "allowlist_exempt"
 
     # API 操作
     API_REQUEST = "api_request"
@@ -7,25 +7,41 @@
 """
 
 import asyncio
+import io
 import json
 import csv
+import logging
 import os
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 import aiofiles
 import aiofiles.os
 
+try:
+    import msgpack
+except ImportError:
+    # 可选依赖（pii-airlock[msgpack]），仅 msgpack 格式的 Redis 存储需要
+    msgpack = None
+
+try:
+    import redis
+except ImportError:
+    # 仅 redis 后端需要，其他后端不依赖
+    redis = None
+
 from pii_airlock.audit.models import (
     AuditEvent,
+    AuditEventType,
     AuditFilter,
     AuditSummary,
-    AuditEventType,
     RiskLevel,
 )
 
+_logger = logging.getLogger(__name__)
+
 
 class AuditStore(ABC):
     """审计日志存储抽象接口"""
@@ -265,7 +281,6 @@ class FileAuditStore(AuditStore):
         """导出为 CSV 格式"""
         events = await self.query(filter)
 
-        import io
         output = io.StringIO()
         fieldnames = [
             "event_id", "event_type", "timestamp", "tenant_id", "user_id",
@@ -811,7 +826,6 @@ class DatabaseAuditStore(AuditStore):
         """导出为 CSV 格式"""
         events = await self.query(filter)
 
-        import io
         output = io.StringIO()
         fieldnames = [
             "event_id", "event_type", "timestamp", "tenant_id", "user_id",
@@ -864,14 +878,10 @@ class DatabaseAuditStore(AuditStore):
             total_events=len(events),
         )
 
-        for event in events:
-            summary.events_by_type[event.event_type.value] = (
-                summary.events_by_type.get(event.event_type.value, 0) + 1
-            )
-            summary.events_by_risk[event.risk_level.value] = (
-                summary.events_by_risk.get(event.risk_level.value, 0) + 1
-            )
+        summary.events_by_type = dict(Counter(e.event_type.value for e in events))
+        summary.events_by_risk = dict(Counter(e.risk_level.value for e in events))
 
+        for event in events:
             if event.event_type == AuditEventType.PII_DETECTED:
                 summary.pii_detected_count += event.entity_count
             elif event.event_type == AuditEventType.PII_ANONYMIZED:
@@ -918,26 +928,36 @@ async def get_audit_store() -> AuditStore:
     支持通过环境变量 PII_AIRLOCK_AUDIT_STORE 配置存储后端:
     - memory: 内存存储（默认，测试环境）
     - file: 文件存储（开发环境）
-    - redis: Redis 存储（生产环境）
+    - redis: Redis 存储（生产环境），写入格式由
+      PII_AIRLOCK_AUDIT_REDIS_FORMAT 指定（json 默认 / msgpack）
     - database: 数据库存储（生产环境）
     """
     global _audit_store
 
+    # 快速路径：初始化完成后实例不再变化，无需再获取锁
+    store = _audit_store
+    if store is not None:
+        return store
+
     async with _store_lock:
+        # Double-check locking pattern
         if _audit_store is None:
-            import os
-
             store_type = os.getenv("PII_AIRLOCK_AUDIT_STORE", "file").lower()
 
             if store_type == "memory":
                 max_events = int(os.getenv("PII_AIRLOCK_AUDIT_MAX_EVENTS", "10000"))
                 _audit_store = MemoryAuditStore(max_events=max_events)
             elif store_type == "redis":
-                import redis
+                if redis is None:
+                    raise ImportError("redis package is required for the redis audit store")
                 redis_url = os.getenv("PII_AIRLOCK_REDIS_URL", "redis://localhost:6379")
-                redis_client = redis.from_url(redis_url, decode_responses=True)
+                # MessagePack 为二进制格式，不能让客户端自动解码为 str
+                redis_client = redis.from_url(redis_url, decode_responses=False)
                 ttl = int(os.getenv("PII_AIRLOCK_AUDIT_TTL", "2592000"))  # 30 days
-                _audit_store = RedisAuditStore(redis_client, default_ttl=ttl)
+                serializer = os.getenv("PII_AIRLOCK_AUDIT_REDIS_FORMAT", "json").lower()
+                _audit_store = RedisAuditStore(
+                    redis_client, default_ttl=ttl, serializer=serializer
+                )
             elif store_type == "database":
                 db_url = os.getenv("PII_AIRLOCK_AUDIT_DB_URL", "sqlite:///./audit.db")
                 _audit_store = DatabaseAuditStore(db_url)
@@ -1013,7 +1033,6 @@ class MemoryAuditStore(AuditStore):
         """导出为 CSV 格式"""
         events = await self.query(filter)
 
-        import io
         output = io.StringIO()
         fieldnames = [
             "event_id", "event_type", "timestamp", "tenant_id", "user_id",
@@ -1066,14 +1085,10 @@ class MemoryAuditStore(AuditStore):
             total_events=len(events),
         )
 
-        for event in events:
-            summary.events_by_type[event.event_type.value] = (
-                summary.events_by_type.get(event.event_type.value, 0) + 1
-            )
-            summary.events_by_risk[event.risk_level.value] = (
-                summary.events_by_risk.get(event.risk_level.value, 0) + 1
-            )
+        summary.events_by_type = dict(Counter(e.event_type.value for e in events))
+        summary.events_by_risk = dict(Counter(e.risk_level.value for e in events))
 
+        for event in events:
             if event.event_type == AuditEventType.PII_DETECTED:
                 summary.pii_detected_count += event.entity_count
             elif event.event_type == AuditEventType.PII_ANONYMIZED:
@@ -1106,32 +1121,75 @@ class RedisAuditStore(AuditStore):
 
     适用于生产环境和分布式部署。
     支持自动 TTL 过期和批量操作。
+
+    写入格式由 serializer 显式指定："json"（默认）或 "msgpack"
+    （体积更小、解析更快，需安装 pii-airlock[msgpack]）。读取时两种
+    格式均可识别；共享同一 Redis 的所有实例应使用相同配置。
     """
 
+    SERIALIZERS = ("json", "msgpack")
+
     KEY_PREFIX = "pii_airlock:audit:"
 
     def __init__(
         self,
         redis_client,
         default_ttl: int = 2592000,  # 30 days default
+        serializer: str = "json",
     ):
         """初始化 Redis 审计存储
 
         Args:
             redis_client: Redis 客户端实例
             default_ttl: 默认 TTL（秒），默认 30 天
+            serializer: 事件写入格式，"json" 或 "msgpack"
+
+        Raises:
+            ValueError: serializer 不受支持
+            ImportError: 选择 msgpack 但未安装 msgpack
         """
+        if serializer not in self.SERIALIZERS:
+            raise ValueError(f"Unsupported audit serializer: {serializer}")
+        if serializer == "msgpack" and msgpack is None:
+            raise ImportError(
+                "msgpack package is required for the msgpack audit format "
+                "(pip install pii-airlock[msgpack])"
+            )
         self._client = redis_client
         self._default_ttl = default_ttl
+        self._serializer = serializer
 
     def _make_key(self, event_id: str) -> str:
         """生成 Redis key"""
         return f"{self.KEY_PREFIX}{event_id}"
 
+    def _encode_event(self, event: AuditEvent) -> bytes | str:
+        """按配置的格式序列化审计事件"""
+        if self._serializer == "msgpack":
+            return msgpack.packb(event.to_dict(), use_bin_type=True)
+        return event.to_json()
+
+    @staticmethod
+    def _decode_event(data: bytes | str) -> AuditEvent:
+        """反序列化审计事件
+
+        JSON 对象总以 "{" 开头，而 MessagePack map 不会，
+        据此区分新旧两种格式。
+        """
+        if isinstance(data, bytes):
+            if not data.startswith(b"{"):
+                if msgpack is None:
+                    raise ValueError(
+                        "MessagePack audit record found but msgpack is not installed"
+                    )
+                return AuditEvent.from_dict(msgpack.unpackb(data, raw=False))
+            data = data.decode()
+        return AuditEvent.from_json(data)
+
     async def write(self, event: AuditEvent) -> None:
         """写入审计事件"""
         key = self._make_key(event.event_id)
-        data = event.to_json()
+        data = self._encode_event(event)
 
         # 使用 setex 设置 TTL
         self._client.setex(key, self._default_ttl, data)
@@ -1147,7 +1205,7 @@ class RedisAuditStore(AuditStore):
 
         for event in events:
             key = self._make_key(event.event_id)
-            data = event.to_json()
+            data = self._encode_event(event)
             pipe.setex(key, self._default_ttl, data)
 
             timestamp_key = f"{self.KEY_PREFIX}timestamp:{int(event.timestamp.timestamp())}"
@@ -1179,16 +1237,26 @@ class RedisAuditStore(AuditStore):
 
             results = pipe.execute()
 
+            undecodable = 0
+            last_error: Exception | None = None
             for data in results:
                 if data:
                     try:
-                        event = AuditEvent.from_json(
-                            data.decode() if isinstance(data, bytes) else data
-                        )
-                        if filter.match(event):
-                            events.append(event)
-                    except (json.JSONDecodeError, ValueError):
+                        event = self._decode_event(data)
+                    except (json.JSONDecodeError, ValueError) as e:
+                        undecodable += 1
+                        last_error = e
                         continue
+                    if filter.match(event):
+                        events.append(event)
+
+            if undecodable:
+                # 不静默丢弃：格式不兼容（如缺少 msgpack）时需要运维感知
+                _logger.warning(
+                    "Skipped %d undecodable audit records: %s",
+                    undecodable,
+                    last_error,
+                )
 
         # 排序
         reverse = filter.sort_order == "desc"
@@ -1213,7 +1281,6 @@ class RedisAuditStore(AuditStore):
         """导出为 CSV 格式"""
         events = await self.query(filter)
 
-        import io
         output = io.StringIO()
         fieldnames = [
             "event_id", "event_type", "timestamp", "tenant_id", "user_id",
@@ -1266,14 +1333,10 @@ class RedisAuditStore(AuditStore):
             total_events=len(events),
         )
 
-        for event in events:
-            summary.events_by_type[event.event_type.value] = (
-                summary.events_by_type.get(event.event_type.value, 0) + 1
-            )
-            summary.events_by_risk[event.risk_level.value] = (
-                summary.events_by_risk.get(event.risk_level.value, 0) + 1
-            )
+        summary.events_by_type = dict(Counter(e.event_type.value for e in events))
+        summary.events_by_risk = dict(Counter(e.risk_level.value for e in events))
 
+        for event in events:
             if event.event_type == AuditEventType.PII_DETECTED:
                 summary.pii_detected_count += event.entity_count
             elif event.event_type == AuditEventType.PII_ANONYMIZED:
@@ -94,7 +94,7 @@ class APIKeyStore:
     def __init__(self) -> None:
         """Initialize the API key store."""
         self._keys: Dict[str, APIKey] = {}  # key_id -> APIKey
-        self._full_keys: Dict[str, APIKey] = {}  # full_key_hash -> APIKey
+        self._full_keys: Dict[bytes, APIKey] = {}  # sha256(full_key) digest -> APIKey
         self._tenant_keys: Dict[str, List[str]] = {}  # tenant_id -> list[key_id]
         self._lock = threading.RLock()
 
@@ -123,7 +123,8 @@ class APIKeyStore:
         full_key = f"piiak_{tenant_id}_{random_part}"
 
         # Create key metadata
-        key_id = hashlib.sha256(full_key.encode()).hexdigest()[:16]
+        key_hash = hashlib.sha256(full_key.encode()).digest()
+        key_id = key_hash.hex()[:16]
         key_prefix = full_key[:12]  # First 12 chars for display
 
         now = time.time()
@@ -145,8 +146,7 @@ class APIKeyStore:
 
         with self._lock:
             self._keys[key_id] = api_key
-            # Store hash of full key for validation
-            key_hash = hashlib.sha256(full_key.encode()).hexdigest()
+            # Store raw digest of full key for validation (shorter dict key than hex)
             self._full_keys[key_hash] = api_key
 
             # Update tenant index
@@ -187,7 +187,7 @@ class APIKeyStore:
         Returns:
             APIKey if valid, None otherwise.
         """
-        key_hash = hashlib.sha256(full_key.encode()).hexdigest()
+        key_hash = hashlib.sha256(full_key.encode()).digest()
 
         with self._lock:
             api_key = self._full_keys.get(key_hash)
@@ -371,7 +371,13 @@ def get_api_key_store() -> APIKeyStore:
     """
     global _api_key_store
 
+    # Fast path: the store never changes once created, skip the lock
+    store = _api_key_store
+    if store is not None:
+        return store
+
     with _store_lock:
+        # Double-check locking pattern
         if _api_key_store is None:
             _api_key_store = APIKeyStore()
 
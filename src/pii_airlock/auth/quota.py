@@ -13,13 +13,19 @@ Quota Periods:
 """
 
 import calendar
+import logging
+import sys
 import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, Optional, List
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, List, Tuple
 import threading
 
+from pii_airlock.config.yaml_cache import load_yaml_cached
 from pii_airlock.logging.setup import get_logger
 
 logger = get_logger(__name__)
@@ -28,6 +34,8 @@ logger = get_logger(__name__)
 class QuotaPeriod(str, Enum):
     """Quota period types."""
 
+    key: str  # interned copy of the value, set below
+
     HOURLY = "hourly"
     DAILY = "daily"
     MONTHLY = "monthly"
@@ -36,11 +44,27 @@ class QuotaPeriod(str, Enum):
 class QuotaType(str, Enum):
     """Quota measurement types."""
 
+    key: str  # interned copy of the value, set below
+
     REQUESTS = "requests"
     TOKENS = "tokens"
 
 
-@dataclass
+# ``.value`` is a descriptor lookup; hot paths read the plain ``key``
+# attribute instead.
+for _member in (*QuotaPeriod, *QuotaType):
+    _member.key = sys.intern(_member.value)
+del _member
+
+# Enum iteration goes through EnumMeta.__iter__; hot paths use this tuple
+_PERIODS = tuple(QuotaPeriod)
+
+# Usage map key. Hashing a tuple of the enum members is cheaper than
+# formatting a "{tenant}:{type}:{period}" string on every lookup.
+_UsageKey = Tuple[str, QuotaType, QuotaPeriod]
+
+
+@dataclass(slots=True)
 class QuotaLimit:
     """A quota limit configuration.
 
@@ -62,7 +86,17 @@ class QuotaLimit:
         return int(self.limit * (self.soft_limit_percent / 100))
 
 
-@dataclass
+@lru_cache(maxsize=2)
+def _month_end(year: int, month: int) -> float:
+    """Epoch timestamp at which the given UTC month ends."""
+    if month == 12:
+        year, month = year + 1, 1
+    else:
+        month += 1
+    return float(calendar.timegm((year, month, 1, 0, 0, 0)))
+
+
+@dataclass(slots=True)
 class QuotaUsage:
     """Current quota usage for a tenant.
 
@@ -81,34 +115,47 @@ class QuotaUsage:
     current_usage: int = 0
     window_start: float = field(default_factory=time.time)
     window_end: float = field(default_factory=time.time)
+    # Guards only this counter, so increments never contend across tenants.
+    _counter_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
 
     @property
     def is_expired(self) -> bool:
         """Check if the usage window has expired."""
         return time.time() > self.window_end
 
-    def reset(self) -> None:
-        """Reset usage for new window."""
+    def is_expired_at(self, now: float) -> bool:
+        """Check expiry against a timestamp the caller already has.
+
+        Args:
+            now: Current time as returned by ``time.time()``.
+        """
+        return now > self.window_end
+
+    def reset(self, now: Optional[float] = None) -> None:
+        """Reset usage for new window.
+
+        Args:
+            now: Current time; read from the clock if not given.
+        """
+        if now is None:
+            now = time.time()
         self.current_usage = 0
-        self.window_start = time.time()
-        self.window_end = self._calculate_window_end()
+        self.window_start = now
+        self.window_end = self._calculate_window_end(now)
 
-    def _calculate_window_end(self) -> float:
-        """Calculate end of current window."""
-        now = time.time()
+    def _calculate_window_end(self, now: float) -> float:
+        """Calculate end of the window starting at ``now``."""
         if self.period == QuotaPeriod.HOURLY:
             return now + 3600
         elif self.period == QuotaPeriod.DAILY:
-            # End of current UTC day
-            dt = datetime.utcnow()
-            tomorrow = dt.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
-            return tomorrow.timestamp()
+            # End of current UTC day (epoch days are UTC-aligned)
+            return float((int(now) // 86400 + 1) * 86400)
         else:  # MONTHLY
             # End of current UTC month
-            dt = datetime.utcnow()
-            _, last_day = calendar.monthrange(dt.year, dt.month)
-            month_end = dt.replace(day=last_day, hour=23, minute=59, second=59)
-            return month_end.timestamp()
+            tm = time.gmtime(now)
+            return _month_end(tm.tm_year, tm.tm_mon)
 
     def increment(self, amount: int = 1) -> int:
         """Increment usage and return new total.
@@ -119,8 +166,9 @@ class QuotaUsage:
         Returns:
             New usage count.
         """
-        self.current_usage += amount
-        return self.current_usage
+        with self._counter_lock:
+            self.current_usage += amount
+            return self.current_usage
 
 
 @dataclass
@@ -134,6 +182,20 @@ class QuotaConfig:
 
     tenant_id: str
     limits: List[QuotaLimit] = field(default_factory=list)
+    _index: Dict[Tuple[QuotaType, QuotaPeriod], QuotaLimit] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.rebuild_index()
+
+    def rebuild_index(self) -> None:
+        """Rebuild the (quota_type, period) lookup after ``limits`` changes."""
+        index: Dict[Tuple[QuotaType, QuotaPeriod], QuotaLimit] = {}
+        for limit in self.limits:
+            # First entry wins, matching the previous linear scan
+            index.setdefault((limit.quota_type, limit.period), limit)
+        self._index = index
 
     def get_limit(self, quota_type: QuotaType, period: QuotaPeriod) -> Optional[QuotaLimit]:
         """Get limit for specific quota type and period.
@@ -145,16 +207,95 @@ class QuotaConfig:
         Returns:
             QuotaLimit if found, None otherwise.
         """
-        for limit in self.limits:
-            if limit.quota_type == quota_type and limit.period == period:
-                return limit
+        return self._index.get((quota_type, period))
+
+
+# Number of lock stripes in QuotaStore (must be a power of two)
+_SHARD_COUNT = 16
+
+# Per-request memo of (store, usages) by (tenant_id, quota_type).
+# None outside quota_check_context(), which disables memoization.
+_request_memo: ContextVar[
+    Optional[Dict[Tuple[str, QuotaType], Tuple["QuotaStore", List[QuotaUsage]]]]
+] = ContextVar("quota_request_memo", default=None)
+
+# Precompiled limit check: (amount, usages in QuotaPeriod order) -> position
+# in the compiled checks of the first exceeded limit, or -1 if the amount fits.
+_LimitChecker = Callable[[int, List[QuotaUsage]], int]
+
+
+def _compile_checker(
+    config: QuotaConfig, quota_type: QuotaType
+) -> Optional[Tuple[_LimitChecker, Tuple[Tuple[int, QuotaLimit], ...]]]:
+    """Specialize the hard-limit check for one tenant and quota type.
+
+    Only periods that actually have a limit are checked, with their
+    thresholds bound as closure variables, so the common single-limit
+    tenant pays one add and one compare per check.
+
+    Args:
+        config: Quota configuration (index already built).
+        quota_type: Type of quota.
+
+    Returns:
+        Tuple of (checker, ((period_index, limit), ...)), or None if no
+        limit is configured for this quota type.
+    """
+    checks = tuple(
+        (i, limit)
+        for i, period in enumerate(_PERIODS)
+        if (limit := config.get_limit(quota_type, period)) is not None
+    )
+    if not checks:
         return None
 
+    if len(checks) == 1:
+        ((index, only),) = checks
+        hard = only.limit
+
+        def checker(amount: int, usages: List[QuotaUsage]) -> int:
+            return 0 if usages[index].current_usage + amount > hard else -1
+
+    else:
+        thresholds = tuple((pos, i, limit.limit) for pos, (i, limit) in enumerate(checks))
+
+        def checker(amount: int, usages: List[QuotaUsage]) -> int:
+            for pos, i, hard in thresholds:
+                if usages[i].current_usage + amount > hard:
+                    return pos
+            return -1
+
+    return checker, checks
+
+
+@contextmanager
+def quota_check_context() -> Iterator[None]:
+    """Memoize quota lookups for the duration of one request.
+
+    Inside the block, repeated check_quota() and record_usage() calls for
+    the same tenant and quota type reuse the config and usage windows
+    resolved by the first call instead of walking every period again.
+    Windows that expire mid-request are still rolled over.
+
+    Example:
+        with quota_check_context():
+            allowed, _ = store.check_quota(tenant_id, QuotaType.REQUESTS)
+            if allowed:
+                store.record_usage(tenant_id, QuotaType.REQUESTS)
+    """
+    token = _request_memo.set({})
+    try:
+        yield
+    finally:
+        _request_memo.reset(token)
+
 
 class QuotaStore:
     """Storage and tracking for quota usage.
 
-    Thread-safe in-memory storage with periodic cleanup.
+    Thread-safe in-memory storage with periodic cleanup. Per-tenant state
+    is striped across lock shards by tenant ID, so independent tenants
+    never contend on the same lock.
     """
 
     def __init__(self, cleanup_interval: int = 300) -> None:
@@ -164,18 +305,102 @@ class QuotaStore:
             cleanup_interval: Seconds between cleanup runs.
         """
         self._configs: Dict[str, QuotaConfig] = {}  # tenant_id -> QuotaConfig
-        self._usage: Dict[str, QuotaUsage] = {}  # "{tenant_id}:{type}:{period}" -> QuotaUsage
-        self._lock = threading.RLock()
+        # tenant_id -> {quota_type: compiled check}, rebuilt by set_quota()
+        self._checkers: Dict[
+            str,
+            Dict[QuotaType, Optional[Tuple[_LimitChecker, Tuple[Tuple[int, QuotaLimit], ...]]]],
+        ] = {}
+        self._locks = [threading.RLock() for _ in range(_SHARD_COUNT)]
+        # (tenant_id, quota_type, period) -> QuotaUsage, one dict per shard
+        self._usage_shards: List[Dict[_UsageKey, QuotaUsage]] = [
+            {} for _ in range(_SHARD_COUNT)
+        ]
+        # Exhausted windows: same key -> (window_end, limit). Lets check_quota
+        # reject already-throttled tenants without touching the lock.
+        self._denied_shards: List[Dict[_UsageKey, Tuple[float, QuotaLimit]]] = [
+            {} for _ in range(_SHARD_COUNT)
+        ]
         self._cleanup_interval = cleanup_interval
 
+        # Background cleanup, started lazily on first write
+        self._shutdown_event = threading.Event()
+        self._cleanup_thread: Optional[threading.Thread] = None
+        self._cleanup_start_lock = threading.Lock()
+
+    def _ensure_background_cleanup(self) -> None:
+        """Start the background cleanup thread if it is not running yet."""
+        if self._cleanup_thread is not None:
+            return
+
+        with self._cleanup_start_lock:
+            if self._cleanup_thread is None:
+                thread = threading.Thread(
+                    target=self._background_cleanup_loop,
+                    daemon=True,
+                    name="QuotaStore-cleanup",
+                )
+                thread.start()
+                self._cleanup_thread = thread
+
+    def _background_cleanup_loop(self) -> None:
+        """Background thread that periodically drops expired windows."""
+        while not self._shutdown_event.wait(timeout=self._cleanup_interval):
+            self.cleanup_expired()
+
+    def cleanup_expired(self) -> int:
+        """Remove expired usage windows and exceeded verdicts.
+
+        Shards are swept one at a time, so only one shard lock is held
+        at any moment.
+
+        Returns:
+            Number of usage windows removed.
+        """
+        now = time.time()
+        removed = 0
+
+        for shard in range(_SHARD_COUNT):
+            with self._locks[shard]:
+                usages = self._usage_shards[shard]
+                expired = [key for key, usage in usages.items() if usage.is_expired_at(now)]
+                for key in expired:
+                    del usages[key]
+                removed += len(expired)
+
+                denied = self._denied_shards[shard]
+                for key in [k for k, (window_end, _) in denied.items() if window_end <= now]:
+                    del denied[key]
+
+        return removed
+
+    def shutdown(self) -> None:
+        """Stop the background cleanup thread."""
+        self._shutdown_event.set()
+        if self._cleanup_thread and self._cleanup_thread.is_alive():
+            self._cleanup_thread.join(timeout=5.0)
+
+    @staticmethod
+    def _shard(tenant_id: str) -> int:
+        """Get the lock shard index for a tenant."""
+        return hash(tenant_id) & (_SHARD_COUNT - 1)
+
     def set_quota(self, config: QuotaConfig) -> None:
         """Set quota configuration for a tenant.
 
         Args:
             config: Quota configuration.
         """
-        with self._lock:
+        config.rebuild_index()
+        checkers = {quota_type: _compile_checker(config, quota_type) for quota_type in QuotaType}
+        shard = self._shard(config.tenant_id)
+        self._ensure_background_cleanup()
+
+        with self._locks[shard]:
             self._configs[config.tenant_id] = config
+            self._checkers[config.tenant_id] = checkers
+            denied = self._denied_shards[shard]
+            for key in [k for k in denied if k[0] == config.tenant_id]:
+                del denied[key]
 
         logger.info(
             "Quota configured",
@@ -195,7 +420,7 @@ class QuotaStore:
         Returns:
             QuotaConfig if found, None otherwise.
         """
-        with self._lock:
+        with self._locks[self._shard(tenant_id)]:
             return self._configs.get(tenant_id)
 
     def get_usage(self, tenant_id: str, quota_type: QuotaType, period: QuotaPeriod) -> QuotaUsage:
@@ -209,20 +434,110 @@ class QuotaStore:
         Returns:
             Current QuotaUsage (creates new if needed).
         """
-        key = f"{tenant_id}:{quota_type.value}:{period.value}"
+        key = (tenant_id, quota_type, period)
+        shard = self._shard(tenant_id)
+        now = time.time()
 
-        with self._lock:
-            usage = self._usage.get(key)
+        # Steady state: the current window is live, no lock needed
+        seen = self._usage_shards[shard].get(key)
+        if seen is not None and not seen.is_expired_at(now):
+            return seen
 
-            if usage is None or usage.is_expired:
-                usage = QuotaUsage(
-                    tenant_id=tenant_id,
-                    quota_type=quota_type,
-                    period=period,
-                )
-                self._usage[key] = usage
+        with self._locks[shard]:
+            return self._roll_over(shard, key, tenant_id, quota_type, period, now)
+
+    def _get_usages(
+        self, tenant_id: str, quota_type: QuotaType, now: float
+    ) -> List[QuotaUsage]:
+        """Get current usage for every period of a quota type.
 
-            return usage
+        Same as calling get_usage() once per period, but takes the shard
+        lock at most once.
+
+        Args:
+            tenant_id: Tenant identifier.
+            quota_type: Type of quota.
+            now: Current time, shared by every expiry check in the call.
+
+        Returns:
+            Current QuotaUsage per period, in QuotaPeriod order.
+        """
+        shard = self._shard(tenant_id)
+        usages = self._usage_shards[shard]
+        keys = [(tenant_id, quota_type, period) for period in _PERIODS]
+
+        seen = [usages.get(key) for key in keys]
+        if all(usage is not None and not usage.is_expired_at(now) for usage in seen):
+            return seen
+
+        with self._locks[shard]:
+            return [
+                usage
+                if usage is not None and not usage.is_expired_at(now)
+                else self._roll_over(shard, key, tenant_id, quota_type, period, now)
+                for key, usage, period in zip(keys, seen, _PERIODS, strict=True)
+            ]
+
+    def _lookup(self, tenant_id: str, quota_type: QuotaType, now: float) -> List[QuotaUsage]:
+        """Get current usage for every period, memoized per request.
+
+        Inside quota_check_context() the windows resolved by the first
+        call are reused while they are live; otherwise this is
+        _get_usages().
+
+        Args:
+            tenant_id: Tenant identifier.
+            quota_type: Type of quota.
+            now: Current time.
+
+        Returns:
+            Current QuotaUsage per period, in QuotaPeriod order.
+        """
+        memo = _request_memo.get()
+        if memo is None:
+            return self._get_usages(tenant_id, quota_type, now)
+
+        hit = memo.get((tenant_id, quota_type))
+        if (
+            hit is not None
+            and hit[0] is self
+            and not any(usage.is_expired_at(now) for usage in hit[1])
+        ):
+            return hit[1]
+
+        usages = self._get_usages(tenant_id, quota_type, now)
+        memo[(tenant_id, quota_type)] = (self, usages)
+        return usages
+
+    def _roll_over(
+        self,
+        shard: int,
+        key: _UsageKey,
+        tenant_id: str,
+        quota_type: QuotaType,
+        period: QuotaPeriod,
+        now: float,
+    ) -> QuotaUsage:
+        """Replace a missing or expired window. Caller holds the shard lock.
+
+        Compare-and-swap: the entry is re-read under the lock and only
+        replaced if it is still missing or expired, so a window rolls over
+        exactly once and concurrent callers get the fresh window.
+        """
+        usages = self._usage_shards[shard]
+        usage = usages.get(key)
+
+        if usage is None or usage.is_expired_at(now):
+            usage = QuotaUsage(
+                tenant_id=tenant_id,
+                quota_type=quota_type,
+                period=period,
+            )
+            usage.reset(now)
+            usages[key] = usage
+            self._denied_shards[shard].pop(key, None)
+
+        return usage
 
     def check_quota(
         self,
@@ -241,48 +556,76 @@ class QuotaStore:
             Tuple of (allowed, limit) where allowed is True if within quota,
             and limit is the applicable QuotaLimit or None.
         """
-        config = self.get_quota_config(tenant_id)
-        if not config:
+        # Fast path: a window already known to be exhausted rejects any
+        # positive amount until it rolls over, without taking the lock.
+        now = time.time()
+        shard = self._shard(tenant_id)
+        denied_shard = self._denied_shards[shard]
+        if amount > 0 and denied_shard:
+            for period in _PERIODS:
+                denied = denied_shard.get((tenant_id, quota_type, period))
+                if denied is not None and denied[0] > now:
+                    return False, denied[1]
+
+        checkers = self._checkers.get(tenant_id)
+        if checkers is None:
             # No quota configured, allow all
             return True, None
 
-        # Check all periods for this quota type
-        for period in QuotaPeriod:
-            limit = config.get_limit(quota_type, period)
-            if not limit:
-                continue
-
-            usage = self.get_usage(tenant_id, quota_type, period)
-
-            if usage.current_usage + amount > limit.limit:
-                logger.warning(
-                    "Quota limit exceeded",
-                    extra={
-                        "event": "quota_exceeded",
-                        "tenant_id": tenant_id,
-                        "quota_type": quota_type.value,
-                        "period": period.value,
-                        "current": usage.current_usage,
-                        "requested": amount,
-                        "limit": limit.limit,
-                    },
-                )
-                return False, limit
-
-            # Check soft limit warning
-            if usage.current_usage + amount > limit.soft_limit:
-                logger.info(
-                    "Soft quota limit approaching",
-                    extra={
-                        "event": "quota_soft_limit",
-                        "tenant_id": tenant_id,
-                        "quota_type": quota_type.value,
-                        "period": period.value,
-                        "current": usage.current_usage,
-                        "soft_limit": limit.soft_limit,
-                        "hard_limit": limit.limit,
-                    },
-                )
+        compiled = checkers[quota_type]
+        if compiled is None:
+            # No limit for this quota type
+            return True, None
+        checker, checks = compiled
+
+        usages = self._lookup(tenant_id, quota_type, now)
+        exceeded = checker(amount, usages)
+
+        # Soft limit warnings for the periods checked before any hard
+        # failure; skipped entirely when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            for i, limit in checks[:exceeded] if exceeded >= 0 else checks:
+                usage = usages[i]
+                if usage.current_usage + amount > limit.soft_limit:
+                    logger.info(
+                        "Soft quota limit approaching",
+                        extra={
+                            "event": "quota_soft_limit",
+                            "tenant_id": tenant_id,
+                            "quota_type": quota_type.key,
+                            "period": _PERIODS[i].key,
+                            "current": usage.current_usage,
+                            "soft_limit": limit.soft_limit,
+                            "hard_limit": limit.limit,
+                        },
+                    )
+
+        if exceeded >= 0:
+            i, limit = checks[exceeded]
+            usage = usages[i]
+            period = _PERIODS[i]
+            if usage.current_usage >= limit.limit:
+                # Nothing fits until the window ends; remember the verdict,
+                # unless set_quota() replaced the limits since we read them
+                with self._locks[shard]:
+                    if self._checkers.get(tenant_id) is checkers:
+                        denied_shard[(tenant_id, quota_type, period)] = (
+                            usage.window_end,
+                            limit,
+                        )
+            logger.warning(
+                "Quota limit exceeded",
+                extra={
+                    "event": "quota_exceeded",
+                    "tenant_id": tenant_id,
+                    "quota_type": quota_type.key,
+                    "period": period.key,
+                    "current": usage.current_usage,
+                    "requested": amount,
+                    "limit": limit.limit,
+                },
+            )
+            return False, limit
 
         return True, None
 
@@ -299,12 +642,12 @@ class QuotaStore:
             quota_type: Type of quota.
             amount: Amount of usage to record.
         """
-        for period in QuotaPeriod:
-            usage = self.get_usage(tenant_id, quota_type, period)
-            with self._lock:
-                if usage.is_expired:
-                    usage.reset()
-                usage.increment(amount)
+        self._ensure_background_cleanup()
+
+        # _get_usages() rolls expired windows over under the shard lock;
+        # the increments themselves only need the per-counter locks.
+        for usage in self._lookup(tenant_id, quota_type, time.time()):
+            usage.increment(amount)
 
     def get_usage_summary(self, tenant_id: str) -> Dict[str, Dict[str, int]]:
         """Get usage summary for a tenant.
@@ -316,18 +659,19 @@ class QuotaStore:
             Dict of {quota_type: {period: usage}}.
         """
         summary: Dict[str, Dict[str, int]] = {}
+        shard = self._shard(tenant_id)
+        now = time.time()
 
-        with self._lock:
-            for key, usage in self._usage.items():
-                if usage.tenant_id != tenant_id:
+        # All of a tenant's usage lives in one shard
+        with self._locks[shard]:
+            for (key_tenant, quota_type, period), usage in self._usage_shards[shard].items():
+                if key_tenant != tenant_id:
                     continue
 
-                if usage.is_expired:
+                if usage.is_expired_at(now):
                     continue
 
-                if usage.quota_type.value not in summary:
-                    summary[usage.quota_type.value] = {}
-                summary[usage.quota_type.value][usage.period.value] = usage.current_usage
+                summary.setdefault(quota_type.key, {})[period.key] = usage.current_usage
 
         return summary
 
@@ -351,9 +695,6 @@ class QuotaStore:
                 tokens:
                   daily: 5000000
         """
-        import yaml
-        from pathlib import Path
-
         path = Path(path)
 
         store = cls(cleanup_interval=cleanup_interval)
@@ -361,8 +702,7 @@ class QuotaStore:
         if not path.exists():
             return store
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = load_yaml_cached(path)
 
         if data is None:
             return store
@@ -406,7 +746,8 @@ class QuotaStore:
             store.set_quota(config)
 
         logger.info(
-            f"Loaded quota configurations for {len(store._configs)} tenants",
+            "Loaded quota configurations for %d tenants",
+            len(store._configs),
             extra={
                 "event": "quotas_loaded",
                 "source": str(path),
@@ -431,7 +772,13 @@ def get_quota_store() -> QuotaStore:
     """
     global _quota_store
 
+    # Fast path: the store never changes once created, skip the lock
+    store = _quota_store
+    if store is not None:
+        return store
+
     with _quota_store_lock:
+        # Double-check locking pattern
         if _quota_store is None:
             import os
 
@@ -448,6 +795,8 @@ def reset_quota_store() -> None:
     """Reset the global quota store (for testing)."""
     global _quota_store
     with _quota_store_lock:
+        if _quota_store:
+            _quota_store.shutdown()
         _quota_store = None
 
 
@@ -19,7 +19,10 @@ Permissions:
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Set, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
+import logging
 import threading
 
 from pii_airlock.logging.setup import get_logger
@@ -48,9 +51,10 @@ class Role(str, Enum):
     USER = "user"
 
 
-# Default permissions for each role
-ROLE_PERMISSIONS: Dict[Role, Set[Permission]] = {
-    Role.ADMIN: {
+# Default permissions for each role (read-only: merged role sets are
+# memoized below, so the table must not change at runtime)
+ROLE_PERMISSIONS: Mapping[Role, FrozenSet[Permission]] = MappingProxyType({
+    Role.ADMIN: frozenset({
         Permission.LLM_USE,
         Permission.METRICS_VIEW,
         Permission.AUDIT_VIEW,
@@ -58,21 +62,55 @@ ROLE_PERMISSIONS: Dict[Role, Set[Permission]] = {
         Permission.KEY_MANAGE,
         Permission.QUOTA_VIEW,
         Permission.ADMIN_ALL,
-    },
-    Role.OPERATOR: {
+    }),
+    Role.OPERATOR: frozenset({
         Permission.LLM_USE,
         Permission.METRICS_VIEW,
         Permission.QUOTA_VIEW,
-    },
-    Role.VIEWER: {
+    }),
+    Role.VIEWER: frozenset({
         Permission.METRICS_VIEW,
         Permission.AUDIT_VIEW,
         Permission.QUOTA_VIEW,
-    },
-    Role.USER: {
+    }),
+    Role.USER: frozenset({
         Permission.LLM_USE,
-    },
+    }),
+})
+
+_NO_PERMISSIONS: FrozenSet[Permission] = frozenset()
+
+
+@lru_cache(maxsize=64)
+def _permissions_for(roles: Tuple[Role, ...]) -> FrozenSet[Permission]:
+    """Merge the permissions of a role combination.
+
+    Role sets are static and there are only a handful of combinations,
+    so the union is computed once per combination and shared.
+    """
+    if len(roles) == 1:
+        # Single role: share the table's own frozenset
+        return ROLE_PERMISSIONS.get(roles[0], _NO_PERMISSIONS)
+    perms = _NO_PERMISSIONS
+    for role in roles:
+        perms = perms.union(ROLE_PERMISSIONS.get(role, _NO_PERMISSIONS))
+    return perms
+
+
+# One bit per permission, so a role combination collapses into an int mask
+_PERMISSION_BITS: Dict[Permission, int] = {
+    perm: 1 << i for i, perm in enumerate(Permission)
 }
+_ADMIN_ALL_BIT = _PERMISSION_BITS[Permission.ADMIN_ALL]
+
+
+@lru_cache(maxsize=64)
+def _permission_mask(roles: Tuple[Role, ...]) -> int:
+    """Bitmask of the permissions granted by a role combination."""
+    mask = 0
+    for perm in _permissions_for(roles):
+        mask |= _PERMISSION_BITS[perm]
+    return mask
 
 
 @dataclass
@@ -96,16 +134,14 @@ class User:
     is_active: bool = True
 
     @property
-    def permissions(self) -> Set[Permission]:
+    def permissions(self) -> FrozenSet[Permission]:
         """Get all permissions from assigned roles."""
-        perms: Set[Permission] = set()
-        for role in self.roles:
-            perms.update(ROLE_PERMISSIONS.get(role, set()))
-        return perms
+        return _permissions_for(tuple(self.roles))
 
     def has_permission(self, permission: Permission) -> bool:
         """Check if user has a specific permission."""
-        return permission in self.permissions or Permission.ADMIN_ALL in self.permissions
+        mask = _permission_mask(tuple(self.roles))
+        return bool(mask & (_PERMISSION_BITS.get(permission, 0) | _ADMIN_ALL_BIT))
 
     def has_role(self, role: Role) -> bool:
         """Check if user has a specific role."""
@@ -122,8 +158,25 @@ class UserStore:
         """Initialize the user store."""
         self._users: Dict[str, User] = {}  # user_id -> User
         self._email_index: Dict[str, str] = {}  # email -> user_id
+        # Secondary indexes for list_users; inner dicts keep insertion order
+        self._tenant_index: Dict[str, Dict[str, User]] = {}  # tenant_id -> {user_id: User}
+        self._role_index: Dict[Role, Dict[str, User]] = {}  # role -> {user_id: User}
         self._lock = threading.RLock()
 
+    def _index_user(self, user: User) -> None:
+        """Add a user to the secondary indexes. Caller holds the lock."""
+        if user.tenant_id:
+            self._tenant_index.setdefault(user.tenant_id, {})[user.user_id] = user
+        for role in user.roles:
+            self._role_index.setdefault(role, {})[user.user_id] = user
+
+    def _unindex_user(self, user: User) -> None:
+        """Remove a user from the secondary indexes. Caller holds the lock."""
+        if user.tenant_id:
+            self._tenant_index.get(user.tenant_id, {}).pop(user.user_id, None)
+        for role in user.roles:
+            self._role_index.get(role, {}).pop(user.user_id, None)
+
     def create_user(
         self,
         user_id: str,
@@ -154,18 +207,23 @@ class UserStore:
         )
 
         with self._lock:
+            existing = self._users.get(user_id)
+            if existing is not None:
+                self._unindex_user(existing)
             self._users[user_id] = user
             self._email_index[email] = user_id
-
-        logger.info(
-            "User created",
-            extra={
-                "event": "user_created",
-                "user_id": user_id,
-                "email": email,
-                "roles": [r.value for r in user.roles],
-            },
-        )
+            self._index_user(user)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "User created",
+                extra={
+                    "event": "user_created",
+                    "user_id": user_id,
+                    "email": email,
+                    "roles": [r.value for r in user.roles],
+                },
+            )
 
         return user
 
@@ -209,16 +267,19 @@ class UserStore:
             if not user:
                 return None
 
+            self._unindex_user(user)
             user.roles = roles
-
-        logger.info(
-            "User roles updated",
-            extra={
-                "event": "user_roles_updated",
-                "user_id": user_id,
-                "roles": [r.value for r in roles],
-            },
-        )
+            self._index_user(user)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "User roles updated",
+                extra={
+                    "event": "user_roles_updated",
+                    "user_id": user_id,
+                    "roles": [r.value for r in roles],
+                },
+            )
 
         return user
 
@@ -261,17 +322,29 @@ class UserStore:
 
         Returns:
             List of users.
+
+        Note:
+            Filters are served from indexes maintained by this store. Change
+            roles through update_user_roles() rather than editing
+            ``user.roles`` or ``user.tenant_id`` in place, or filtered
+            results will not reflect the edit.
         """
         with self._lock:
-            users = list(self._users.values())
+            if tenant_id and role:
+                by_tenant = self._tenant_index.get(tenant_id, {})
+                by_role = self._role_index.get(role, {})
+                # Walk the smaller index, probe the other
+                if len(by_role) < len(by_tenant):
+                    return [u for uid, u in by_role.items() if uid in by_tenant]
+                return [u for uid, u in by_tenant.items() if uid in by_role]
 
             if tenant_id:
-                users = [u for u in users if u.tenant_id == tenant_id]
+                return list(self._tenant_index.get(tenant_id, {}).values())
 
             if role:
-                users = [u for u in users if role in u.roles]
+                return list(self._role_index.get(role, {}).values())
 
-            return users
+            return list(self._users.values())
 
 
 # Global user store (singleton-like)
@@ -287,16 +360,24 @@ def get_user_store() -> UserStore:
     """
     global _user_store
 
+    # Fast path: the store never changes once published, skip the lock
+    store = _user_store
+    if store is not None:
+        return store
+
     with _user_store_lock:
+        # Double-check locking pattern
         if _user_store is None:
-            _user_store = UserStore()
-            # Create default admin user
-            _user_store.create_user(
+            store = UserStore()
+            # Create default admin user before publishing, so lock-free
+            # readers never see a store without it
+            store.create_user(
                 user_id="admin",
                 name="Default Admin",
                 email="admin@pii-airlock.local",
                 roles=[Role.ADMIN],
             )
+            _user_store = store
 
     return _user_store
 
@@ -19,11 +19,11 @@ Each tenant has:
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Dict, List
+from types import MappingProxyType
+from typing import Optional, Dict, List, Mapping, Tuple
 import threading
 
-import yaml
-
+from pii_airlock.config.yaml_cache import load_yaml_cached
 from pii_airlock.logging.setup import get_logger
 
 logger = get_logger(__name__)
@@ -37,7 +37,11 @@ class TenantStatus(str, Enum):
     SUSPENDED = "suspended"
 
 
-@dataclass
+# Status lookup for config parsing, without exception-driven fallback
+_STATUS_BY_VALUE = {status.value: status for status in TenantStatus}
+
+
+@dataclass(slots=True)
 class Tenant:
     """A tenant configuration.
 
@@ -67,17 +71,33 @@ class Tenant:
         return self.status == TenantStatus.ACTIVE
 
 
-@dataclass
+@dataclass(slots=True)
 class TenantConfig:
     """Configuration for multi-tenant support.
 
     Manages tenant lookup and configuration loading.
-    Thread-safe for concurrent access.
+    Thread-safe for concurrent access: ``tenants`` and ``api_key_index``
+    are read-only snapshots that writers replace copy-on-write, so the
+    per-request lookups never take a lock.
     """
 
-    tenants: Dict[str, Tenant] = field(default_factory=dict)
-    api_key_index: Dict[str, str] = field(default_factory=dict)  # key -> tenant_id
-    _lock: threading.RLock = field(default_factory=threading.RLock)
+    tenants: Mapping[str, Tenant] = field(default_factory=dict)
+    api_key_index: Mapping[str, str] = field(default_factory=dict)  # key -> tenant_id
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+    # (tenants, api_key_index), swapped in one assignment so readers
+    # always see a matching pair
+    _snapshot: Tuple[Mapping[str, Tenant], Mapping[str, str]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._publish(dict(self.tenants), dict(self.api_key_index))
+
+    def _publish(self, tenants: Dict[str, Tenant], api_key_index: Dict[str, str]) -> None:
+        """Install new lookup tables. Caller holds ``_lock`` (or owns self)."""
+        snapshot = (MappingProxyType(tenants), MappingProxyType(api_key_index))
+        self._snapshot = snapshot
+        self.tenants, self.api_key_index = snapshot
 
     def get_tenant(self, tenant_id: str) -> Optional[Tenant]:
         """Get tenant by ID.
@@ -88,8 +108,7 @@ class TenantConfig:
         Returns:
             Tenant if found, None otherwise.
         """
-        with self._lock:
-            return self.tenants.get(tenant_id)
+        return self._snapshot[0].get(tenant_id)
 
     def get_tenant_by_api_key(self, api_key: str) -> Optional[Tenant]:
         """Get tenant by API key.
@@ -100,20 +119,20 @@ class TenantConfig:
         Returns:
             Tenant if found, None otherwise.
         """
-        with self._lock:
-            # Try exact match first
-            tenant_id = self.api_key_index.get(api_key)
-            if tenant_id:
-                return self.tenants.get(tenant_id)
+        tenants, api_key_index = self._snapshot
+
+        # Try exact match first
+        tenant_id = api_key_index.get(api_key)
+        if tenant_id:
+            return tenants.get(tenant_id)
 
-            # Try prefix match for piiak_{tenant}_* format
-            if api_key.startswith("piiak_"):
-                parts = api_key.split("_", 2)
-                if len(parts) >= 2:
-                    tenant_id = parts[1]
-                    return self.tenants.get(tenant_id)
+        # Try prefix match for piiak_{tenant}_* format. Slice out the
+        # tenant segment directly rather than split() into a list.
+        if api_key.startswith("piiak_"):
+            end = api_key.find("_", 6)
+            return tenants.get(api_key[6:end] if end != -1 else api_key[6:])
 
-            return None
+        return None
 
     def add_tenant(self, tenant: Tenant) -> None:
         """Add a tenant to the configuration.
@@ -122,9 +141,11 @@ class TenantConfig:
             tenant: The tenant to add.
         """
         with self._lock:
-            self.tenants[tenant.tenant_id] = tenant
+            tenants, api_key_index = (dict(m) for m in self._snapshot)
+            tenants[tenant.tenant_id] = tenant
             for key in tenant.api_keys:
-                self.api_key_index[key] = tenant.tenant_id
+                api_key_index[key] = tenant.tenant_id
+            self._publish(tenants, api_key_index)
 
             logger.info(
                 "Tenant added to configuration",
@@ -145,10 +166,13 @@ class TenantConfig:
             True if removed, False if not found.
         """
         with self._lock:
-            tenant = self.tenants.pop(tenant_id, None)
+            tenant = self._snapshot[0].get(tenant_id)
             if tenant:
+                tenants, api_key_index = (dict(m) for m in self._snapshot)
+                del tenants[tenant_id]
                 for key in tenant.api_keys:
-                    self.api_key_index.pop(key, None)
+                    api_key_index.pop(key, None)
+                self._publish(tenants, api_key_index)
 
                 logger.info(
                     "Tenant removed from configuration",
@@ -169,11 +193,10 @@ class TenantConfig:
         Returns:
             List of tenants.
         """
-        with self._lock:
-            tenants = list(self.tenants.values())
-            if status:
-                tenants = [t for t in tenants if t.status == status]
-            return tenants
+        tenants = list(self._snapshot[0].values())
+        if status:
+            tenants = [t for t in tenants if t.status == status]
+        return tenants
 
     @classmethod
     def from_yaml(cls, path: Path | str) -> "TenantConfig":
@@ -200,33 +223,39 @@ class TenantConfig:
             logger.warning(f"Tenant configuration file not found: {path}")
             return cls()
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        # Reparsed only when the file changes
+        data = load_yaml_cached(path)
 
         if data is None:
             return cls()
 
-        config = cls()
+        # Build the lookup tables locally and publish them once, rather than
+        # copying both snapshots for every tenant via add_tenant()
+        tenants: Dict[str, Tenant] = {}
+        api_key_index: Dict[str, str] = {}
 
         for tenant_data in data.get("tenants", []):
-            # Parse status
+            # Parse status; unknown values fall back to active
             status_str = tenant_data.get("status", "active")
-            try:
-                status = TenantStatus(status_str.lower())
-            except ValueError:
-                status = TenantStatus.ACTIVE
+            status = _STATUS_BY_VALUE.get(status_str.lower(), TenantStatus.ACTIVE)
 
             tenant = Tenant(
                 tenant_id=tenant_data["tenant_id"],
                 name=tenant_data["name"],
                 status=status,
-                api_keys=tenant_data.get("api_keys", []),
+                # Copy: the parsed document is shared through the YAML cache
+                api_keys=list(tenant_data.get("api_keys", [])),
                 config_path=tenant_data.get("config_path"),
                 rate_limit=tenant_data.get("rate_limit", "60/minute"),
                 max_ttl=tenant_data.get("max_ttl", 300),
-                settings=tenant_data.get("settings", {}),
+                settings=dict(tenant_data.get("settings") or {}),
             )
-            config.add_tenant(tenant)
+            tenants[tenant.tenant_id] = tenant
+            for key in tenant.api_keys:
+                api_key_index[key] = tenant.tenant_id
+
+        config = cls()
+        config._publish(tenants, api_key_index)
 
         logger.info(
             f"Loaded {len(config.tenants)} tenants from configuration",
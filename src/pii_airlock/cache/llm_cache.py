@@ -6,7 +6,8 @@ This module provides caching of LLM responses to reduce:
 - Rate limiting impact (fewer upstream requests)
 
 Cache Key:
-    Based on SHA256 hash of:
+    Based on a hash (xxh3-128 if xxhash is installed, else SHA256) of:
+    - Tenant ID
     - Model name
     - Anonymized messages content
     - Temperature and other key parameters
@@ -18,15 +19,27 @@ Cache Strategy:
 """
 
 import hashlib
-import json
+import heapq
+import itertools
+import logging
+import sys
 import time
+import weakref
+from collections import deque
 from dataclasses import dataclass, field, asdict
-from typing import Optional, Dict, Any, AsyncIterator
+from functools import lru_cache, partial
+from typing import Optional, Callable, Deque, Dict, Any, AsyncIterator, List, Tuple
 import threading
 
 from pii_airlock.logging.setup import get_logger
 from pii_airlock.metrics.collectors import Counter, Gauge, Histogram
 
+try:
+    # Optional: non-cryptographic hash, several times faster than SHA256
+    from xxhash import xxh3_128 as _new_key_hasher
+except ImportError:
+    _new_key_hasher = hashlib.sha256
+
 logger = get_logger(__name__)
 
 # Cache metrics
@@ -48,15 +61,56 @@ CACHE_SIZE = Gauge(
     ["tenant_id"],
 )
 
+# The size gauge reports the most recently created LLMCache. Each tenant's
+# gauge child is bound once to a callback that looks that cache up at
+# scrape time; the weak reference keeps replaced caches collectable.
+_size_source: Optional["weakref.ref[LLMCache]"] = None
+_gauged_tenants: set = set()
+
+
+def _tenant_cache_size(tenant_id: str) -> int:
+    """Entry count of a tenant in the current cache, for the size gauge."""
+    cache = _size_source() if _size_source is not None else None
+    if cache is None:
+        return 0
+    return cache._tenant_sizes.get(tenant_id, 0)
+
+
+# Hit latency is sub-millisecond with little variance, so only one hit in
+# LATENCY_SAMPLE_EVERY is observed; the distribution shape is unchanged.
+LATENCY_SAMPLE_EVERY = 32  # must be a power of two
+
 CACHE_LATENCY = Histogram(
     "pii_airlock_cache_lookup_duration_seconds",
-    "Cache lookup latency",
+    "Cache lookup latency (sampled, 1 in 32 hits)",
     ["tenant_id"],
     buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5],
 )
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def cache_metrics(tenant_id: str, model: str) -> Tuple[Any, Any, Any]:
+    """Get the bound cache metric children for a tenant and model.
+
+    ``Metric.labels()`` takes the metric's lock and walks its label dict
+    on every call; the children never change once created, so they are
+    resolved once per label set and reused.
+
+    Args:
+        tenant_id: Tenant identifier.
+        model: Model name.
+
+    Returns:
+        Tuple of (hits counter, misses counter, latency histogram).
+    """
+    return (
+        CACHE_HITS.labels(tenant_id=tenant_id, model=model),
+        CACHE_MISSES.labels(tenant_id=tenant_id, model=model),
+        CACHE_LATENCY.labels(tenant_id=tenant_id),
+    )
+
+
+@dataclass(slots=True)
 class CacheEntry:
     """A cached LLM response.
 
@@ -93,6 +147,66 @@ class CacheEntry:
         return time.time() - self.created_at
 
 
+def _feed_key(update: Callable[[bytes], None], value: Any) -> None:
+    """Feed a JSON-like value into a hash, without serializing it first.
+
+    Every value is tagged with its type and strings and containers with
+    their length, so distinct structures never feed the same bytes. Dict
+    keys are visited in sorted order, like ``json.dumps(sort_keys=True)``.
+
+    Args:
+        update: The hasher's ``update`` method.
+        value: Value made of dicts, lists, strings and scalars.
+    """
+    if isinstance(value, str):
+        data = value.encode()
+        update(b"s%d:" % len(data))
+        update(data)
+    elif isinstance(value, dict):
+        update(b"d%d:" % len(value))
+        for k in sorted(value):
+            _feed_key(update, k)
+            _feed_key(update, value[k])
+    elif isinstance(value, (list, tuple)):
+        update(b"l%d:" % len(value))
+        for item in value:
+            _feed_key(update, item)
+    else:
+        # None, bools and numbers; repr keeps 1, 1.0 and True apart
+        update(b"v")
+        update(repr(value).encode())
+        update(b";")
+
+
+def _estimate_size(value: Any) -> int:
+    """Estimate the UTF-8 JSON size of a value without serializing it.
+
+    Counts string bytes, quotes, separators and scalar reprs; escapes
+    and whitespace are ignored, so the result is close to, not exactly,
+    ``len(json.dumps(value, ensure_ascii=False).encode())``.
+
+    Args:
+        value: Value made of dicts, lists, strings and scalars.
+
+    Returns:
+        Approximate size in bytes.
+    """
+    if isinstance(value, str):
+        return (len(value) if value.isascii() else len(value.encode())) + 2
+    if isinstance(value, dict):
+        size = 2
+        for k, v in value.items():
+            size += _estimate_size(k) + _estimate_size(v) + 2
+        return size
+    if isinstance(value, (list, tuple)):
+        size = 2
+        for item in value:
+            size += _estimate_size(item) + 1
+        return size
+    # None/bools repr to the same length as null/true/false
+    return len(repr(value))
+
+
 def get_cache_key(
     tenant_id: str,
     model: str,
@@ -110,32 +224,36 @@ def get_cache_key(
         **kwargs: Other parameters to include in key.
 
     Returns:
-        SHA256 hash string for cache key.
+        Hex digest string for cache key.
     """
-    # Build canonical representation
-    key_data = {
-        "tenant": tenant_id,
-        "model": model,
-        "messages": anonymized_messages,
-        "temperature": temperature,
-    }
+    hasher = _new_key_hasher()
+    update = hasher.update
+
+    # Tenant first, so keys are namespaced per tenant
+    _feed_key(update, tenant_id)
+    _feed_key(update, model)
+    _feed_key(update, anonymized_messages)
+    _feed_key(update, temperature)
 
     # Add significant parameters
     for param in ["top_p", "max_tokens", "presence_penalty", "frequency_penalty"]:
         if param in kwargs and kwargs[param] is not None:
-            key_data[param] = kwargs[param]
+            _feed_key(update, param)
+            _feed_key(update, kwargs[param])
+
+    return hasher.hexdigest()
 
-    # Serialize to JSON with sorted keys
-    key_json = json.dumps(key_data, sort_keys=True, ensure_ascii=False)
 
-    # Hash
-    return hashlib.sha256(key_json.encode()).hexdigest()
+# Number of lock stripes in LLMCache (must be a power of two)
+_SHARD_COUNT = 16
 
 
 class LLMCache:
     """Cache for LLM responses.
 
-    Thread-safe in-memory storage with TTL support.
+    Thread-safe in-memory storage with TTL support. Entries are striped
+    across lock shards by internal key, so concurrent requests for
+    different keys rarely contend on the same lock.
     For production, use Redis-based implementation.
 
     Example:
@@ -162,11 +280,35 @@ class LLMCache:
         self.default_ttl = default_ttl
         self.max_size = max_size
         self._cleanup_interval = cleanup_interval
-        self._store: Dict[str, CacheEntry] = {}
-        self._tenant_index: Dict[str, set] = {}  # tenant_id -> set of keys
-        self._lock = threading.RLock()
+        # internal_key -> (insertion sequence, monotonic deadline, entry), one
+        # dict per shard. The deadline mirrors entry.expires_at on the
+        # monotonic clock, so expiry checks are immune to wall-clock jumps.
+        self._shards: List[Dict[str, Tuple[int, Optional[float], CacheEntry]]] = [
+            {} for _ in range(_SHARD_COUNT)
+        ]
+        self._locks = [threading.RLock() for _ in range(_SHARD_COUNT)]
+        self._sequence = itertools.count()
+        # (sequence, internal_key) in insertion order, for oldest-first
+        # eviction. Replaced or removed entries are skipped lazily when
+        # their sequence no longer matches, and compacted by cleanup.
+        self._fifo: Deque[Tuple[int, str]] = deque()
+        # (monotonic deadline, sequence, internal_key) min-heap, so cleanup
+        # only touches entries that are actually due. Stale records are
+        # skipped the same way as in _fifo.
+        self._expiry_heap: List[Tuple[float, int, str]] = []
+        # Guards _fifo and _expiry_heap. Never held while acquiring a
+        # shard lock.
+        self._order_lock = threading.Lock()
+        self._tenant_sizes: Dict[str, int] = {}  # tenant_id -> entry count
+        # Guards _tenant_sizes. Always taken after a shard lock, never before.
+        self._sizes_lock = threading.Lock()
+        self._hit_tick = 0
         self._shutdown = False
 
+        # Newest cache feeds the size gauge, also for tenants it has not seen
+        global _size_source
+        _size_source = weakref.ref(self)
+
         # Start cleanup thread
         self._cleanup_thread = threading.Thread(
             target=self._cleanup_loop,
@@ -204,6 +346,37 @@ class LLMCache:
         """
         return f"{tenant_id}:{key}"
 
+    def _count_hit(self, tenant_id: str, model: str, start: float) -> None:
+        """Record a cache hit, and for a sample of hits its lookup latency.
+
+        Args:
+            tenant_id: Tenant the entry belongs to.
+            model: Model of the cached response.
+            start: ``time.monotonic()`` at the start of the lookup.
+        """
+        hits, _, latency = cache_metrics(tenant_id, model)
+        hits.inc()
+
+        # Racy across shards, which only jitters the sampling
+        self._hit_tick = tick = (self._hit_tick + 1) & (LATENCY_SAMPLE_EVERY - 1)
+        if tick:
+            return
+
+        latency.observe(time.monotonic() - start)
+
+    def _count_miss(self, tenant_id: str, model: str) -> None:
+        """Record a cache miss."""
+        cache_metrics(tenant_id, model)[1].inc()
+
+    @staticmethod
+    def _shard(internal_key: str) -> int:
+        """Get the lock shard index for an internal key."""
+        return hash(internal_key) & (_SHARD_COUNT - 1)
+
+    def __len__(self) -> int:
+        """Number of stored entries, including not yet swept expired ones."""
+        return sum(len(shard) for shard in self._shards)
+
     def get(self, key: str, tenant_id: Optional[str] = None) -> Optional[CacheEntry]:
         """Get cached entry by key.
 
@@ -214,51 +387,47 @@ class LLMCache:
         Returns:
             CacheEntry if found and valid, None otherwise.
         """
-        start_time = time.time()
+        now = time.monotonic()
 
         # Build internal key - tenant_id is required for proper isolation
         internal_key = self._make_internal_key(key, tenant_id or "default")
+        shard = self._shard(internal_key)
+
+        # Only the store and hit_count are touched under the shard lock;
+        # metrics and logging run after it is released
+        miss: Optional[Tuple[str, str]] = None
+        with self._locks[shard]:
+            item = self._shards[shard].get(internal_key)
+
+            if item is None:
+                miss = (tenant_id or "unknown", "unknown")
+            else:
+                _, deadline, entry = item
+
+                # Check expiration
+                if deadline is not None and now > deadline:
+                    # Remove expired entry
+                    del self._shards[shard][internal_key]
+                    self._adjust_size(entry.tenant_id, -1)
+                    miss = (tenant_id or entry.tenant_id, entry.model)
 
-        with self._lock:
-            entry = self._store.get(internal_key)
-
-            if entry is None:
-                CACHE_MISSES.labels(
-                    tenant_id=tenant_id or "unknown",
-                    model="unknown",
-                ).inc()
-                return None
-
-            # Check expiration
-            if entry.is_expired:
-                # Remove expired entry
-                del self._store[internal_key]
-                self._remove_from_tenant_index(entry.tenant_id, internal_key)
-                CACHE_MISSES.labels(
-                    tenant_id=tenant_id or entry.tenant_id,
-                    model=entry.model,
-                ).inc()
-                return None
-
-            # Validate tenant
-            if tenant_id and entry.tenant_id != tenant_id:
-                CACHE_MISSES.labels(
-                    tenant_id=tenant_id,
-                    model="unknown",
-                ).inc()
-                return None
-
-            # Update hit count
-            entry.hit_count += 1
-
-            # Record metrics
-            duration = time.time() - start_time
-            CACHE_HITS.labels(
-                tenant_id=entry.tenant_id,
-                model=entry.model,
-            ).inc()
-            CACHE_LATENCY.labels(tenant_id=entry.tenant_id).observe(duration)
+                # Validate tenant
+                elif tenant_id and entry.tenant_id != tenant_id:
+                    miss = (tenant_id, "unknown")
 
+                else:
+                    # Update hit count
+                    entry.hit_count += 1
+                    hit_count = entry.hit_count
+
+        if miss is not None:
+            self._count_miss(*miss)
+            return None
+
+        # Record metrics
+        self._count_hit(entry.tenant_id, entry.model, now)
+
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 "Cache hit",
                 extra={
@@ -266,11 +435,11 @@ class LLMCache:
                     "tenant_id": entry.tenant_id,
                     "model": entry.model,
                     "key": key[:16] + "...",
-                    "hit_count": entry.hit_count,
+                    "hit_count": hit_count,
                 },
             )
 
-            return entry
+        return entry
 
     def put(
         self,
@@ -292,17 +461,24 @@ class LLMCache:
         Returns:
             Created CacheEntry.
         """
-        # Calculate size
-        response_json = json.dumps(response_data, ensure_ascii=False)
-        size_bytes = len(response_json.encode())
+        # Calculate size (estimated; a full json.dumps per put is not worth it)
+        size_bytes = _estimate_size(response_data)
 
         # Calculate expiration
         now = time.time()
         effective_ttl = ttl if ttl is not None else self.default_ttl
         expires_at = now + effective_ttl if effective_ttl is not None else None
+        deadline = time.monotonic() + effective_ttl if effective_ttl is not None else None
+
+        # Thousands of entries share a handful of tenant and model names;
+        # intern them so every entry (and metric label key) points at one
+        # copy and equality checks short-circuit on identity
+        tenant_id = sys.intern(tenant_id)
+        model = sys.intern(model)
 
         # Create internal key with tenant isolation
         internal_key = self._make_internal_key(key, tenant_id)
+        shard = self._shard(internal_key)
 
         entry = CacheEntry(
             key=key,
@@ -315,27 +491,25 @@ class LLMCache:
             size_bytes=size_bytes,
         )
 
-        with self._lock:
-            # Enforce max size by evicting oldest entries
-            while len(self._store) >= self.max_size and internal_key not in self._store:
-                # Find oldest entry
-                oldest_key = min(
-                    self._store.keys(),
-                    key=lambda k: self._store[k].created_at,
-                )
-                oldest = self._store.pop(oldest_key)
-                self._remove_from_tenant_index(oldest.tenant_id, oldest_key)
-
-            # Store entry
-            self._store[internal_key] = entry
-
-            # Update tenant index
-            if tenant_id not in self._tenant_index:
-                self._tenant_index[tenant_id] = set()
-            self._tenant_index[tenant_id].add(internal_key)
-
-            # Update metrics
-            self._update_tenant_metrics()
+        # Enforce max size by evicting oldest entries (replacing an
+        # existing key does not grow the cache)
+        if internal_key not in self._shards[shard]:
+            self._evict_oldest(self.max_size - 1)
+
+        seq = next(self._sequence)
+        with self._locks[shard]:
+            # Store entry; a replaced entry gets a new sequence, so it is
+            # the newest for eviction again
+            store = self._shards[shard]
+            replaced = store.get(internal_key)
+            store[internal_key] = (seq, deadline, entry)
+            if replaced is None:
+                self._adjust_size(tenant_id, 1)
+
+        with self._order_lock:
+            self._fifo.append((seq, internal_key))
+            if deadline is not None:
+                heapq.heappush(self._expiry_heap, (deadline, seq, internal_key))
 
         logger.debug(
             "Cache entry stored",
@@ -350,6 +524,41 @@ class LLMCache:
 
         return entry
 
+    def _evict_oldest(self, target_size: int) -> None:
+        """Evict the oldest entries until at most ``target_size`` remain.
+
+        Pops the insertion FIFO, skipping records whose entry was since
+        replaced or removed, so each eviction is amortized O(1). Under
+        concurrent puts the cache may briefly exceed max_size by the
+        number of racing writers.
+        """
+        while len(self) > target_size:
+            with self._order_lock:
+                if not self._fifo:
+                    return
+                seq, internal_key = self._fifo.popleft()
+
+            shard = self._shard(internal_key)
+            with self._locks[shard]:
+                item = self._shards[shard].get(internal_key)
+                # Stale record: the key was replaced or removed meanwhile
+                if item is not None and item[0] == seq:
+                    del self._shards[shard][internal_key]
+                    self._adjust_size(item[2].tenant_id, -1)
+
+    def _is_live(self, seq: int, internal_key: str) -> bool:
+        """Check whether an order record still refers to a stored entry."""
+        item = self._shards[self._shard(internal_key)].get(internal_key)
+        return item is not None and item[0] == seq
+
+    def _compact_order(self) -> None:
+        """Drop FIFO and expiry records of entries that are no longer stored."""
+        with self._order_lock:
+            self._fifo = deque(r for r in self._fifo if self._is_live(*r))
+            heap = [r for r in self._expiry_heap if self._is_live(r[1], r[2])]
+            heapq.heapify(heap)
+            self._expiry_heap = heap
+
     def delete(self, key: str, tenant_id: Optional[str] = None) -> bool:
         """Delete entry from cache.
 
@@ -361,11 +570,11 @@ class LLMCache:
             True if deleted, False if not found.
         """
         internal_key = self._make_internal_key(key, tenant_id or "default")
-        with self._lock:
-            entry = self._store.pop(internal_key, None)
-            if entry:
-                self._remove_from_tenant_index(entry.tenant_id, internal_key)
-                self._update_tenant_metrics()
+        shard = self._shard(internal_key)
+        with self._locks[shard]:
+            item = self._shards[shard].pop(internal_key, None)
+            if item:
+                self._adjust_size(item[2].tenant_id, -1)
                 return True
             return False
 
@@ -378,50 +587,65 @@ class LLMCache:
         Returns:
             Number of entries invalidated.
         """
-        with self._lock:
-            keys = self._tenant_index.get(tenant_id, set()).copy()
-            count = 0
-            for key in keys:
-                if key in self._store:
-                    del self._store[key]
-                    self._tenant_index[tenant_id].discard(key)
-                    count += 1
-
-            self._update_tenant_metrics()
-
-            logger.info(
-                "Tenant cache invalidated",
-                extra={
-                    "event": "cache_tenant_invalidated",
-                    "tenant_id": tenant_id,
-                    "count": count,
-                },
-            )
+        # Rare admin operation, so a scan is fine. Compare tenant IDs
+        # rather than key prefixes: tenant IDs may contain ':'.
+        count = 0
+        for shard in range(_SHARD_COUNT):
+            with self._locks[shard]:
+                store = self._shards[shard]
+                keys = [k for k, item in store.items() if item[2].tenant_id == tenant_id]
+                for k in keys:
+                    del store[k]
+                if keys:
+                    self._adjust_size(tenant_id, -len(keys))
+                count += len(keys)
 
-            return count
+        logger.info(
+            "Tenant cache invalidated",
+            extra={
+                "event": "cache_tenant_invalidated",
+                "tenant_id": tenant_id,
+                "count": count,
+            },
+        )
+
+        return count
 
     def cleanup_expired(self) -> int:
         """Remove all expired entries.
 
+        Pops due records off the expiry heap, so the work is proportional
+        to the number of expired entries rather than the cache size, and
+        each entry is removed under its own shard lock only.
+
         Returns:
             Number of entries removed.
         """
-        now = time.time()
+        now = time.monotonic()
         removed = 0
 
-        with self._lock:
-            expired_keys = [
-                key for key, entry in self._store.items()
-                if entry.is_expired
-            ]
-
-            for key in expired_keys:
-                entry = self._store.pop(key)
-                self._remove_from_tenant_index(entry.tenant_id, key)
-                removed += 1
-
-            if removed:
-                self._update_tenant_metrics()
+        due = []
+        with self._order_lock:
+            heap = self._expiry_heap
+            while heap and heap[0][0] < now:
+                due.append(heapq.heappop(heap))
+
+        for _, seq, internal_key in due:
+            shard = self._shard(internal_key)
+            with self._locks[shard]:
+                store = self._shards[shard]
+                item = store.get(internal_key)
+                # Stale record: the key was replaced or removed meanwhile
+                if item is not None and item[0] == seq:
+                    del store[internal_key]
+                    self._adjust_size(item[2].tenant_id, -1)
+                    removed += 1
+
+        # Replaced and removed entries leave stale order records behind;
+        # keep them from piling up while the cache is below max_size
+        limit = 2 * len(self) + 64
+        if len(self._fifo) > limit or len(self._expiry_heap) > limit:
+            self._compact_order()
 
         return removed
 
@@ -434,51 +658,56 @@ class LLMCache:
         Returns:
             Dictionary of cache statistics.
         """
-        with self._lock:
-            if tenant_id:
-                keys = self._tenant_index.get(tenant_id, set())
-                entries = [self._store[k] for k in keys if k in self._store]
-            else:
-                entries = list(self._store.values())
+        entries: List[CacheEntry] = []
+        for shard in range(_SHARD_COUNT):
+            with self._locks[shard]:
+                entries.extend(item[2] for item in self._shards[shard].values())
+        if tenant_id:
+            entries = [e for e in entries if e.tenant_id == tenant_id]
+
+        total_size = sum(e.size_bytes for e in entries)
+        total_hits = sum(e.hit_count for e in entries)
+        avg_age = (
+            sum(e.age_seconds for e in entries) / len(entries)
+            if entries else 0
+        )
 
-            total_size = sum(e.size_bytes for e in entries)
-            total_hits = sum(e.hit_count for e in entries)
-            avg_age = (
-                sum(e.age_seconds for e in entries) / len(entries)
-                if entries else 0
-            )
+        return {
+            "entry_count": len(entries),
+            "total_size_bytes": total_size,
+            "total_hits": total_hits,
+            "avg_age_seconds": avg_age,
+            "entries": [
+                {
+                    "key": e.key[:16] + "...",
+                    "model": e.model,
+                    "created_at": e.created_at,
+                    "hit_count": e.hit_count,
+                    "size_bytes": e.size_bytes,
+                }
+                for e in entries[:10]  # First 10 entries
+            ],
+        }
+
+    def _adjust_size(self, tenant_id: str, delta: int) -> None:
+        """Track a tenant's entry count.
+
+        The size gauge is not touched here: each tenant's gauge child is
+        bound once to _tenant_cache_size, which reads the count of the
+        current cache at scrape time.
+        """
+        with self._sizes_lock:
+            size = self._tenant_sizes.get(tenant_id, 0) + delta
+            if size > 0:
+                self._tenant_sizes[tenant_id] = size
+            else:
+                self._tenant_sizes.pop(tenant_id, None)
 
-            return {
-                "entry_count": len(entries),
-                "total_size_bytes": total_size,
-                "total_hits": total_hits,
-                "avg_age_seconds": avg_age,
-                "entries": [
-                    {
-                        "key": e.key[:16] + "...",
-                        "model": e.model,
-                        "created_at": e.created_at,
-                        "hit_count": e.hit_count,
-                        "size_bytes": e.size_bytes,
-                    }
-                    for e in entries[:10]  # First 10 entries
-                ],
-            }
-
-    def _remove_from_tenant_index(self, tenant_id: str, key: str) -> None:
-        """Remove key from tenant index."""
-        if tenant_id in self._tenant_index:
-            self._tenant_index[tenant_id].discard(key)
-            if not self._tenant_index[tenant_id]:
-                del self._tenant_index[tenant_id]
-
-    def _update_tenant_metrics(self) -> None:
-        """Update Prometheus metrics for tenant cache sizes."""
-        # Clear existing metrics
-        for tenant in list(self._tenant_index.keys()):
-            CACHE_SIZE.labels(tenant_id=tenant).set(
-                len(self._tenant_index.get(tenant, set()))
-            )
+            if tenant_id not in _gauged_tenants:
+                _gauged_tenants.add(tenant_id)
+                CACHE_SIZE.labels(tenant_id=tenant_id).set_function(
+                    partial(_tenant_cache_size, tenant_id)
+                )
 
     def shutdown(self) -> None:
         """Shutdown the cache cleanup thread."""
@@ -488,9 +717,14 @@ class LLMCache:
 
     def clear(self) -> None:
         """Clear all cache entries."""
-        with self._lock:
-            self._store.clear()
-            self._tenant_index.clear()
+        for shard in range(_SHARD_COUNT):
+            with self._locks[shard]:
+                self._shards[shard].clear()
+        with self._sizes_lock:
+            self._tenant_sizes.clear()
+        with self._order_lock:
+            self._fifo.clear()
+            self._expiry_heap.clear()
 
         logger.info(
             "Cache cleared",
@@ -10,13 +10,23 @@ Compliance presets define:
 - Compliance-specific rules and validations
 """
 
-from dataclasses import dataclass, field
+import contextlib
+import os
+import re
+import sys
+import threading
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from pathlib import Path
 from typing import Optional
 
 import yaml
 
+from pii_airlock.config.yaml_cache import YamlLoader
+from pii_airlock.logging.setup import get_logger
+
+logger = get_logger(__name__)
+
 
 class ComplianceRegion(str, Enum):
     """Supported compliance regions."""
@@ -29,7 +39,7 @@ class ComplianceRegion(str, Enum):
     GLOBAL = "GLOBAL"
 
 
-@dataclass
+@dataclass(slots=True)
 class ComplianceRiskConfig:
     """Risk scoring configuration for a compliance preset.
 
@@ -44,7 +54,7 @@ class ComplianceRiskConfig:
     risk_factors: dict[str, float] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ComplianceRetentionConfig:
     """Data retention configuration for a compliance preset.
 
@@ -61,7 +71,7 @@ class ComplianceRetentionConfig:
     local_storage_reminder: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ComplianceAnonymizationConfig:
     """Anonymization configuration for a compliance preset.
 
@@ -78,7 +88,7 @@ class ComplianceAnonymizationConfig:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class ComplianceRuleConfig:
     """Compliance rule configuration.
 
@@ -91,7 +101,7 @@ class ComplianceRuleConfig:
     additional_config: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ComplianceRules:
     """All compliance rules for a preset.
 
@@ -112,7 +122,7 @@ class ComplianceRules:
     kyc_protection: ComplianceRuleConfig = field(default_factory=ComplianceRuleConfig)
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomPattern:
     """Custom PII pattern for a compliance preset.
 
@@ -122,6 +132,7 @@ class CustomPattern:
         regex: Regular expression pattern.
         score: Confidence score.
         context: Context words for matching.
+        compiled: ``regex`` compiled once at load time.
     """
 
     name: str
@@ -129,9 +140,18 @@ class CustomPattern:
     regex: str
     score: float = 0.7
     context: list[str] = field(default_factory=list)
+    compiled: re.Pattern = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Intern the entity type and compile the regex at load time."""
+        self.entity_type = _intern(self.entity_type)
+        try:
+            self.compiled = re.compile(self.regex)
+        except re.error as e:
+            raise ValueError(f"Pattern {self.name!r} has invalid regex: {e}") from None
 
 
-@dataclass
+@dataclass(slots=True)
 class CompliancePreset:
     """A complete compliance preset configuration.
 
@@ -168,6 +188,10 @@ class CompliancePreset:
     special_rules: dict = field(default_factory=dict)
 
 
+# ComplianceRules field names, in declaration order
+_RULE_FIELDS = tuple(f.name for f in fields(ComplianceRules))
+
+
 def _parse_retention_config(data: dict) -> ComplianceRetentionConfig:
     """Parse retention configuration from dict."""
     if not data:
@@ -207,30 +231,42 @@ def _parse_risk_config(data: dict) -> ComplianceRiskConfig:
     )
 
 
+def _parse_rule(rule_data: dict | bool | None) -> ComplianceRuleConfig:
+    """Parse a single compliance rule from a dict or boolean flag."""
+    if not rule_data:
+        return ComplianceRuleConfig()
+    if isinstance(rule_data, bool):
+        return ComplianceRuleConfig(enabled=rule_data)
+    return ComplianceRuleConfig(
+        enabled=rule_data.get("enabled", True),
+        additional_config=rule_data,
+    )
+
+
 def _parse_rules_config(data: dict) -> ComplianceRules:
     """Parse compliance rules configuration from dict."""
     if not data:
         return ComplianceRules()
 
-    def _parse_rule(rule_data: dict | None) -> ComplianceRuleConfig:
-        if not rule_data:
-            return ComplianceRuleConfig()
-        if isinstance(rule_data, bool):
-            return ComplianceRuleConfig(enabled=rule_data)
-        return ComplianceRuleConfig(
-            enabled=rule_data.get("enabled", True),
-            additional_config=rule_data,
-        )
-
     rules = data.get("compliance_rules", {})
 
-    return ComplianceRules(
-        data_minimization=_parse_rule(rules.get("data_minimization")),
-        consent_management=_parse_rule(rules.get("consent_management")),
-        subject_rights=_parse_rule(rules.get("subject_rights")),
-        pci_dss=_parse_rule(rules.get("pci_dss")),
-        aml_checks=_parse_rule(rules.get("aml_checks")),
-        kyc_protection=_parse_rule(rules.get("kyc_protection")),
+    # Positional, in _RULE_FIELDS (declaration) order
+    return ComplianceRules(*[_parse_rule(rules.get(name)) for name in _RULE_FIELDS])
+
+
+def _intern(value):
+    """Intern a PII type name; non-string values are returned unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _custom_pattern_from_dict(p: dict) -> CustomPattern:
+    """Build a CustomPattern from one custom_patterns entry."""
+    return CustomPattern(
+        name=p.get("name", ""),
+        entity_type=p.get("entity_type", ""),
+        regex=p.get("regex", ""),
+        score=p.get("score", 0.7),
+        context=p.get("context") or [],
     )
 
 
@@ -239,24 +275,30 @@ def _parse_custom_patterns(data: list) -> list[CustomPattern]:
     if not data:
         return []
 
-    patterns = []
-    for p in data:
-        if isinstance(p, dict):
-            patterns.append(
-                CustomPattern(
-                    name=p.get("name", ""),
-                    entity_type=p.get("entity_type", ""),
-                    regex=p.get("regex", ""),
-                    score=p.get("score", 0.7),
-                    context=p.get("context", []),
-                )
-            )
-    return patterns
+    return [_custom_pattern_from_dict(p) for p in data if isinstance(p, dict)]
+
+
+# Default to package config directory
+_DEFAULT_PRESETS_DIR = Path(__file__).resolve().parents[3] / "config" / "compliance_presets"
+
+_EMPTY_PRESET_ERR = "Empty compliance preset file: {}"
+_BAD_STRUCTURE_ERR = "Invalid YAML structure: expected dict, got {}"
+
+# Parsed files: absolute path -> ((mtime_ns, size), preset or
+# (error type, message)), oldest first. Errors are kept as plain data so the
+# cache holds no tracebacks and every caller gets its own exception.
+_file_cache: dict[
+    str, tuple[tuple[int, int], CompliancePreset | tuple[type[Exception], str]]
+] = {}
+_FILE_CACHE_MAXSIZE = 128
 
 
 def load_compliance_preset(path: Path | str) -> CompliancePreset:
     """Load a compliance preset from a YAML file.
 
+    Presets are cached per file and reused until the file's mtime or size
+    changes, so the returned object is shared and must not be modified.
+
     Args:
         path: Path to the YAML compliance preset file.
 
@@ -270,26 +312,81 @@ def load_compliance_preset(path: Path | str) -> CompliancePreset:
     """
     path = Path(path)
 
-    if not path.exists():
-        raise FileNotFoundError(f"Compliance preset file not found: {path}")
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Compliance preset file not found: {path}") from None
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    return _load_preset_file(str(path), st)
 
-    if data is None:
-        raise ValueError(f"Empty compliance preset file: {path}")
 
+def _load_preset_file(path: str, st: os.stat_result) -> CompliancePreset:
+    """Load a preset from an already-stat'ed file, using the per-file cache.
+
+    Invalid files are cached too, so a broken preset raises a new error of
+    the same kind and message without being parsed again until the file
+    changes.
+    """
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = os.path.abspath(path)
+    cached = _file_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        result = cached[1]
+        if isinstance(result, CompliancePreset):
+            return result
+        error_type, message = result
+        raise error_type(message)
+
+    try:
+        preset = _parse_preset_file(path)
+    except ValueError as e:
+        _cache_file_result(key, stamp, (ValueError, str(e)))
+        raise
+    except yaml.YAMLError as e:
+        _cache_file_result(key, stamp, (yaml.YAMLError, str(e)))
+        raise
+    _cache_file_result(key, stamp, preset)
+    return preset
+
+
+def _cache_file_result(
+    key: str,
+    stamp: tuple[int, int],
+    result: CompliancePreset | tuple[type[Exception], str],
+) -> None:
+    """Store a load result in the bounded per-file cache."""
+    if key not in _file_cache and len(_file_cache) >= _FILE_CACHE_MAXSIZE:
+        # Evict the oldest entry; a concurrent loader may have beaten us to it
+        with contextlib.suppress(KeyError, RuntimeError, StopIteration):
+            del _file_cache[next(iter(_file_cache))]
+    _file_cache[key] = (stamp, result)
+
+
+def _parse_preset_file(path: str) -> CompliancePreset:
+    """Parse a preset file into a CompliancePreset."""
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=YamlLoader)
+
+    # Valid presets pass a single check; only failures build a message
     if not isinstance(data, dict):
-        raise ValueError(f"Invalid YAML structure: expected dict, got {type(data).__name__}")
+        if data is None:
+            raise ValueError(_EMPTY_PRESET_ERR.format(path))
+        raise ValueError(_BAD_STRUCTURE_ERR.format(type(data).__name__))
 
     # Extract basic info
-    name = data.get("name", path.stem)
+    name = data.get("name", os.path.splitext(os.path.basename(path))[0])
     description = data.get("description", "")
     version = data.get("version", "1.0")
 
     # Extract configuration sections
+    # PII type names key strategy lookups downstream; intern them so those
+    # lookups compare by identity instead of per-character
     strategies = data.get("strategies", {})
+    if isinstance(strategies, dict):
+        strategies = {_intern(k): v for k, v in strategies.items()}
     pii_types = data.get("pii_types", [])
+    if isinstance(pii_types, list):
+        pii_types = [_intern(t) for t in pii_types]
 
     return CompliancePreset(
         name=name,
@@ -322,14 +419,19 @@ def load_compliance_preset_safe(
     try:
         preset = load_compliance_preset(path)
         return preset, None
-    except FileNotFoundError as e:
-        return None, str(e)
-    except ValueError as e:
-        return None, f"Configuration error: {e}"
-    except yaml.YAMLError as e:
-        return None, f"YAML parsing error: {e}"
     except Exception as e:
-        return None, f"Unexpected error loading preset: {e}"
+        return None, _describe_load_error(e)
+
+
+def _describe_load_error(error: Exception) -> str:
+    """Format a preset loading error for reporting."""
+    if isinstance(error, FileNotFoundError):
+        return str(error)
+    if isinstance(error, ValueError):
+        return f"Configuration error: {error}"
+    if isinstance(error, yaml.YAMLError):
+        return f"YAML parsing error: {error}"
+    return f"Unexpected error loading preset: {error}"
 
 
 def get_available_presets(
@@ -345,22 +447,30 @@ def get_available_presets(
         Dictionary mapping preset names to CompliancePreset objects.
     """
     if presets_dir is None:
-        # Default to package config directory
-        project_root = Path(__file__).parent.parent.parent.parent
-        presets_dir = project_root / "config" / "compliance_presets"
+        presets_dir = _DEFAULT_PRESETS_DIR
 
-    presets_dir = Path(presets_dir)
-
-    if not presets_dir.exists():
+    try:
+        entries = os.scandir(presets_dir)
+    except (FileNotFoundError, NotADirectoryError):
         return {}
 
     presets = {}
-    for yaml_file in presets_dir.glob("*.yaml"):
-        preset, error = load_compliance_preset_safe(yaml_file)
-        if preset:
+    with entries:
+        for entry in entries:
+            file_name = entry.name
+            if not file_name.endswith(".yaml") or not entry.is_file():
+                continue
+            try:
+                preset = _load_preset_file(entry.path, entry.stat())
+            except Exception as e:
+                logger.warning(
+                    "Skipping compliance preset %s: %s",
+                    entry.path,
+                    _describe_load_error(e),
+                )
+                continue
             # Use lowercase name as key for case-insensitive lookup
-            key = yaml_file.stem.lower()
-            presets[key] = preset
+            presets[file_name[:-5].lower()] = preset
 
     return presets
 
@@ -368,18 +478,24 @@ def get_available_presets(
 def get_preset_names(presets_dir: Optional[Path | str] = None) -> list[str]:
     """Get list of available preset names.
 
+    Names are the lowercased file stems of presets that load successfully,
+    so the default directory is served from the get_all_presets() cache
+    rather than re-reading every file.
+
     Args:
         presets_dir: Directory containing preset YAML files.
 
     Returns:
         List of preset names in alphabetical order.
     """
-    presets = get_available_presets(presets_dir)
-    return sorted(presets.keys())
+    if presets_dir is None:
+        return sorted(get_all_presets())
+    return sorted(get_available_presets(presets_dir))
 
 
 # Global preset cache
 _presets_cache: dict[str, CompliancePreset] | None = None
+_presets_lock = threading.Lock()
 
 
 def get_all_presets() -> dict[str, CompliancePreset]:
@@ -390,13 +506,28 @@ def get_all_presets() -> dict[str, CompliancePreset]:
     """
     global _presets_cache
 
-    if _presets_cache is None:
-        _presets_cache = get_available_presets()
+    # Fast path: no lock once the cache is populated
+    presets = _presets_cache
+    if presets is not None:
+        return presets
 
-    return _presets_cache
+    # Concurrent cold callers wait for a single directory load
+    with _presets_lock:
+        if _presets_cache is None:
+            _presets_cache = get_available_presets()
+        return _presets_cache
 
 
 def clear_preset_cache() -> None:
-    """Clear the preset cache. Useful for testing or reloading."""
+    """Clear the preset cache. Useful for testing or reloading.
+
+    Unchanged files are still served from the per-file cache; use
+    clear_file_cache() to force them to be parsed again.
+    """
     global _presets_cache
     _presets_cache = None
+
+
+def clear_file_cache() -> None:
+    """Clear the per-file cache of parsed presets."""
+    _file_cache.clear()
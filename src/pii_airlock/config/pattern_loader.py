@@ -14,14 +14,18 @@ Example YAML configuration:
         context: ["员工", "工号", "employee"]
 """
 
+import re
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 import yaml
 
+from pii_airlock.config.yaml_cache import YamlLoader
 
-@dataclass
+
+@dataclass(slots=True)
 class PatternConfig:
     """Configuration for a single PII pattern.
 
@@ -31,6 +35,7 @@ class PatternConfig:
         regex: Regular expression pattern to match the PII.
         score: Confidence score for matches (0.0 to 1.0).
         context: List of context words that increase match confidence.
+        compiled: ``regex`` compiled once at load time.
     """
 
     name: str
@@ -38,6 +43,7 @@ class PatternConfig:
     regex: str
     score: float = 0.7
     context: list[str] = field(default_factory=list)
+    compiled: re.Pattern = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate configuration values."""
@@ -49,6 +55,12 @@ class PatternConfig:
             raise ValueError("Regex pattern cannot be empty")
         if not 0.0 <= self.score <= 1.0:
             raise ValueError(f"Score must be between 0.0 and 1.0, got {self.score}")
+        if type(self.entity_type) is str:
+            self.entity_type = sys.intern(self.entity_type)
+        try:
+            self.compiled = re.compile(self.regex)
+        except re.error as e:
+            raise ValueError(f"Pattern {self.name!r} has invalid regex: {e}") from None
 
 
 def load_patterns_from_yaml(path: Path | str) -> list[PatternConfig]:
@@ -75,13 +87,12 @@ def load_patterns_from_yaml(path: Path | str) -> list[PatternConfig]:
     if not path.exists():
         raise FileNotFoundError(f"Configuration file not found: {path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-
-    if data is None:
-        return []
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=YamlLoader)
 
     if not isinstance(data, dict):
+        if data is None:
+            return []
         raise ValueError(f"Invalid YAML structure: expected dict, got {type(data).__name__}")
 
     patterns_data = data.get("patterns", [])
@@ -96,21 +107,19 @@ def load_patterns_from_yaml(path: Path | str) -> list[PatternConfig]:
         if not isinstance(p, dict):
             raise ValueError(f"Pattern {i} is not a dict: {type(p).__name__}")
 
-        # Check required fields
-        if "name" not in p:
-            raise ValueError(f"Pattern {i} missing required field: name")
-        if "entity_type" not in p:
-            raise ValueError(f"Pattern {i} missing required field: entity_type")
-        if "regex" not in p:
-            raise ValueError(f"Pattern {i} missing required field: regex")
+        # Required fields are read directly; the first missing one is reported
+        try:
+            name, entity_type, regex = p["name"], p["entity_type"], p["regex"]
+        except KeyError as e:
+            raise ValueError(f"Pattern {i} missing required field: {e.args[0]}") from None
 
         patterns.append(
             PatternConfig(
-                name=p["name"],
-                entity_type=p["entity_type"],
-                regex=p["regex"],
+                name=name,
+                entity_type=entity_type,
+                regex=regex,
                 score=p.get("score", 0.7),
-                context=p.get("context", []),
+                context=p.get("context") or [],
             )
         )
 
@@ -0,0 +1,53 @@
+"""Cached YAML loading for configuration files.
+
+Configuration files are re-read on every store construction (tests,
+reloads, per-worker startup), but rarely change. Parsed documents are
+kept in-process and reused until the file's mtime or size changes.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import yaml
+
+from pii_airlock.logging.setup import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    # libyaml-backed loader, several times faster than the pure-Python one
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+    logger.warning(
+        "PyYAML was built without libyaml; configuration files will be "
+        "parsed with the slower pure-Python loader"
+    )
+
+# Parsed files: absolute path -> ((mtime_ns, size), data)
+_YAML_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def load_yaml_cached(path: Path) -> Any:
+    """Parse a YAML file, reusing the last result while the file is unchanged.
+
+    Args:
+        path: Path to an existing YAML file.
+
+    Returns:
+        Parsed YAML data. Callers must treat it as read-only.
+    """
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    key = str(path.resolve())
+
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=YamlLoader)
+
+    _YAML_CACHE[key] = (stamp, data)
+    return data
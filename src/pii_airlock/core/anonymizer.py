@@ -12,21 +12,120 @@ Example:
     <PERSON_1>的电话是<PHONE_1>
 """
 
+import asyncio
+import contextlib
+import logging
 import os
+import re
 import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional, Sequence, Union
 
-from presidio_analyzer import AnalyzerEngine, RecognizerResult
-from presidio_anonymizer import AnonymizerEngine
-from presidio_anonymizer.entities import OperatorConfig, OperatorResult
+from presidio_analyzer import AnalyzerEngine, BatchAnalyzerEngine, RecognizerResult
 
+from pii_airlock.audit.logger import get_audit_logger
+from pii_airlock.audit.models import AuditEventType
 from pii_airlock.core.mapping import PIIMapping
 from pii_airlock.core.counter import PlaceholderCounter
-from pii_airlock.core.strategies import StrategyConfig, StrategyType, get_strategy
+from pii_airlock.core.strategies import (
+    AnonymizationStrategy,
+    StrategyConfig,
+    StrategyType,
+    get_strategy,
+)
 from pii_airlock.recognizers.registry import create_analyzer_with_chinese_support
-from pii_airlock.recognizers.allowlist import is_allowlisted
+from pii_airlock.recognizers.allowlist import allowlist_generation, is_allowlisted
+
+
+# Characters stripped when normalizing PII values for fuzzy matching.
+# _WHITESPACE matches what "\s" matches in str patterns (all <= U+3000).
+_WHITESPACE = "".join(chr(c) for c in range(0x3001) if chr(c).isspace())
+_DASHES = "-—–"
+_PHONE_SEPARATORS = _DASHES + "()"
+
+# Entity types whose recognizers can only match text containing a digit or
+# "@". When nothing else is requested, other texts skip analysis entirely.
+_PRESCAN_ENTITIES = frozenset({"PHONE_NUMBER", "EMAIL_ADDRESS", "CREDIT_CARD", "ZH_ID_CARD"})
+_MAYBE_PII_RE = re.compile(r"[\d@＠]")
+
+# Normalizer functions by entity type, built on first use
+_NORMALIZERS: dict[str, Callable[[str], str]] = {}
+
+
+def _build_normalizer(entity_type: str) -> Callable[[str], str]:
+    """Build the fuzzy-matching normalizer for an entity type.
+
+    The type checks are substring matches (e.g. any type containing
+    "PHONE"), so they are resolved once per type rather than per value,
+    and the characters to remove are folded into one translation table.
+    """
+    entity_upper = entity_type.upper()
+    # Remove all whitespace
+    delete = _WHITESPACE
+    # For phone numbers, remove common separators
+    if "PHONE" in entity_upper:
+        delete += _PHONE_SEPARATORS
+    # ID and credit card numbers: remove spaces and dashes
+    if "ID_CARD" in entity_upper or "IDCARD" in entity_upper or "CREDIT_CARD" in entity_upper:
+        delete += _DASHES
+    table = str.maketrans("", "", delete)
+
+    # For email, convert to lowercase for comparison
+    if "EMAIL" in entity_upper:
+        return lambda value: value.translate(table).lower()
+    return lambda value: value.translate(table)
+
+
+def _get_normalizer(entity_type: str) -> Callable[[str], str]:
+    """Get the cached fuzzy-matching normalizer for an entity type."""
+    normalizer = _NORMALIZERS.get(entity_type)
+    if normalizer is None:
+        normalizer = _NORMALIZERS.setdefault(entity_type, _build_normalizer(entity_type))
+    return normalizer
+
+
+@lru_cache(maxsize=64)
+def _normalized_type(placeholder_type: str) -> str:
+    """Mapping type under which normalized values of a placeholder type are stored."""
+    return placeholder_type + "_normalized"
+
+
+def _allowlisted_at(generation: int, entity_type: str, value: str) -> bool:
+    """is_allowlisted() keyed by allowlist generation for memoization."""
+    return is_allowlisted(entity_type, value, default=False)
+
+
+@dataclass(frozen=True, slots=True)
+class _EnvDefaults:
+    """Anonymizer feature defaults read from environment variables."""
+
+    enable_allowlist: bool
+    enable_intent_detection: bool
+    max_sessions: int
+
+
+@lru_cache(maxsize=1)
+def _env_defaults() -> _EnvDefaults:
+    """Read the environment defaults once instead of on every construction."""
+    return _EnvDefaults(
+        enable_allowlist=os.getenv("PII_AIRLOCK_ALLOWLIST_ENABLED", "true").lower() == "true",
+        enable_intent_detection=(
+            os.getenv("PII_AIRLOCK_INTENT_DETECTION_ENABLED", "true").lower() == "true"
+        ),
+        max_sessions=int(os.getenv("PII_AIRLOCK_MAX_SESSIONS", "1024")),
+    )
+
+
+def _reset_env_cache() -> None:
+    """Re-read environment defaults on the next Anonymizer construction.
+
+    This is primarily useful for testing after changing environment variables.
+    """
+    _env_defaults.cache_clear()
 
 
 # Global singleton for shared AnalyzerEngine (heavy to initialize)
@@ -92,7 +191,7 @@ def reset_shared_analyzer() -> None:
         _analyzer_config = {}
 
 
-@dataclass
+@dataclass(slots=True)
 class AnonymizationResult:
     """Result of anonymization operation.
 
@@ -160,25 +259,28 @@ class Anonymizer:
         电话是138****8000
     """
 
-    # Default supported entities
-    DEFAULT_ENTITIES: list[str] = [
+    # Default supported entities (immutable; shared until customized)
+    DEFAULT_ENTITIES: tuple[str, ...] = (
         "PERSON",
         "PHONE_NUMBER",
         "EMAIL_ADDRESS",
         "CREDIT_CARD",
         "ZH_ID_CARD",
         "IP_ADDRESS",
-    ]
+    )
 
     # Default mapping from Presidio entity types to our placeholder types
-    DEFAULT_ENTITY_TYPE_MAP: dict[str, str] = {
+    DEFAULT_ENTITY_TYPE_MAP: Mapping[str, str] = MappingProxyType({
         "PERSON": "PERSON",
         "PHONE_NUMBER": "PHONE",
         "EMAIL_ADDRESS": "EMAIL",
         "CREDIT_CARD": "CREDIT_CARD",
         "ZH_ID_CARD": "ID_CARD",
         "IP_ADDRESS": "IP",
-    }
+    })
+
+    # Texts per nlp.pipe batch in anonymize_batch()
+    BATCH_SIZE = 64
 
     def __init__(
         self,
@@ -193,6 +295,7 @@ class Anonymizer:
         load_strategies_from_env: bool = False,
         enable_allowlist: Optional[bool] = None,
         enable_intent_detection: Optional[bool] = None,
+        prescan_regex: bool = True,
     ) -> None:
         """Initialize the anonymizer.
 
@@ -212,22 +315,27 @@ class Anonymizer:
                 environment variables (PII_AIRLOCK_STRATEGY_*).
             enable_allowlist: If True, entities in the allowlist will not be anonymized.
                 If None, reads from PII_AIRLOCK_ALLOWLIST_ENABLED env var (default: True).
+                Environment defaults are read once per process.
             enable_intent_detection: If True, uses intent detection to preserve entities
                 in question contexts (e.g., "Who is Xi Jinping?"). If None, reads from
                 PII_AIRLOCK_INTENT_DETECTION_ENABLED env var (default: True).
+            prescan_regex: If True, texts without any digit or "@" are returned
+                unchanged without running the analyzer, provided only digit/email
+                based entity types are requested.
         """
         self.language = language
         self.score_threshold = score_threshold
+        self.prescan_regex = prescan_regex
 
         # Initialize allowlist setting
         if enable_allowlist is None:
-            self.enable_allowlist = os.getenv("PII_AIRLOCK_ALLOWLIST_ENABLED", "true").lower() == "true"
+            self.enable_allowlist = _env_defaults().enable_allowlist
         else:
             self.enable_allowlist = enable_allowlist
 
         # Initialize intent detection setting
         if enable_intent_detection is None:
-            self.enable_intent_detection = os.getenv("PII_AIRLOCK_INTENT_DETECTION_ENABLED", "true").lower() == "true"
+            self.enable_intent_detection = _env_defaults().enable_intent_detection
         else:
             self.enable_intent_detection = enable_intent_detection
 
@@ -248,16 +356,35 @@ class Anonymizer:
             else:
                 self.strategy_config = StrategyConfig()
 
-        # Initialize entity mappings (copy defaults to avoid mutating class attributes)
-        self.SUPPORTED_ENTITIES = list(self.DEFAULT_ENTITIES)
-        self.ENTITY_TYPE_MAP = dict(self.DEFAULT_ENTITY_TYPE_MAP)
+        # Strategy instances resolved per strategy type on first use.
+        # Strategies registered after construction are not picked up.
+        self._strategies: dict[StrategyType, AnonymizationStrategy] = {}
+
+        # Replacement functions per entity type, specialized on first use
+        # for the entity's placeholder type, strategy and normalizer.
+        self._entity_handlers: dict[
+            str, Callable[[str, PIIMapping, PlaceholderCounter], str]
+        ] = {}
+
+        # Mapping and counter per session_id, so placeholders stay consistent
+        # across calls in one session. This keeps the original values of the
+        # most recent max_sessions sessions in memory; 0 disables it.
+        self.max_sessions = _env_defaults().max_sessions
+        self._sessions: OrderedDict[str, tuple[PIIMapping, PlaceholderCounter]] = OrderedDict()
+        self._sessions_lock = threading.Lock()
+
+        # Allowlist lookups memoized per value; the generation in the key
+        # drops stale results whenever an allowlist changes.
+        self._is_allowlisted_cached = lru_cache(maxsize=4096)(_allowlisted_at)
+
+        # Entity tables share the immutable class defaults and are replaced
+        # by private copies only when custom entity types are added
+        self.SUPPORTED_ENTITIES: list[str] | tuple[str, ...] = self.DEFAULT_ENTITIES
+        self.ENTITY_TYPE_MAP: dict[str, str] | Mapping[str, str] = self.DEFAULT_ENTITY_TYPE_MAP
 
         # Add custom entity types
         if custom_entity_types:
-            self.ENTITY_TYPE_MAP.update(custom_entity_types)
-            for entity_type in custom_entity_types.keys():
-                if entity_type not in self.SUPPORTED_ENTITIES:
-                    self.SUPPORTED_ENTITIES.append(entity_type)
+            self._extend_entity_tables(custom_entity_types, replace=True)
 
         # Load custom patterns from YAML and add their entity types
         if config_path:
@@ -281,7 +408,23 @@ class Anonymizer:
                 config_path=config_path,
             )
 
-        self._anonymizer_engine = AnonymizerEngine()
+    def _extend_entity_tables(self, type_map: Mapping[str, str], replace: bool) -> None:
+        """Add entity types to copies of the entity tables and install the copies.
+
+        Args:
+            type_map: Placeholder type per entity type to add.
+            replace: Whether to overwrite the placeholder type of entity
+                types that are already mapped.
+        """
+        supported_entities = list(self.SUPPORTED_ENTITIES)
+        entity_type_map = dict(self.ENTITY_TYPE_MAP)
+        for entity_type, placeholder_type in type_map.items():
+            if entity_type not in supported_entities:
+                supported_entities.append(entity_type)
+            if replace or entity_type not in entity_type_map:
+                entity_type_map[entity_type] = placeholder_type
+        self.SUPPORTED_ENTITIES = supported_entities
+        self.ENTITY_TYPE_MAP = entity_type_map
 
     def _load_custom_entity_types(self, config_path: Union[Path, str]) -> None:
         """Load custom entity types from YAML configuration.
@@ -292,19 +435,17 @@ class Anonymizer:
         from pii_airlock.config.pattern_loader import load_patterns_from_yaml_safe
 
         patterns, error = load_patterns_from_yaml_safe(config_path)
-        if not error:
-            for pattern in patterns:
-                entity_type = pattern.entity_type
-                if entity_type not in self.SUPPORTED_ENTITIES:
-                    self.SUPPORTED_ENTITIES.append(entity_type)
-                # For custom patterns, use the entity type as placeholder type by default
-                if entity_type not in self.ENTITY_TYPE_MAP:
-                    self.ENTITY_TYPE_MAP[entity_type] = entity_type
+        if not error and patterns:
+            # For custom patterns, use the entity type as placeholder type by default
+            self._extend_entity_tables(
+                {pattern.entity_type: pattern.entity_type for pattern in patterns},
+                replace=False,
+            )
 
     def anonymize(
         self,
         text: str,
-        entities: Optional[list[str]] = None,
+        entities: Optional[Sequence[str]] = None,
         session_id: Optional[str] = None,
     ) -> AnonymizationResult:
         """Anonymize PII in the given text.
@@ -312,7 +453,8 @@ class Anonymizer:
         Args:
             text: Input text potentially containing PII.
             entities: Specific entity types to detect. If None, detect all supported.
-            session_id: Optional session identifier for mapping isolation.
+            session_id: Optional session identifier. Calls sharing a session_id
+                share one mapping, so repeated values keep their placeholders.
 
         Returns:
             AnonymizationResult containing anonymized text and mapping.
@@ -323,30 +465,178 @@ class Anonymizer:
             <PERSON_1>的邮箱是<EMAIL_1>
         """
         if not text or not text.strip():
-            return AnonymizationResult(text=text, mapping=PIIMapping(session_id=session_id))
+            return AnonymizationResult(text=text, mapping=self._session_state(session_id)[0])
 
         entities_to_detect = entities or self.SUPPORTED_ENTITIES
 
+        if self._cannot_contain_pii(text, entities_to_detect):
+            return AnonymizationResult(text=text, mapping=self._session_state(session_id)[0])
+
         # Step 1: Detect PII entities
         analyzer_results = self._analyzer.analyze(
             text=text,
             language=self.language,
-            entities=entities_to_detect,
+            entities=list(entities_to_detect),
             score_threshold=self.score_threshold,
         )
 
+        return self._anonymize_detected(text, analyzer_results, session_id)
+
+    def anonymize_batch(
+        self,
+        texts: list[str],
+        entities: Optional[Sequence[str]] = None,
+        session_ids: Optional[list[Optional[str]]] = None,
+    ) -> list[AnonymizationResult]:
+        """Anonymize PII in several texts with a single batched NLP pass.
+
+        Detection runs the spaCy pipeline over all texts via ``nlp.pipe``
+        (Presidio's BatchAnalyzerEngine), which amortizes pipeline dispatch
+        across many small payloads. Replacement then runs per text exactly
+        as in anonymize(). Texts without a session id each get their own
+        mapping; texts sharing a session id share one, and their
+        ``result.mapping`` is that live session mapping, which later calls
+        in the same session keep extending.
+
+        Args:
+            texts: Input texts potentially containing PII.
+            entities: Specific entity types to detect. If None, detect all supported.
+            session_ids: Optional session identifier per text.
+
+        Returns:
+            One AnonymizationResult per input text, in order.
+
+        Raises:
+            ValueError: If session_ids is given with a different length than texts.
+        """
+        if session_ids is None:
+            session_ids = [None] * len(texts)
+        elif len(session_ids) != len(texts):
+            raise ValueError(
+                f"Expected {len(texts)} session ids, got {len(session_ids)}"
+            )
+
+        entities_to_detect = entities or self.SUPPORTED_ENTITIES
+
+        # Blank texts are returned unchanged without analysis, as in anonymize()
+        pending = [
+            i
+            for i, text in enumerate(texts)
+            if text and text.strip() and not self._cannot_contain_pii(text, entities_to_detect)
+        ]
+        pending_texts = [texts[i] for i in pending]
+        entity_list = list(entities_to_detect)
+
+        if pending_texts and getattr(self._analyzer, "nlp_engine", None) is not None:
+            batch_results = BatchAnalyzerEngine(analyzer_engine=self._analyzer).analyze_iterator(
+                pending_texts,
+                language=self.language,
+                batch_size=self.BATCH_SIZE,
+                entities=entity_list,
+                score_threshold=self.score_threshold,
+            )
+        else:
+            # Analyzer without an exposed NLP engine: analyze one by one
+            batch_results = [
+                self._analyzer.analyze(
+                    text=text,
+                    language=self.language,
+                    entities=entity_list,
+                    score_threshold=self.score_threshold,
+                )
+                for text in pending_texts
+            ]
+
+        detected = dict(zip(pending, batch_results, strict=True))
+        return [
+            self._anonymize_detected(text, detected.get(i, []), session_id)
+            for i, (text, session_id) in enumerate(zip(texts, session_ids, strict=True))
+        ]
+
+    def _session_state(
+        self, session_id: Optional[str]
+    ) -> tuple[PIIMapping, PlaceholderCounter]:
+        """Get the mapping and counter for a session, creating them if needed.
+
+        Calls without a session_id, or with session caching disabled, get a
+        fresh mapping and counter. The least recently used session is
+        evicted once more than max_sessions are held.
+
+        Args:
+            session_id: Optional session identifier.
+
+        Returns:
+            Tuple of (mapping, counter) for the session.
+        """
+        if session_id is None or self.max_sessions <= 0:
+            return PIIMapping(session_id=session_id), PlaceholderCounter()
+
+        with self._sessions_lock:
+            state = self._sessions.get(session_id)
+            if state is None:
+                state = (PIIMapping(session_id=session_id), PlaceholderCounter())
+                self._sessions[session_id] = state
+                if len(self._sessions) > self.max_sessions:
+                    self._sessions.popitem(last=False)
+            else:
+                self._sessions.move_to_end(session_id)
+            return state
+
+    def clear_session(self, session_id: Optional[str] = None) -> None:
+        """Drop cached mapping state for a session, or for all sessions.
+
+        Args:
+            session_id: Session to forget. If None, all sessions are dropped.
+        """
+        with self._sessions_lock:
+            if session_id is None:
+                self._sessions.clear()
+            else:
+                self._sessions.pop(session_id, None)
+
+    def _cannot_contain_pii(self, text: str, entities: Sequence[str]) -> bool:
+        """Check whether a regex prescan rules out every requested entity type.
+
+        Args:
+            text: The text to analyze.
+            entities: Entity types requested for detection.
+
+        Returns:
+            True if the analyzer can be skipped for this text.
+        """
+        return (
+            self.prescan_regex
+            and _PRESCAN_ENTITIES.issuperset(entities)
+            and _MAYBE_PII_RE.search(text) is None
+        )
+
+    def _anonymize_detected(
+        self,
+        text: str,
+        analyzer_results: list[RecognizerResult],
+        session_id: Optional[str],
+    ) -> AnonymizationResult:
+        """Replace already-detected PII entities in a text.
+
+        Args:
+            text: The analyzed text.
+            analyzer_results: Entities detected in the text.
+            session_id: Optional session identifier for mapping isolation.
+
+        Returns:
+            AnonymizationResult containing anonymized text and mapping.
+        """
         if not analyzer_results:
             return AnonymizationResult(
                 text=text,
-                mapping=PIIMapping(session_id=session_id),
+                mapping=self._session_state(session_id)[0],
             )
 
         # Step 2: Filter overlapping entities (keep highest score)
         filtered_results = self._remove_overlapping_entities(analyzer_results)
 
-        # Step 3: Create mapping and counter for this operation
-        mapping = PIIMapping(session_id=session_id)
-        counter = PlaceholderCounter()
+        # Step 3: Get the mapping and counter for this session
+        mapping, counter = self._session_state(session_id)
 
         # Step 4: Sort results by position (reverse order for replacement)
         sorted_results = sorted(filtered_results, key=lambda x: x.start, reverse=True)
@@ -355,11 +645,12 @@ class Anonymizer:
         allowlist_exemptions: list[dict] = []
         intent_exemptions: list[dict] = []
 
-        # Step 6: Replace PII using configured strategies (from end to start to preserve positions)
-        anonymized_text = text
+        # Step 6: Pick replacements using configured strategies. Entities are
+        # visited from end to start so placeholder numbering is unchanged; the
+        # output is assembled once afterwards instead of re-slicing per entity.
+        replacements: list[tuple[int, int, str]] = []
         for result in sorted_results:
             original_value = text[result.start : result.end]
-            placeholder_type = self.ENTITY_TYPE_MAP.get(result.entity_type, result.entity_type)
 
             # Check 1: Intent detection - preserve entities in question context
             if self.enable_intent_detection:
@@ -377,8 +668,8 @@ class Anonymizer:
                     continue
 
             # Check 2: Allowlist - if entity is allowlisted, skip anonymization
-            if self.enable_allowlist and is_allowlisted(
-                result.entity_type, original_value, default=False
+            if self.enable_allowlist and self._is_allowlisted_cached(
+                allowlist_generation(), result.entity_type, original_value
             ):
                 allowlist_exemptions.append({
                     "entity_type": result.entity_type,
@@ -388,75 +679,30 @@ class Anonymizer:
                 })
                 continue
 
-            # Get the strategy for this entity type
-            strategy_type = self.strategy_config.get_strategy(result.entity_type)
-            strategy = get_strategy(strategy_type)
-
-            # Check if this exact value already has a placeholder/hash/synthetic
-            existing = mapping.get_placeholder(placeholder_type, original_value)
-            if existing:
-                replacement = existing
-            else:
-                # Check for fuzzy match - normalized value might already exist
-                normalized_value = self._normalize_pii_value(original_value, placeholder_type)
-                fuzzy_placeholder = mapping.get_placeholder(placeholder_type + "_normalized", normalized_value)
-                if fuzzy_placeholder:
-                    # Use the same replacement for fuzzy match
-                    replacement = mapping.get_original(fuzzy_placeholder)
-                else:
-                    # For synthetic strategy, check if we already have a synthetic value
-                    if strategy_type == StrategyType.SYNTHETIC:
-                        existing_synthetic = mapping.get_synthetic(original_value)
-                        if existing_synthetic:
-                            replacement = existing_synthetic
-                        else:
-                            # Check fuzzy synthetic match
-                            normalized_synthetic = mapping.get_synthetic(normalized_value)
-                            if normalized_synthetic:
-                                replacement = normalized_synthetic
-                            else:
-                                # Generate new synthetic value
-                                index = counter.next(placeholder_type)
-                                strategy_result = strategy.anonymize(
-                                    value=original_value,
-                                    entity_type=placeholder_type,
-                                    index=index,
-                                    context={},
-                                )
-                                replacement = strategy_result.text
-
-                                # Store as synthetic mapping
-                                mapping.add_synthetic(placeholder_type, original_value, replacement)
-                                # Also store normalized mapping for fuzzy matching
-                                if normalized_value != original_value:
-                                    mapping.add_synthetic(placeholder_type + "_normalized", normalized_value, replacement)
-                    else:
-                        # Apply the strategy to generate replacement
-                        index = counter.next(placeholder_type)
-                        strategy_result = strategy.anonymize(
-                            value=original_value,
-                            entity_type=placeholder_type,
-                            index=index,
-                            context={"salt": result.entity_type},
-                        )
-                        replacement = strategy_result.text
-
-                        # Only add to mapping if the strategy supports deanonymization
-                        if strategy_result.can_deanonymize:
-                            mapping.add(placeholder_type, original_value, replacement)
-                            # Also store normalized mapping for fuzzy matching
-                            if normalized_value != original_value:
-                                mapping.add(placeholder_type + "_normalized", normalized_value, replacement)
-
-            # Replace in text
-            anonymized_text = (
-                anonymized_text[: result.start] + replacement + anonymized_text[result.end :]
+            handler = self._entity_handlers.get(result.entity_type)
+            if handler is None:
+                handler = self._entity_handlers.setdefault(
+                    result.entity_type, self._build_entity_handler(result.entity_type)
+                )
+            replacements.append(
+                (result.start, result.end, handler(original_value, mapping, counter))
             )
 
+        # Step 7: Build the output in a single pass over the original text
+        parts: list[str] = []
+        cursor = 0
+        for start, end, replacement in reversed(replacements):
+            parts.append(text[cursor:start])
+            parts.append(replacement)
+            cursor = end
+        parts.append(text[cursor:])
+        anonymized_text = "".join(parts)
+
         result = AnonymizationResult(
             text=anonymized_text,
             mapping=mapping,
-            entities=list(analyzer_results),
+            # Analyzers return a fresh list per call and it is not mutated here
+            entities=analyzer_results,
             allowlist_exemptions=allowlist_exemptions,
             intent_exemptions=intent_exemptions,
         )
@@ -487,46 +733,39 @@ class Anonymizer:
             session_id: Optional session identifier.
         """
         try:
-            from pii_airlock.audit.logger import get_audit_logger
-            import logging
-
             logger = get_audit_logger()
             if not logger.enabled:
                 return
 
-            # Log each exemption
-            for exemption in exemptions:
-                # Use sync logging to avoid async issues in sync context
-                logging.info(
-                    "Allowlist exemption: %s (%s)",
-                    exemption.get("original_value"),
-                    exemption.get("entity_type"),
-                )
+            # Use sync logging to avoid async issues in sync context
+            logging.info(
+                "Allowlist exemptions (%d): %s",
+                len(exemptions),
+                [(e["original_value"], e["entity_type"]) for e in exemptions],
+            )
 
-                # Try to schedule async logging if event loop is running
-                try:
-                    import asyncio
-
-                    try:
-                        loop = asyncio.get_running_loop()
-                        # Schedule async log as a task (fire and forget)
-                        asyncio.create_task(
-                            logger.log(
-                                event_type="allowlist_exempt",
-                                entity_type=exemption.get("entity_type"),
-                                metadata={
-                                    "original_value": exemption.get("original_value"),
-                                    "session_id": session_id,
-                                    "exemption_reason": "allowlist_match",
-                                },
-                            )
-                        )
-                    except RuntimeError:
-                        # No event loop running, skip async logging
-                        pass
-                except Exception:
-                    # Skip async logging if it fails
-                    pass
+            # Schedule one async batch log if an event loop is running
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # No event loop running, skip async logging
+                return
+            asyncio.create_task(
+                logger.log_batch(
+                    AuditEventType.ALLOWLIST_EXEMPT,
+                    [
+                        {
+                            "entity_type": e["entity_type"],
+                            "metadata": {
+                                "original_value": e["original_value"],
+                                "session_id": session_id,
+                                "exemption_reason": "allowlist_match",
+                            },
+                        }
+                        for e in exemptions
+                    ],
+                )
+            )
         except Exception:
             # Silently fail if audit logging is not available
             pass
@@ -540,20 +779,13 @@ class Anonymizer:
             exemptions: List of exempted entities with their details.
             session_id: Optional session identifier.
         """
-        try:
-            import logging
-
-            # Log each exemption
-            for exemption in exemptions:
-                logging.info(
-                    "Intent exemption: %s (%s) - reason: %s",
-                    exemption.get("original_value"),
-                    exemption.get("entity_type"),
-                    exemption.get("reason", "question_context"),
-                )
-        except Exception:
-            # Silently fail if logging fails
-            pass
+        # Silently fail if logging fails
+        with contextlib.suppress(Exception):
+            logging.info(
+                "Intent exemptions (%d): %s",
+                len(exemptions),
+                [(e["original_value"], e["entity_type"], e["reason"]) for e in exemptions],
+            )
 
     @property
     def intent_detector(self):
@@ -591,6 +823,12 @@ class Anonymizer:
             return (False, "entity_type_not_favoring")
 
         try:
+            # Most entities sit in plain statements; skip the per-pattern
+            # classification when no question pattern can match at all.
+            if not self.intent_detector.has_question_signal(
+                text, entity_start, entity_end
+            ):
+                return (False, "no_question_marker")
             intent_result = self.intent_detector.is_question_context(
                 text, entity_start, entity_end
             )
@@ -603,10 +841,12 @@ class Anonymizer:
         self,
         results: list[RecognizerResult],
     ) -> list[RecognizerResult]:
-        """Remove overlapping entities, keeping the highest-scoring one.
+        """Remove overlapping entities, keeping the earliest-starting one.
 
-        When two entities overlap, we keep the one with the higher confidence
-        score. If scores are equal, we keep the longer (more specific) entity.
+        Entities are accepted in start order, so an entity that overlaps an
+        already accepted one is dropped. Among entities starting at the same
+        position we keep the one with the higher confidence score, and if
+        scores are equal, the longer (more specific) entity.
 
         Args:
             results: List of detected entities.
@@ -623,18 +863,21 @@ class Anonymizer:
             key=lambda x: (x.start, -x.score, -(x.end - x.start)),
         )
 
+        # Single sweep in start order: every accepted entity starts at or
+        # before the candidate, so a non-empty candidate overlaps one of them
+        # exactly when it starts before the furthest accepted end.
         filtered: list[RecognizerResult] = []
+        max_end = -1
         for result in sorted_results:
-            # Check if this result overlaps with any already-accepted result
-            overlaps = False
-            for accepted in filtered:
-                # Check for overlap: ranges overlap if one starts before the other ends
-                if not (result.end <= accepted.start or result.start >= accepted.end):
-                    overlaps = True
-                    break
+            if result.end > result.start:
+                overlaps = result.start < max_end
+            else:
+                # Empty spans only overlap an entity strictly containing them
+                overlaps = any(a.start < result.start < a.end for a in filtered)
 
             if not overlaps:
                 filtered.append(result)
+                max_end = max(max_end, result.end)
 
         return filtered
 
@@ -652,6 +895,96 @@ class Anonymizer:
         except Exception:
             return None
 
+    def _build_entity_handler(
+        self, entity_type: str
+    ) -> Callable[[str, PIIMapping, PlaceholderCounter], str]:
+        """Build the replacement function for one detected entity type.
+
+        The placeholder type, strategy and normalizer are fixed per entity
+        type for the lifetime of the Anonymizer, so they are resolved here
+        once and captured instead of being looked up per entity.
+
+        Args:
+            entity_type: The Presidio entity type.
+
+        Returns:
+            A function mapping (original_value, mapping, counter) to the
+            replacement text, recording new values in the mapping.
+        """
+        placeholder_type = self.ENTITY_TYPE_MAP.get(entity_type, entity_type)
+        normalized_type = _normalized_type(placeholder_type)
+        normalize = _get_normalizer(placeholder_type)
+
+        strategy_type = self.strategy_config.get_strategy(entity_type)
+        strategy = self._strategies.get(strategy_type)
+        if strategy is None:
+            strategy = self._strategies.setdefault(strategy_type, get_strategy(strategy_type))
+
+        if strategy_type == StrategyType.SYNTHETIC:
+
+            def replace_synthetic(
+                original_value: str, mapping: PIIMapping, counter: PlaceholderCounter
+            ) -> str:
+                # Check if this exact value, or its normalized form (fuzzy
+                # match), already has a placeholder or synthetic value
+                normalized_value = normalize(original_value)
+                existing = mapping.get_placeholder_any(
+                    placeholder_type, original_value, normalized_type, normalized_value
+                )
+                if existing:
+                    return existing
+                existing = mapping.get_synthetic(original_value) or mapping.get_synthetic(
+                    normalized_value
+                )
+                if existing:
+                    return existing
+
+                # Generate new synthetic value
+                replacement = strategy.anonymize(
+                    value=original_value,
+                    entity_type=placeholder_type,
+                    index=counter.next(placeholder_type),
+                    context={},
+                ).text
+
+                # Store as synthetic mapping
+                mapping.add_synthetic(placeholder_type, original_value, replacement)
+                # Also store normalized mapping for fuzzy matching
+                if normalized_value != original_value:
+                    mapping.add_synthetic(normalized_type, normalized_value, replacement)
+                return replacement
+
+            return replace_synthetic
+
+        def replace(
+            original_value: str, mapping: PIIMapping, counter: PlaceholderCounter
+        ) -> str:
+            # Reuse the replacement of an exact or fuzzy (normalized) match
+            normalized_value = normalize(original_value)
+            existing = mapping.get_placeholder_any(
+                placeholder_type, original_value, normalized_type, normalized_value
+            )
+            if existing:
+                return existing
+
+            # Apply the strategy to generate replacement
+            strategy_result = strategy.anonymize(
+                value=original_value,
+                entity_type=placeholder_type,
+                index=counter.next(placeholder_type),
+                context={"salt": entity_type},
+            )
+
+            # Only add to mapping if the strategy supports deanonymization
+            if strategy_result.can_deanonymize:
+                mapping.add(placeholder_type, original_value, strategy_result.text)
+                # Also store normalized mapping for fuzzy matching
+                if normalized_value != original_value:
+                    mapping.add(normalized_type, normalized_value, strategy_result.text)
+            return strategy_result.text
+
+        return replace
+
     def _normalize_pii_value(self, value: str, entity_type: str) -> str:
         """Normalize a PII value for fuzzy matching.
 
@@ -668,27 +1001,4 @@ class Anonymizer:
         Returns:
             Normalized value for comparison.
         """
-        import re
-
-        entity_upper = entity_type.upper()
-
-        # Remove all whitespace
-        normalized = re.sub(r'\s+', '', value)
-
-        # For phone numbers, remove common separators
-        if "PHONE" in entity_upper:
-            normalized = re.sub(r'[-—–\(\)]', '', normalized)
-
-        # For ID cards, remove spaces and dashes
-        if "ID_CARD" in entity_upper or "IDCARD" in entity_upper:
-            normalized = re.sub(r'[-—–\s]', '', normalized)
-
-        # For credit cards, remove spaces and dashes
-        if "CREDIT_CARD" in entity_upper:
-            normalized = re.sub(r'[-—–\s]', '', normalized)
-
-        # For email, convert to lowercase for comparison
-        if "EMAIL" in entity_upper:
-            normalized = normalized.lower()
-
-        return normalized
+        return _get_normalizer(entity_type)(value)
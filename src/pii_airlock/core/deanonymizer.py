@@ -18,7 +18,7 @@ Example:
 import os
 import re
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterator, Optional
 
 from pii_airlock.core.mapping import PIIMapping
 
@@ -34,7 +34,7 @@ except ImportError:
     FUZZY_AVAILABLE = False
 
 
-@dataclass
+@dataclass(slots=True)
 class DeanonymizationResult:
     """Result of deanonymization operation.
 
@@ -90,6 +90,15 @@ class Deanonymizer:
         re.compile(r"<([A-Za-z_]+)-(\d+)>", re.IGNORECASE),
     ]
 
+    # All fuzzy variants in one alternation, so the text is scanned once.
+    # Each variant contributes a (type, index) group pair, in order.
+    FUZZY_PATTERN = re.compile(
+        "|".join(f"(?:{p.pattern})" for p in FUZZY_PATTERNS), re.IGNORECASE
+    )
+
+    # Every fuzzy variant opens with one of these characters
+    FUZZY_OPENERS = "<[{("
+
     def __init__(
         self,
         enable_fuzzy_matching: bool = True,
@@ -179,20 +188,20 @@ class Deanonymizer:
 
         # Second pass: exact placeholder matching
         def replace_exact(match: re.Match) -> str:
-            nonlocal replaced_count
             entity_type = match.group(1)
             index = match.group(2)
             placeholder = f"<{entity_type}_{index}>"
 
             original = mapping.get_original(placeholder)
             if original:
-                replaced_count += 1
                 return original
             else:
                 unresolved.append(placeholder)
                 return placeholder
 
-        result_text = self.PLACEHOLDER_PATTERN.sub(replace_exact, result_text)
+        # Every match is either replaced or recorded as unresolved
+        result_text, matched = self.PLACEHOLDER_PATTERN.subn(replace_exact, result_text)
+        replaced_count += matched - len(unresolved)
 
         # Third pass: fuzzy matching (if enabled)
         if self.enable_fuzzy_matching:
@@ -266,30 +275,42 @@ class Deanonymizer:
         Returns:
             Tuple of (modified text, count of fuzzy replacements).
         """
+        # Text untouched by the LLM has no placeholder left to repair
+        if not any(opener in text for opener in self.FUZZY_OPENERS):
+            return text, 0
+
         resolved_count = 0
 
-        for pattern in self.FUZZY_PATTERNS:
+        def replace_fuzzy(match: re.Match) -> str:
+            nonlocal resolved_count
+            # The index group of the matched variant is the last group set
+            index = match.group(match.lastindex)
+            entity_type = match.group(match.lastindex - 1).upper().replace("-", "_")
 
-            def make_replacer(p: re.Pattern) -> callable:
-                def replace_fuzzy(match: re.Match) -> str:
-                    nonlocal resolved_count
-                    entity_type = match.group(1).upper().replace("-", "_")
-                    index = match.group(2)
+            # Normalize to standard format
+            normalized = f"<{entity_type}_{index}>"
+            original = mapping.get_original(normalized)
 
-                    # Normalize to standard format
-                    normalized = f"<{entity_type}_{index}>"
-                    original = mapping.get_original(normalized)
+            if original:
+                resolved_count += 1
+                return original
+            return match.group(0)
 
-                    if original:
-                        resolved_count += 1
-                        return original
-                    return match.group(0)
+        text = self.FUZZY_PATTERN.sub(replace_fuzzy, text)
 
-                return replace_fuzzy
+        return text, resolved_count
 
-            text = pattern.sub(make_replacer(pattern), text)
+    def iter_placeholders(self, text: str) -> Iterator[tuple[str, str]]:
+        """Iterate over placeholders in text without building a list.
 
-        return text, resolved_count
+        Args:
+            text: Text to scan for placeholders.
+
+        Yields:
+            (entity_type, index) tuples in order of appearance.
+        """
+        for match in self.PLACEHOLDER_PATTERN.finditer(text):
+            yield match.group(1), match.group(2)
 
     def extract_placeholders(self, text: str) -> list[tuple[str, str]]:
         """Extract all placeholders from text.
@@ -300,7 +321,7 @@ class Deanonymizer:
         Returns:
             List of (entity_type, index) tuples for each placeholder found.
         """
-        return self.PLACEHOLDER_PATTERN.findall(text)
+        return list(self.iter_placeholders(text))
 
     def has_placeholders(self, text: str) -> bool:
         """Check if text contains any placeholders.
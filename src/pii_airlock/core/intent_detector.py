@@ -35,6 +35,27 @@ def _get_question_favoring_types() -> Set[str]:
     return DEFAULT_QUESTION_FAVORING_TYPES.copy()
 
 
+# Backreferences are numbered per pattern, so they cannot be merged safely.
+_BACKREFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def _combine_patterns(patterns: List[str]) -> Optional["re.Pattern[str]"]:
+    """Merge patterns into one alternation that matches if any of them does.
+
+    Returns None when the patterns cannot be merged without changing their
+    meaning (backreferences, or inline global flags that only compile at the
+    start of a pattern).
+    """
+    if not patterns:
+        return None
+    if any(_BACKREFERENCE_RE.search(p) for p in patterns):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+    except re.error:
+        return None
+
+
 # Default question patterns (Chinese and English)
 DEFAULT_QUESTION_PATTERNS = [
     # Chinese question patterns - Must match actual characters at the start
@@ -63,7 +84,7 @@ STATEMENT_CONTEXT_PATTERNS = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class IntentResult:
     """Result of intent detection.
 
@@ -138,6 +159,10 @@ class IntentDetector:
             for pattern in self._statement_context_patterns
         ]
 
+        # Single-pass prefilters over everything that can yield a question
+        self._question_any = _combine_patterns(self.question_patterns)
+        self._question_context_any = _combine_patterns(self._question_context_patterns)
+
     @property
     def question_favoring_types(self) -> Set[str]:
         """Get the set of entity types that favor question context.
@@ -151,6 +176,40 @@ class IntentDetector:
         """
         return self._question_favoring
 
+    def has_question_signal(
+        self,
+        text: str,
+        entity_start: int,
+        entity_end: int,
+    ) -> bool:
+        """Cheaply check whether an entity could be in question context.
+
+        Runs every question and question-context pattern as one combined
+        regex. A False result means is_question_context() would classify
+        the entity as a statement, so callers can skip the full detector;
+        a True result still needs is_question_context() for the reason.
+
+        Args:
+            text: The full text containing the entity.
+            entity_start: Start position of the entity.
+            entity_end: End position of the entity.
+
+        Returns:
+            False if the entity is certainly not in question context.
+        """
+        if self._question_any is None or self._question_context_any is None:
+            return True
+        if not text or entity_start < 0 or entity_end > len(text):
+            return False
+
+        stripped = text.strip()
+        if stripped.endswith(("?", "？")) or self._question_any.search(stripped):
+            return True
+
+        start = max(0, entity_start - self.context_window)
+        end = min(len(text), entity_end + self.context_window)
+        return self._question_context_any.search(text[start:end]) is not None
+
     def is_question_text(self, text: str) -> IntentResult:
         """Check if the entire text is a question.
 
@@ -130,6 +130,32 @@ class PIIMapping:
         with self._lock:
             return self._forward.get(entity_type, {}).get(original_value)
 
+    def get_placeholder_any(
+        self,
+        entity_type: str,
+        original_value: str,
+        normalized_type: str,
+        normalized_value: str,
+    ) -> Optional[str]:
+        """Get placeholder for a value or, failing that, its normalized form.
+
+        Both lookups happen under a single lock acquisition.
+
+        Args:
+            entity_type: The PII type.
+            original_value: The original text.
+            normalized_type: The type under which normalized values are stored.
+            normalized_value: The normalized form of the original text.
+
+        Returns:
+            The placeholder string, or None if neither form is mapped.
+        """
+        with self._lock:
+            placeholder = self._forward.get(entity_type, {}).get(original_value)
+            if placeholder is None:
+                placeholder = self._forward.get(normalized_type, {}).get(normalized_value)
+            return placeholder
+
     def get_original(self, placeholder: str) -> Optional[str]:
         """Get original value for a placeholder.
 
@@ -31,7 +31,7 @@ class StrategyType(str, Enum):
     SYNTHETIC = "synthetic"  # 使用语义相似的假数据替换
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyResult:
     """Result of applying an anonymization strategy.
 
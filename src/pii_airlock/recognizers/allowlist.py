@@ -13,6 +13,24 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Set
 
+# Bumped on every allowlist change so callers can key caches on it
+_generation = 0
+
+
+def _bump_generation() -> None:
+    global _generation
+    _generation += 1
+
+
+def allowlist_generation() -> int:
+    """Get a counter that changes whenever any allowlist is modified.
+
+    Covers add/remove, attribute updates (enabled, case_sensitive),
+    registration, removal and reloads. Use it as part of a cache key to
+    memoize is_allowlisted() results safely.
+    """
+    return _generation
+
 
 @dataclass
 class AllowlistConfig:
@@ -32,12 +50,19 @@ class AllowlistConfig:
     enabled: bool = True
     case_sensitive: bool = False
 
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        _bump_generation()
+
     def add(self, entry: str) -> None:
         """Add an entry to the allowlist."""
         if self.case_sensitive:
             self.entries.add(entry)
         else:
             self.entries.add(entry.lower())
+        # Bump only after the change, so a reader that sees the new
+        # generation can never cache the old contents under it
+        _bump_generation()
 
     def remove(self, entry: str) -> None:
         """Remove an entry from the allowlist."""
@@ -45,6 +70,7 @@ class AllowlistConfig:
             self.entries.discard(entry)
         else:
             self.entries.discard(entry.lower())
+        _bump_generation()
 
     def contains(self, entry: str) -> bool:
         """Check if an entry is in the allowlist."""
@@ -98,10 +124,22 @@ class AllowlistRegistry:
         """
         self._allowlists: dict[str, AllowlistConfig] = {}
         self._allowlists_dir = Path(allowlists_dir) if allowlists_dir else None
+        _bump_generation()
 
     def register(self, allowlist: AllowlistConfig) -> None:
         """Register an allowlist."""
         self._allowlists[allowlist.name] = allowlist
+        _bump_generation()
+
+    def unregister(self, name: str) -> Optional[AllowlistConfig]:
+        """Remove an allowlist by name.
+
+        Returns:
+            The removed allowlist, or None if it was not registered.
+        """
+        allowlist = self._allowlists.pop(name, None)
+        _bump_generation()
+        return allowlist
 
     def get(self, name: str) -> Optional[AllowlistConfig]:
         """Get an allowlist by name."""
@@ -186,10 +224,12 @@ class AllowlistRegistry:
         """
         self._allowlists.clear()
 
+        count = 0
         if self._allowlists_dir:
-            return self.load_from_directory(self._allowlists_dir)
+            count = self.load_from_directory(self._allowlists_dir)
 
-        return 0
+        _bump_generation()
+        return count
 
     def list_allowlists(self) -> list[dict]:
         """List all registered allowlists with metadata."""
@@ -5,6 +5,7 @@ Sets up Presidio with Chinese language support and custom recognizers.
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import Optional, Union
 
@@ -18,6 +19,20 @@ from pii_airlock.recognizers.zh_person import ChinesePersonRecognizer
 # CORE-004 FIX: Add logger for proper error reporting
 logger = logging.getLogger(__name__)
 
+# spaCy pipes PII detection relies on; everything else only adds latency.
+# Besides NER, Presidio's LemmaContextAwareEnhancer boosts scores using
+# token.lemma_, which the lemmatizer fills from the tagger/morphologizer
+# POS tags mapped by attribute_ruler, so that chain stays enabled.
+_REQUIRED_PIPES = frozenset({
+    "ner",
+    "tok2vec",
+    "transformer",
+    "tagger",
+    "morphologizer",
+    "attribute_ruler",
+    "lemmatizer",
+})
+
 
 def create_analyzer_with_chinese_support(
     language: str = "zh",
@@ -54,6 +69,7 @@ def create_analyzer_with_chinese_support(
     }
 
     nlp_engine = NlpEngineProvider(nlp_configuration=nlp_configuration).create_engine()
+    _disable_unused_pipes(nlp_engine)
 
     # Create registry
     registry = RecognizerRegistry()
@@ -94,6 +110,36 @@ def create_analyzer_with_chinese_support(
     return AnalyzerEngine(nlp_engine=nlp_engine, registry=registry)
 
 
+def _disable_unused_pipes(nlp_engine) -> None:
+    """Disable spaCy pipes that PII detection does not need.
+
+    Entities and lemmas (for context enhancement) are consumed, so pipes
+    outside _REQUIRED_PIPES, such as the parser, are switched off.
+    PII_AIRLOCK_DISABLE_PIPES overrides the selection with a comma-separated
+    list of pipe names, or "none" to keep all.
+
+    Args:
+        nlp_engine: The NLP engine created for the analyzer.
+    """
+    models = getattr(nlp_engine, "nlp", None)
+    if not isinstance(models, dict):
+        return
+
+    env_value = os.getenv("PII_AIRLOCK_DISABLE_PIPES", "").strip()
+    if env_value.lower() == "none":
+        return
+    requested = {p.strip() for p in env_value.split(",") if p.strip()}
+
+    for lang_code, nlp in models.items():
+        if requested:
+            disable = [p for p in nlp.pipe_names if p in requested]
+        else:
+            disable = [p for p in nlp.pipe_names if p not in _REQUIRED_PIPES]
+        if disable:
+            nlp.select_pipes(disable=disable)
+            logger.debug("Disabled spaCy pipes for %s: %s", lang_code, disable)
+
+
 def _load_compliance_preset_patterns(registry: RecognizerRegistry, language: str) -> None:
     """Load custom patterns from the active compliance preset.
 
@@ -4,9 +4,11 @@ Chinese Mobile Phone Number Recognizer
 Recognizes Chinese mainland mobile phone numbers with carrier-aware patterns.
 """
 
+import re
 from typing import Optional
 
-from presidio_analyzer import Pattern, PatternRecognizer
+from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.nlp_engine import NlpArtifacts
 
 
 class ChinesePhoneRecognizer(PatternRecognizer):
@@ -44,6 +46,9 @@ class ChinesePhoneRecognizer(PatternRecognizer):
         ),
     ]
 
+    # Prefix shared by every pattern above; one scan for it rules them all out
+    CANDIDATE_RE = re.compile(r"1[3-9]\d")
+
     CONTEXT = [
         "电话",
         "手机",
@@ -81,3 +86,28 @@ class ChinesePhoneRecognizer(PatternRecognizer):
             context=context_words,
             supported_language=supported_language,
         )
+
+    def analyze(
+        self,
+        text: str,
+        entities: list[str],
+        nlp_artifacts: Optional[NlpArtifacts] = None,
+        regex_flags: Optional[int] = None,
+    ) -> list[RecognizerResult]:
+        """Analyze text for phone numbers.
+
+        Texts without a mobile prefix are rejected with a single scan
+        instead of running each pattern separately.
+
+        Args:
+            text: Text to analyze.
+            entities: Entity types to look for.
+            nlp_artifacts: Pre-processed NLP data (unused).
+            regex_flags: Regex flags for pattern matching.
+
+        Returns:
+            List of recognized phone numbers.
+        """
+        if not self.CANDIDATE_RE.search(text):
+            return []
+        return super().analyze(text, entities, nlp_artifacts, regex_flags)
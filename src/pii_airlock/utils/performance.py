@@ -2,6 +2,7 @@
 
 import functools
 import logging
+import threading
 import time
 from collections import deque
 from typing import Any, Callable, TypeVar
@@ -369,6 +370,3 @@ def retry_on_failure(
 
     return decorator
 
-
-# Import threading at module level for type hints
-import threading
@@ -179,6 +179,26 @@ class TestAllowlistRegistry:
 
         assert not registry.is_allowed("PERSON", "张三")
 
+    def test_generation_tracks_changes(self):
+        """Test that every allowlist change bumps the generation counter."""
+        from pii_airlock.recognizers.allowlist import allowlist_generation
+
+        registry = AllowlistRegistry()
+        config = AllowlistConfig(name="test", entity_type="PERSON")
+
+        for change in (
+            lambda: config.add("张三"),
+            lambda: registry.register(config),
+            lambda: setattr(config, "enabled", False),
+            lambda: config.remove("张三"),
+            lambda: registry.unregister("test"),
+        ):
+            before = allowlist_generation()
+            change()
+            assert allowlist_generation() != before
+
+        assert registry.get("test") is None
+
     def test_wildcard_entity_type(self):
         """Test wildcard entity type matching."""
         registry = AllowlistRegistry()
@@ -5,6 +5,7 @@ import json
 import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 import pytest_asyncio
@@ -18,7 +19,12 @@ from pii_airlock.audit.models import (
     create_event,
     hash_api_key,
 )
-from pii_airlock.audit.store import FileAuditStore, DatabaseAuditStore, set_audit_store
+from pii_airlock.audit.store import (
+    FileAuditStore,
+    DatabaseAuditStore,
+    RedisAuditStore,
+    set_audit_store,
+)
 from pii_airlock.audit.logger import (
     AuditLogger,
     AuditContext,
@@ -346,6 +352,63 @@ class TestFileAuditStore:
         assert deleted == 0
 
 
+class TestRedisAuditStoreEncoding:
+    """Tests for Redis audit event serialization."""
+
+    @pytest.mark.parametrize("serializer", ["json", "msgpack"])
+    def test_encode_decode_roundtrip(self, serializer):
+        """Test that an encoded event decodes back unchanged."""
+        if serializer == "msgpack":
+            pytest.importorskip("msgpack")
+        store = RedisAuditStore(redis_client=None, serializer=serializer)
+        event = create_event(
+            AuditEventType.PII_DETECTED,
+            entity_type="PERSON",
+            entity_count=2,
+            tenant_id="tenant1",
+        )
+        data = store._encode_event(event)
+        if isinstance(data, str):
+            data = data.encode()
+
+        assert RedisAuditStore._decode_event(data) == event
+
+    def test_decode_legacy_json(self):
+        """Test that JSON entries written before MessagePack still decode."""
+        event = create_event(AuditEventType.API_REQUEST, tenant_id="tenant1")
+
+        assert RedisAuditStore._decode_event(event.to_json().encode()) == event
+        assert RedisAuditStore._decode_event(event.to_json()) == event
+
+    def test_unsupported_serializer(self):
+        """Test that an unknown serializer is rejected."""
+        with pytest.raises(ValueError, match="serializer"):
+            RedisAuditStore(redis_client=None, serializer="pickle")
+
+    @pytest.mark.asyncio
+    async def test_query_logs_undecodable_records(self, caplog):
+        """Test that records that cannot be decoded are reported, not hidden."""
+        event = create_event(AuditEventType.API_REQUEST, tenant_id="tenant1")
+        client = MagicMock()
+        client.smembers.return_value = {b"a", b"b"}
+        client.pipeline.return_value.execute.return_value = [
+            event.to_json().encode(),
+            b"{not json",
+        ]
+        store = RedisAuditStore(client)
+
+        with caplog.at_level("WARNING", logger="pii_airlock.audit.store"):
+            events = await store.query(
+                AuditFilter(
+                    start_date=event.timestamp - timedelta(days=1),
+                    end_date=event.timestamp + timedelta(days=1),
+                )
+            )
+
+        assert events == [event]
+        assert "Skipped 1 undecodable audit records" in caplog.text
+
+
 class TestAuditLogger:
     """Tests for audit logger."""
 
@@ -469,6 +532,27 @@ class TestAuditLogger:
         assert found_request_id, "No event found with request_id=req-123"
         assert found_source_ip, "No event found with source_ip=10.0.0.1"
 
+    @pytest.mark.asyncio
+    async def test_log_batch(self, logger):
+        """Test logging several events of one type at once."""
+        set_audit_context(request_id="req-batch")
+        await logger.log_batch(
+            AuditEventType.PII_DETECTED,
+            [{"entity_type": "PERSON"}, {"entity_type": "PHONE", "entity_count": 2}],
+        )
+        await logger.flush()
+        clear_audit_context()
+
+        now = datetime.now()
+        filter = AuditFilter(
+            start_date=now - timedelta(seconds=1),
+            end_date=now + timedelta(seconds=1),
+        )
+
+        events = [e for e in await logger._store.query(filter) if e.request_id == "req-batch"]
+        assert sorted(e.entity_type for e in events) == ["PERSON", "PHONE"]
+        assert all(e.event_type == AuditEventType.PII_DETECTED for e in events)
+
     @pytest.mark.asyncio
     async def test_logger_disabled(self, tmp_path):
         """Test that disabled logger doesn't write events."""
@@ -68,6 +68,20 @@ class TestGetCacheKey:
         # Different tenants should produce different keys
         assert key1 != key2
 
+    def test_cache_key_structure(self):
+        """Test that the key follows message structure, not key order."""
+        def key(messages, **kwargs):
+            return get_cache_key("tenant", "gpt-4", messages, **kwargs)
+
+        assert key([{"role": "user", "content": "hi"}]) == key(
+            [{"content": "hi", "role": "user"}]
+        )
+        assert key([{"role": "user", "content": "ab"}]) != key(
+            [{"role": "user", "content": "a"}, {"role": "user", "content": "b"}]
+        )
+        assert key([], max_tokens=1) != key([], max_tokens=1.0)
+        assert key([], top_p=None) == key([])
+
 
 class TestCacheEntry:
     """Tests for CacheEntry dataclass."""
@@ -231,6 +245,128 @@ class TestLLMCache:
         assert cache.get("key3", "tenant") is not None
         assert cache.get("key4", "tenant") is not None
 
+    def test_cache_eviction_after_replace(self):
+        """Test that replacing an entry makes it the newest for eviction."""
+        cache = LLMCache(max_size=2)
+
+        cache.put("key1", {"d": 1}, "tenant", "gpt-4")
+        cache.put("key2", {"d": 2}, "tenant", "gpt-4")
+        cache.put("key1", {"d": 10}, "tenant", "gpt-4")
+
+        # key2 is now the oldest entry
+        cache.put("key3", {"d": 3}, "tenant", "gpt-4")
+
+        assert cache.get("key2", "tenant") is None
+        assert cache.get("key1", "tenant").response_data == {"d": 10}
+        assert cache.get("key3", "tenant") is not None
+
+    def test_cache_eviction_across_shards(self):
+        """Test that eviction keeps the newest entries across all shards."""
+        cache = LLMCache(max_size=20)
+
+        for i in range(50):
+            cache.put(f"key{i}", {"d": i}, "tenant", "gpt-4")
+
+        assert len(cache) == 20
+        assert all(cache.get(f"key{i}", "tenant") is None for i in range(30))
+        assert all(cache.get(f"key{i}", "tenant") is not None for i in range(30, 50))
+
+    def test_cache_cleanup_only_due_entries(self):
+        """Test that cleanup removes due entries and keeps the rest."""
+        cache = LLMCache(default_ttl=3600)
+
+        cache.put("short", {"d": 1}, "tenant", "gpt-4", ttl=0)
+        cache.put("long", {"d": 2}, "tenant", "gpt-4")
+        cache.put("default", {"d": 3}, "tenant", "gpt-4")
+        cache.put("replaced", {"d": 4}, "tenant", "gpt-4", ttl=0)
+        cache.put("replaced", {"d": 5}, "tenant", "gpt-4")
+        time.sleep(0.01)
+
+        assert cache.cleanup_expired() == 1
+        assert cache.get("short", "tenant") is None
+        assert cache.get("replaced", "tenant").response_data == {"d": 5}
+        assert len(cache) == 3
+
+    def test_cache_size_gauge(self):
+        """Test that the size gauge reports live per-tenant counts."""
+        from prometheus_client import REGISTRY
+
+        def gauge():
+            return REGISTRY.get_sample_value(
+                "pii_airlock_cache_size", {"tenant_id": "gauge-tenant"}
+            )
+
+        cache = LLMCache()
+        cache.put("key1", {"d": 1}, "gauge-tenant", "gpt-4")
+        cache.put("key2", {"d": 2}, "gauge-tenant", "gpt-4")
+        assert gauge() == 2
+
+        cache.delete("key1", "gauge-tenant")
+        assert gauge() == 1
+
+        # A replacement cache takes over the gauge, even before it sees the tenant
+        cache = LLMCache()
+        assert gauge() == 0
+        cache.put("key1", {"d": 1}, "gauge-tenant", "gpt-4")
+        assert gauge() == 1
+
+        cache.clear()
+        assert gauge() == 0
+
+    def test_cache_latency_sampled(self):
+        """Test that one in LATENCY_SAMPLE_EVERY hits is timed."""
+        from prometheus_client import REGISTRY
+
+        from pii_airlock.cache.llm_cache import LATENCY_SAMPLE_EVERY
+
+        def observed():
+            return REGISTRY.get_sample_value(
+                "pii_airlock_cache_lookup_duration_seconds_count",
+                {"tenant_id": "sampled-tenant"},
+            ) or 0
+
+        cache = LLMCache()
+        cache.put("key", {"d": 1}, "sampled-tenant", "gpt-4")
+        before = observed()
+
+        for _ in range(LATENCY_SAMPLE_EVERY * 3):
+            assert cache.get("key", "sampled-tenant") is not None
+
+        assert observed() - before == 3
+
+    def test_cache_metric_children_reused(self):
+        """Test that bound metric children are resolved once per label set."""
+        from pii_airlock.cache.llm_cache import cache_metrics
+
+        first = cache_metrics("bound-tenant", "gpt-4")
+        assert cache_metrics("bound-tenant", "gpt-4") is first
+        assert cache_metrics("bound-tenant", "gpt-4o")[0] is not first[0]
+
+    def test_cache_entry_names_interned(self):
+        """Test that entries share one copy of tenant and model names."""
+        cache = LLMCache()
+        tenant = "".join(["tenant-", "interned"])
+        model = "".join(["gpt-", "4o"])
+
+        first = cache.put("key1", {"d": 1}, tenant, model)
+        second = cache.put(
+            "key2", {"d": 2}, "".join(["tenant-", "interned"]), "".join(["gpt-", "4o"])
+        )
+
+        assert first.tenant_id is second.tenant_id
+        assert first.model is second.model
+
+    def test_cache_fifo_compaction(self):
+        """Test that replaced entries do not pile up eviction records."""
+        cache = LLMCache(max_size=100)
+
+        for i in range(500):
+            cache.put("key", {"d": i}, "tenant", "gpt-4")
+        cache.cleanup_expired()
+
+        assert len(cache._fifo) == 1
+        assert cache.get("key", "tenant").response_data == {"d": 499}
+
     def test_cache_hit_count_increments(self):
         """Test that hit count increments on each retrieval."""
         cache = LLMCache()
@@ -263,6 +399,34 @@ class TestLLMCache:
         # Tenant-b entry should remain
         assert cache.get("key3", "tenant-b") is not None
 
+    def test_cache_invalidate_tenant_with_colon(self):
+        """Test that invalidation does not match tenants sharing a prefix."""
+        cache = LLMCache()
+
+        cache.put("key1", {"d": 1}, "org", "gpt-4")
+        cache.put("key2", {"d": 2}, "org:team", "gpt-4")
+
+        assert cache.invalidate_tenant("org") == 1
+        assert cache.get("key2", "org:team") is not None
+        assert cache.get_stats("org:team")["entry_count"] == 1
+        assert cache.get_stats()["entry_count"] == 1
+
+    def test_cache_entry_size_estimate(self):
+        """Test that size_bytes tracks the serialized response size."""
+        import json
+
+        cache = LLMCache()
+        response = {
+            "choices": [{"message": {"role": "assistant", "content": "你好 world"}}],
+            "usage": {"total_tokens": 12},
+            "cached": False,
+        }
+
+        entry = cache.put("key", response, "tenant-1", "gpt-4")
+
+        actual = len(json.dumps(response, ensure_ascii=False).encode())
+        assert abs(entry.size_bytes - actual) <= actual * 0.2
+
     def test_cache_delete(self):
         """Test deleting a specific cache entry."""
         cache = LLMCache()
@@ -17,6 +17,7 @@ from pii_airlock.config.compliance_loader import (
     get_available_presets,
     get_preset_names,
     clear_preset_cache,
+    clear_file_cache,
 )
 
 
@@ -80,6 +81,121 @@ def test_load_compliance_preset_not_found():
         load_compliance_preset("/nonexistent/file.yaml")
 
 
+def test_load_compliance_preset_custom_patterns(tmp_path):
+    """Test parsing custom patterns, skipping malformed entries."""
+    file_path = tmp_path / "patterns.yaml"
+    file_path.write_text(yaml.dump({
+        "name": "Patterns",
+        "custom_patterns": [
+            {"name": "emp", "entity_type": "EMPLOYEE_ID", "regex": "EMP\\d+", "score": 0.9},
+            "not-a-dict",
+            {"name": "code", "entity_type": "CODE", "regex": "C\\d+", "context": None},
+        ],
+    }))
+
+    patterns = load_compliance_preset(file_path).custom_patterns
+
+    assert [p.name for p in patterns] == ["emp", "code"]
+    assert patterns[0].score == 0.9
+    assert patterns[0].context == []
+    assert patterns[1].score == 0.7
+    assert patterns[1].context == []
+
+
+def test_load_compliance_preset_invalid_regex(tmp_path):
+    """Test that an invalid custom pattern regex fails the preset load."""
+    file_path = tmp_path / "bad_regex.yaml"
+    file_path.write_text(yaml.dump({
+        "name": "Bad",
+        "custom_patterns": [{"name": "bad", "entity_type": "BAD", "regex": "("}],
+    }))
+
+    preset, error = load_compliance_preset_safe(file_path)
+
+    assert preset is None
+    assert "Configuration error" in error
+    assert "'bad' has invalid regex" in error
+
+
+def test_load_compliance_preset_cache_bounded(tmp_path, monkeypatch):
+    """Test that the per-file cache evicts its oldest entry when full."""
+    from pii_airlock.config import compliance_loader
+
+    monkeypatch.setattr(compliance_loader, "_FILE_CACHE_MAXSIZE", 2)
+    clear_file_cache()
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"preset_{i}.yaml"
+        path.write_text(f"name: Preset {i}\n")
+        paths.append(path)
+
+    first = load_compliance_preset(paths[0])
+    load_compliance_preset(paths[1])
+    load_compliance_preset(paths[2])
+
+    assert len(compliance_loader._file_cache) == 2
+    assert load_compliance_preset(paths[0]) is not first
+
+
+def test_get_available_presets_reports_invalid(tmp_path, caplog, monkeypatch):
+    """Test that broken presets are logged and not re-parsed while unchanged."""
+    import logging
+
+    from pii_airlock.config import compliance_loader
+
+    clear_file_cache()
+    (tmp_path / "good.yaml").write_text("name: Good\n")
+    (tmp_path / "broken.yaml").write_text("- not\n- a mapping\n")
+
+    parsed = []
+    parse = compliance_loader._parse_preset_file
+    monkeypatch.setattr(
+        compliance_loader,
+        "_parse_preset_file",
+        lambda path: parsed.append(path) or parse(path),
+    )
+
+    with caplog.at_level(logging.WARNING):
+        get_available_presets(tmp_path)
+        presets = get_available_presets(tmp_path)
+
+    assert list(presets) == ["good"]
+    assert len(parsed) == 2
+    warnings = [r for r in caplog.records if "broken.yaml" in r.getMessage()]
+    assert len(warnings) == 2
+    assert "expected dict" in warnings[0].getMessage()
+
+
+def test_load_compliance_preset_interns_pii_types(temp_preset_file):
+    """Test that PII type names are interned."""
+    import sys
+
+    clear_file_cache()
+    preset = load_compliance_preset(temp_preset_file)
+
+    assert all(t is sys.intern(t) for t in preset.pii_types)
+    assert all(k is sys.intern(k) for k in preset.strategies)
+
+
+def test_load_compliance_preset_cached(temp_preset_file):
+    """Test that unchanged files are served from the per-file cache."""
+    clear_file_cache()
+    preset = load_compliance_preset(temp_preset_file)
+    assert load_compliance_preset(temp_preset_file) is preset
+
+    # Rewriting the file changes its size and invalidates the entry
+    data = yaml.safe_load(temp_preset_file.read_text())
+    data["description"] = "Updated description"
+    temp_preset_file.write_text(yaml.dump(data))
+
+    reloaded = load_compliance_preset(temp_preset_file)
+    assert reloaded is not preset
+    assert reloaded.description == "Updated description"
+
+    clear_file_cache()
+    assert load_compliance_preset(temp_preset_file) is not reloaded
+
+
 def test_load_compliance_preset_safe(temp_preset_file):
     """Test loading a preset with error handling."""
     preset, error = load_compliance_preset_safe(temp_preset_file)
@@ -152,6 +268,14 @@ def test_get_preset_names():
     assert "ccpa" in names
 
 
+def test_get_preset_names_skips_invalid(tmp_path):
+    """Test that only loadable presets are listed."""
+    (tmp_path / "Valid.yaml").write_text("name: Valid\ndescription: ok\n")
+    (tmp_path / "broken.yaml").write_text("- not\n- a mapping\n")
+
+    assert get_preset_names(tmp_path) == ["valid"]
+
+
 def test_gdpr_preset_exists():
     """Test that GDPR preset can be loaded."""
     clear_preset_cache()
@@ -252,6 +376,26 @@ def test_compliance_rules():
     assert gdpr.compliance_rules.data_minimization is not None
 
 
+def test_compliance_rules_parsing(tmp_path):
+    """Test parsing boolean, mapping and missing rule entries."""
+    file_path = tmp_path / "rules.yaml"
+    file_path.write_text(yaml.dump({
+        "name": "Rules",
+        "compliance_rules": {
+            "pci_dss": {"enabled": False},
+            "aml_checks": {"enabled": True, "threshold": 10000},
+        },
+    }))
+
+    rules = load_compliance_preset(file_path).compliance_rules
+
+    assert rules.pci_dss.enabled is False
+    assert rules.aml_checks.enabled is True
+    assert rules.aml_checks.additional_config["threshold"] == 10000
+    assert rules.kyc_protection.enabled is True
+    assert rules.kyc_protection.additional_config == {}
+
+
 def test_clear_preset_cache():
     """Test clearing the preset cache."""
     # Load presets
@@ -282,3 +426,24 @@ def test_preset_serialization():
     assert preset_dict["version"] == gdpr.version
     assert preset_dict["region"] == gdpr.region
     assert preset_dict["pii_types"] == gdpr.pii_types
+
+
+def test_load_compliance_preset_cached_error(tmp_path):
+    """Test that cached load errors are raised as fresh exceptions."""
+    clear_file_cache()
+    broken = tmp_path / "broken.yaml"
+    broken.write_text("- not\n- a mapping\n")
+    malformed = tmp_path / "malformed.yaml"
+    malformed.write_text("name: [unclosed\n")
+
+    with pytest.raises(ValueError, match="expected dict") as first:
+        load_compliance_preset(broken)
+    with pytest.raises(ValueError, match="expected dict") as second:
+        load_compliance_preset(broken)
+    assert second.value is not first.value
+
+    with pytest.raises(yaml.YAMLError) as first:
+        load_compliance_preset(malformed)
+    with pytest.raises(yaml.YAMLError) as second:
+        load_compliance_preset(malformed)
+    assert str(second.value) == str(first.value)
@@ -111,6 +111,25 @@ class TestDeanonymizerFuzzy:
         result = deanonymizer.deanonymize("<PERSON-1>您好", sample_mapping)
         assert "张三" in result.text
 
+    def test_legacy_fuzzy_variants(self, sample_mapping):
+        """Handle every fuzzy variant in one pass without the enhanced matcher."""
+        deanonymizer = Deanonymizer(enable_fuzzy_matching=True, use_enhanced_fuzzy=False)
+        text = "<person 1>、[PERSON_1]、{{Phone 1}}、(PHONE_1)、<PERSON-1>、<PERSON 9>"
+
+        result = deanonymizer.deanonymize(text, sample_mapping)
+
+        assert result.text == "张三、张三、13800138000、13800138000、张三、<PERSON 9>"
+        assert result.replaced_count == 5
+
+    def test_legacy_fuzzy_skips_plain_text(self, sample_mapping):
+        """Skip the fuzzy regex when no placeholder opener is present."""
+        deanonymizer = Deanonymizer(enable_fuzzy_matching=True, use_enhanced_fuzzy=False)
+
+        assert deanonymizer._fuzzy_replace("张三您好 PERSON 1", sample_mapping) == (
+            "张三您好 PERSON 1",
+            0,
+        )
+
     def test_fuzzy_disabled(self, sample_mapping):
         """Fuzzy matching disabled."""
         deanonymizer = Deanonymizer(enable_fuzzy_matching=False)
@@ -135,6 +154,13 @@ class TestDeanonymizerUtilities:
         assert ("PERSON", "1") in placeholders
         assert ("PHONE", "2") in placeholders
 
+    def test_iter_placeholders(self, deanonymizer):
+        """Test lazy placeholder iteration."""
+        placeholders = deanonymizer.iter_placeholders("<PERSON_1>和<PHONE_2>")
+
+        assert next(placeholders) == ("PERSON", "1")
+        assert list(placeholders) == [("PHONE", "2")]
+
     def test_has_placeholders_true(self, deanonymizer):
         """Test has_placeholders returns True."""
         assert deanonymizer.has_placeholders("Hello <PERSON_1>")
@@ -24,6 +24,8 @@ from pii_airlock.auth.quota import (
     QuotaLimit,
     QuotaType,
     QuotaPeriod,
+    QuotaUsage,
+    quota_check_context,
     reset_quota_store,
 )
 
@@ -105,9 +107,69 @@ class TestEmptyPIIMapping:
 # TEST-009: Very Long Text Processing
 # =============================================================================
 
+class _StubAnalyzer:
+    """Analyzer returning fixed regex matches, so tests do not need spaCy."""
+
+    PATTERNS = {
+        "PERSON": (r"张三|李四", 0.85),
+        "PHONE_NUMBER": (r"1[3-9]\d-?\d{4}-?\d{4}", 0.8),
+        "EMAIL_ADDRESS": (r"[a-z.]+@[a-z.]+[a-z]", 0.9),
+    }
+
+    def analyze(self, text, language, entities, score_threshold):
+        import re
+
+        from presidio_analyzer import RecognizerResult
+
+        return [
+            RecognizerResult(entity_type, m.start(), m.end(), score)
+            for entity_type, (pattern, score) in self.PATTERNS.items()
+            if entity_type in entities
+            for m in re.finditer(pattern, text)
+        ]
+
+
+class _StubNlpEngine:
+    """NLP engine recording the batches Presidio's BatchAnalyzerEngine sends."""
+
+    def __init__(self):
+        self.batches = []
+
+    def process_batch(self, texts, language, batch_size, n_process):
+        texts = list(texts)
+        self.batches.append(texts)
+        return [(text, None) for text in texts]
+
+
+class _BatchStubAnalyzer(_StubAnalyzer):
+    """Stub analyzer exposing an NLP engine, like AnalyzerEngine does."""
+
+    def __init__(self):
+        self.nlp_engine = _StubNlpEngine()
+
+    def analyze(self, text, language, entities, score_threshold, nlp_artifacts=None):
+        return super().analyze(text, language, entities, score_threshold)
+
+
 class TestLongTextProcessing:
     """Tests for processing very long text (>100KB)."""
 
+    def test_long_text_many_entities_replaced(self):
+        """Test that every entity in a long text is replaced in place."""
+        anonymizer = Anonymizer(
+            analyzer=_StubAnalyzer(),
+            enable_allowlist=False,
+            enable_intent_detection=False,
+        )
+        long_text = "张三的电话是13800138000，李四的邮箱是lisi@example.com。" * 2000
+
+        result = anonymizer.anonymize(long_text)
+
+        # Numbering runs from the end of the text, as before
+        expected = "<PERSON_2>的电话是<PHONE_1>，<PERSON_1>的邮箱是<EMAIL_1>。" * 2000
+        assert result.text == expected
+        assert len(result.entities) == 8000
+
     def test_long_text_without_pii(self):
         """Test processing long text without PII."""
         anonymizer = Anonymizer()
@@ -198,6 +260,279 @@ class TestLongTextProcessing:
         assert elapsed < 0.1  # Should be very fast
 
 
+class TestEntityResolution:
+    """Tests for resolving overlapping and repeated entities."""
+
+    def test_overlap_removal_keeps_best_candidates(self):
+        """Test overlap removal on many nested and chained candidates."""
+        from presidio_analyzer import RecognizerResult
+
+        anonymizer = Anonymizer(analyzer=_StubAnalyzer())
+        results = []
+        for base in range(0, 30000, 30):
+            results += [
+                RecognizerResult("PERSON", base, base + 10, 0.6),
+                RecognizerResult("PHONE_NUMBER", base, base + 12, 0.9),
+                RecognizerResult("PERSON", base + 5, base + 20, 0.9),
+                RecognizerResult("EMAIL_ADDRESS", base + 12, base + 15, 0.5),
+            ]
+
+        filtered = anonymizer._remove_overlapping_entities(results)
+
+        assert [(r.start % 30, r.end % 30) for r in filtered[:2]] == [(0, 12), (12, 15)]
+        assert len(filtered) == 2000
+
+    def test_fuzzy_duplicate_reuses_placeholder(self):
+        """Test that a reformatted repeat of a value gets the same placeholder."""
+        anonymizer = Anonymizer(
+            analyzer=_StubAnalyzer(),
+            enable_allowlist=False,
+            enable_intent_detection=False,
+        )
+
+        result = anonymizer.anonymize("电话13800138000，或者138-0013-8000")
+
+        assert result.text == "电话<PHONE_1>，或者<PHONE_1>"
+
+
+class TestBatchAnonymization:
+    """Tests for anonymizing several texts in one call."""
+
+    def test_anonymize_batch_matches_single_calls(self):
+        """Test that batch results match per-text anonymize() results."""
+        anonymizer = Anonymizer(
+            analyzer=_StubAnalyzer(),
+            enable_allowlist=False,
+            enable_intent_detection=False,
+        )
+        texts = ["张三的电话是13800138000", "", "   ", "李四和张三", "普通文本"]
+
+        results = anonymizer.anonymize_batch(texts, session_ids=["a", None, None, "b", None])
+
+        assert [r.text for r in results] == [anonymizer.anonymize(t).text for t in texts]
+        assert results[0].mapping.session_id == "a"
+        assert results[3].mapping.session_id == "b"
+        assert results[1].pii_count == 0
+
+    def test_anonymize_batch_session_ids_length_mismatch(self):
+        """Test that mismatched session ids are rejected."""
+        anonymizer = Anonymizer(analyzer=_StubAnalyzer())
+
+        with pytest.raises(ValueError, match="session ids"):
+            anonymizer.anonymize_batch(["张三"], session_ids=["a", "b"])
+
+    def test_anonymize_batch_uses_nlp_batch(self):
+        """Test that analyzers with an NLP engine get one batched pass."""
+        anonymizer = Anonymizer(
+            analyzer=_BatchStubAnalyzer(),
+            enable_allowlist=False,
+            enable_intent_detection=False,
+        )
+        texts = ["张三的电话是13800138000", "", "李四和张三"]
+
+        results = anonymizer.anonymize_batch(texts)
+
+        assert anonymizer._analyzer.nlp_engine.batches == [
+            ["张三的电话是13800138000", "李四和张三"]
+        ]
+        assert [r.text for r in results] == [
+            "<PERSON_1>的电话是<PHONE_1>",
+            "",
+            "<PERSON_2>和<PERSON_1>",
+        ]
+
+
+class TestEnvDefaults:
+    """Tests for environment-driven Anonymizer defaults."""
+
+    def test_env_defaults_read_once(self, monkeypatch):
+        """Test that env defaults are snapshotted until the cache is reset."""
+        from pii_airlock.core.anonymizer import _reset_env_cache
+
+        monkeypatch.setenv("PII_AIRLOCK_ALLOWLIST_ENABLED", "false")
+        _reset_env_cache()
+        try:
+            assert Anonymizer(analyzer=_StubAnalyzer()).enable_allowlist is False
+
+            monkeypatch.setenv("PII_AIRLOCK_ALLOWLIST_ENABLED", "true")
+            assert Anonymizer(analyzer=_StubAnalyzer()).enable_allowlist is False
+
+            _reset_env_cache()
+            assert Anonymizer(analyzer=_StubAnalyzer()).enable_allowlist is True
+        finally:
+            monkeypatch.undo()
+            _reset_env_cache()
+
+
+class TestSessionMappings:
+    """Tests for mapping reuse across calls with the same session id."""
+
+    def _anonymizer(self):
+        return Anonymizer(
+            analyzer=_StubAnalyzer(),
+            enable_allowlist=False,
+            enable_intent_detection=False,
+        )
+
+    def test_same_session_shares_placeholders(self):
+        """Test that calls in one session never reuse a placeholder number."""
+        anonymizer = self._anonymizer()
+
+        first = anonymizer.anonymize("张三你好", session_id="conv")
+        second = anonymizer.anonymize("李四和张三", session_id="conv")
+
+        assert first.text == "<PERSON_1>你好"
+        assert second.text == "<PERSON_2>和<PERSON_1>"
+        assert second.mapping.get_original("<PERSON_2>") == "李四"
+
+        # Other sessions and session-less calls start from scratch
+        assert anonymizer.anonymize("李四", session_id="other").text == "<PERSON_1>"
+        assert anonymizer.anonymize("李四").text == "<PERSON_1>"
+
+    def test_sessions_bounded_and_clearable(self):
+        """Test LRU eviction and clear_session()."""
+        anonymizer = self._anonymizer()
+        anonymizer.max_sessions = 2
+
+        anonymizer.anonymize("张三", session_id="a")
+        anonymizer.anonymize("张三", session_id="b")
+        anonymizer.anonymize("张三", session_id="c")
+        assert list(anonymizer._sessions) == ["b", "c"]
+
+        anonymizer.clear_session("b")
+        assert list(anonymizer._sessions) == ["c"]
+        anonymizer.clear_session()
+        assert not anonymizer._sessions
+
+
+class TestExemptionAudit:
+    """Tests for audit events recorded for allowlist exemptions."""
+
+    @pytest.mark.asyncio
+    async def test_allowlist_exemptions_reach_audit_logger(self, monkeypatch):
+        """Test that exemptions are queued as one batch of audit events."""
+        import asyncio
+
+        from pii_airlock.audit import AuditEventType, AuditLogger
+        from pii_airlock.core import anonymizer as anonymizer_module
+
+        audit_logger = AuditLogger(enabled=True)
+        monkeypatch.setattr(anonymizer_module, "get_audit_logger", lambda: audit_logger)
+
+        anonymizer = Anonymizer(
+            analyzer=_StubAnalyzer(),
+            enable_allowlist=True,
+            enable_intent_detection=False,
+        )
+        anonymizer._is_allowlisted_cached = lambda generation, entity_type, value: (
+            value == "张三"
+        )
+
+        result = anonymizer.anonymize("张三和李四", session_id="conv")
+        assert result.text == "张三和<PERSON_1>"
+
+        # Let the scheduled log_batch task run
+        pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        await asyncio.gather(*pending)
+
+        events = audit_logger._pending_events
+        assert [e.event_type for e in events] == [AuditEventType.ALLOWLIST_EXEMPT]
+        assert events[0].entity_type == "PERSON"
+        assert events[0].metadata["original_value"] == "张三"
+        assert events[0].metadata["session_id"] == "conv"
+
+
+class TestEntityTables:
+    """Tests for per-instance supported entity tables."""
+
+    def test_custom_entity_types_do_not_leak(self):
+        """Test that custom entity types only affect their own Anonymizer."""
+        plain = Anonymizer(analyzer=_StubAnalyzer())
+        custom = Anonymizer(
+            analyzer=_StubAnalyzer(),
+            custom_entity_types={"EMPLOYEE_ID": "EMPLOYEE"},
+        )
+
+        assert "EMPLOYEE_ID" in custom.get_supported_entities()
+        assert custom.ENTITY_TYPE_MAP["EMPLOYEE_ID"] == "EMPLOYEE"
+        assert "EMPLOYEE_ID" not in plain.get_supported_entities()
+        assert "EMPLOYEE_ID" not in Anonymizer.DEFAULT_ENTITY_TYPE_MAP
+        assert plain.SUPPORTED_ENTITIES is Anonymizer.DEFAULT_ENTITIES
+
+    def test_config_patterns_keep_existing_placeholder_types(self, tmp_path):
+        """Test that YAML patterns add entity types without remapping known ones."""
+        config_path = tmp_path / "patterns.yaml"
+        config_path.write_text(
+            "patterns:\n"
+            "  - name: employee_id\n"
+            "    entity_type: EMPLOYEE_ID\n"
+            "    regex: 'EMP\\d{6}'\n"
+            "  - name: phone\n"
+            "    entity_type: PHONE_NUMBER\n"
+            "    regex: '\\d{11}'\n"
+        )
+
+        anonymizer = Anonymizer(
+            analyzer=_StubAnalyzer(),
+            config_path=config_path,
+            custom_entity_types={"PROJECT_CODE": "PROJECT"},
+        )
+
+        expected = [*Anonymizer.DEFAULT_ENTITIES, "PROJECT_CODE", "EMPLOYEE_ID"]
+        assert anonymizer.SUPPORTED_ENTITIES == expected
+        assert anonymizer.ENTITY_TYPE_MAP["EMPLOYEE_ID"] == "EMPLOYEE_ID"
+        assert anonymizer.ENTITY_TYPE_MAP["PROJECT_CODE"] == "PROJECT"
+        assert anonymizer.ENTITY_TYPE_MAP["PHONE_NUMBER"] == "PHONE"
+
+
+class TestRegexPrescan:
+    """Tests for skipping analysis of texts that cannot contain PII."""
+
+    def _anonymizer(self, **kwargs):
+        analyzer = _StubAnalyzer()
+        analyzer.calls = 0
+        analyze = analyzer.analyze
+
+        def counting_analyze(*args, **kw):
+            analyzer.calls += 1
+            return analyze(*args, **kw)
+
+        analyzer.analyze = counting_analyze
+        anonymizer = Anonymizer(
+            analyzer=analyzer,
+            enable_allowlist=False,
+            enable_intent_detection=False,
+            **kwargs,
+        )
+        return anonymizer, analyzer
+
+    def test_prescan_skips_text_without_digits(self):
+        """Test that digit-free text skips analysis for digit-only entities."""
+        anonymizer, analyzer = self._anonymizer()
+
+        result = anonymizer.anonymize("好的，谢谢", entities=["PHONE_NUMBER"])
+        assert result.text == "好的，谢谢"
+        assert analyzer.calls == 0
+
+        result = anonymizer.anonymize("电话13800138000", entities=["PHONE_NUMBER"])
+        assert result.text == "电话<PHONE_1>"
+        assert analyzer.calls == 1
+
+    def test_prescan_keeps_person_detection(self):
+        """Test that prescan never skips when PERSON is requested."""
+        anonymizer, analyzer = self._anonymizer()
+
+        assert anonymizer.anonymize("张三你好").text == "<PERSON_1>你好"
+        assert analyzer.calls == 1
+
+    def test_prescan_can_be_disabled(self):
+        """Test the prescan_regex opt-out."""
+        anonymizer, analyzer = self._anonymizer(prescan_regex=False)
+
+        anonymizer.anonymize("好的，谢谢", entities=["PHONE_NUMBER"])
+        assert analyzer.calls == 1
+
+
 # =============================================================================
 # TEST-010: Concurrent Access to Mapping Store
 # =============================================================================
@@ -539,6 +874,40 @@ class TestQuotaThresholdEdgeCases:
         assert limit is not None
         assert limit.limit == 5
 
+    def test_quota_raised_during_check_is_not_cached_as_denied(self):
+        """Test that a denial racing with set_quota() is not remembered."""
+        store = QuotaStore()
+
+        def config(limit):
+            return QuotaConfig(
+                tenant_id="tenant-1",
+                limits=[
+                    QuotaLimit(
+                        quota_type=QuotaType.REQUESTS,
+                        period=QuotaPeriod.HOURLY,
+                        limit=limit,
+                    )
+                ],
+            )
+
+        store.set_quota(config(1))
+        store.record_usage("tenant-1", QuotaType.REQUESTS, 1)
+
+        lookup = store._lookup
+
+        def lookup_then_raise_limit(*args):
+            usages = lookup(*args)
+            store.set_quota(config(100))
+            return usages
+
+        store._lookup = lookup_then_raise_limit
+        allowed, _ = store.check_quota("tenant-1", QuotaType.REQUESTS, 1)
+        assert allowed is False
+
+        store._lookup = lookup
+        allowed, _ = store.check_quota("tenant-1", QuotaType.REQUESTS, 1)
+        assert allowed is True
+
     def test_quota_soft_limit_warning(self):
         """Test soft limit warning threshold."""
         store = QuotaStore()
@@ -682,6 +1051,39 @@ class TestQuotaThresholdEdgeCases:
         assert QuotaType.REQUESTS.value in summary
         assert QuotaType.TOKENS.value in summary
 
+    def test_quota_exceeded_cleared_by_new_config(self):
+        """Test that a cached exceeded verdict is dropped when quota changes."""
+        store = QuotaStore()
+
+        def make_config(limit: int) -> QuotaConfig:
+            return QuotaConfig(
+                tenant_id="tenant-1",
+                limits=[
+                    QuotaLimit(
+                        quota_type=QuotaType.REQUESTS,
+                        period=QuotaPeriod.DAILY,
+                        limit=limit,
+                    )
+                ]
+            )
+
+        store.set_quota(make_config(2))
+        store.record_usage("tenant-1", QuotaType.REQUESTS, 2)
+
+        # Denied twice: the second answer comes from the exceeded cache
+        for _ in range(2):
+            allowed, limit = store.check_quota("tenant-1", QuotaType.REQUESTS, 1)
+            assert allowed is False
+            assert limit.limit == 2
+
+        # Zero-amount checks are never short-circuited
+        allowed, _ = store.check_quota("tenant-1", QuotaType.REQUESTS, 0)
+        assert allowed is True
+
+        store.set_quota(make_config(10))
+        allowed, _ = store.check_quota("tenant-1", QuotaType.REQUESTS, 1)
+        assert allowed is True
+
     def test_quota_concurrent_access(self):
         """Test concurrent quota checks and updates."""
         store = QuotaStore()
@@ -718,6 +1120,116 @@ class TestQuotaThresholdEdgeCases:
         # All 1000 requests should have succeeded
         assert len(results) == 1000
 
+    def test_quota_from_yaml_picks_up_file_changes(self, tmp_path):
+        """Test that from_yaml reuses parsed YAML but sees edits to the file."""
+        import os
+
+        path = tmp_path / "quotas.yaml"
+        path.write_text(
+            "quotas:\n  - tenant_id: team-a\n    requests:\n      daily: 10\n",
+            encoding="utf-8",
+        )
+
+        store = QuotaStore.from_yaml(str(path))
+        assert store.get_quota_config("team-a").get_limit(
+            QuotaType.REQUESTS, QuotaPeriod.DAILY
+        ).limit == 10
+
+        # Unchanged file: a fresh store gets its own config objects
+        again = QuotaStore.from_yaml(str(path))
+        assert again.get_quota_config("team-a") is not store.get_quota_config("team-a")
+
+        path.write_text(
+            "quotas:\n  - tenant_id: team-a\n    requests:\n      daily: 2000\n",
+            encoding="utf-8",
+        )
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        reloaded = QuotaStore.from_yaml(str(path))
+        assert reloaded.get_quota_config("team-a").get_limit(
+            QuotaType.REQUESTS, QuotaPeriod.DAILY
+        ).limit == 2000
+
+    def test_quota_cleanup_expired_windows(self):
+        """Test that expired usage windows are swept from the store."""
+        store = QuotaStore()
+        store.record_usage("tenant-1", QuotaType.REQUESTS, 3)
+        store.record_usage("tenant-2", QuotaType.REQUESTS, 1)
+
+        # Expire every window of tenant-1
+        for period in QuotaPeriod:
+            store.get_usage("tenant-1", QuotaType.REQUESTS, period).window_end = 0
+
+        assert store.cleanup_expired() == len(QuotaPeriod)
+        assert store.get_usage_summary("tenant-1") == {}
+        assert store.get_usage_summary("tenant-2")[QuotaType.REQUESTS.value] == {
+            period.value: 1 for period in QuotaPeriod
+        }
+
+        # A swept window starts again from zero
+        assert store.get_usage("tenant-1", QuotaType.REQUESTS, QuotaPeriod.DAILY).current_usage == 0
+        store.shutdown()
+
+    def test_quota_check_context_memoizes_lookups(self):
+        """Test that check and record inside one request share usage windows."""
+        store = QuotaStore()
+        store.set_quota(QuotaConfig(
+            tenant_id="tenant-1",
+            limits=[QuotaLimit(QuotaType.REQUESTS, QuotaPeriod.DAILY, limit=2)],
+        ))
+
+        with quota_check_context():
+            assert store.check_quota("tenant-1", QuotaType.REQUESTS)[0] is True
+            store.record_usage("tenant-1", QuotaType.REQUESTS)
+            # The memoized windows see the increment
+            assert store.check_quota("tenant-1", QuotaType.REQUESTS)[0] is True
+            store.record_usage("tenant-1", QuotaType.REQUESTS)
+            assert store.check_quota("tenant-1", QuotaType.REQUESTS)[0] is False
+
+            # An expired memoized window is rolled over, not reused
+            store.get_usage("tenant-1", QuotaType.REQUESTS, QuotaPeriod.DAILY).window_end = 0
+            store._denied_shards[store._shard("tenant-1")].clear()
+            assert store.check_quota("tenant-1", QuotaType.REQUESTS)[0] is True
+
+        store.shutdown()
+
+    def test_quota_multiple_periods_reports_exceeded_limit(self):
+        """Test that the tightest configured period rejects the request."""
+        store = QuotaStore()
+        daily = QuotaLimit(QuotaType.TOKENS, QuotaPeriod.DAILY, limit=100)
+        store.set_quota(QuotaConfig(
+            tenant_id="tenant-1",
+            limits=[
+                QuotaLimit(QuotaType.TOKENS, QuotaPeriod.HOURLY, limit=500),
+                daily,
+            ],
+        ))
+
+        assert store.check_quota("tenant-1", QuotaType.TOKENS, 100) == (True, None)
+        assert store.check_quota("tenant-1", QuotaType.TOKENS, 101) == (False, daily)
+        # No request limit configured for this tenant
+        assert store.check_quota("tenant-1", QuotaType.REQUESTS, 10**6) == (True, None)
+        store.shutdown()
+
+    def test_quota_window_end_utc_boundaries(self):
+        """Test daily and monthly windows end on UTC boundaries."""
+        from datetime import datetime, timezone
+
+        daily = QuotaUsage(tenant_id="t", quota_type=QuotaType.REQUESTS, period=QuotaPeriod.DAILY)
+        daily.reset()
+        end = datetime.fromtimestamp(daily.window_end, timezone.utc)
+        assert (end.hour, end.minute, end.second) == (0, 0, 0)
+        assert 0 < daily.window_end - daily.window_start <= 86400
+
+        monthly = QuotaUsage(
+            tenant_id="t", quota_type=QuotaType.REQUESTS, period=QuotaPeriod.MONTHLY
+        )
+        monthly.reset()
+        end = datetime.fromtimestamp(monthly.window_end, timezone.utc)
+        assert (end.day, end.hour, end.minute, end.second) == (1, 0, 0, 0)
+        assert monthly.window_end > monthly.window_start
+
 
 # =============================================================================
 # Additional Edge Cases
@@ -96,6 +96,19 @@ class TestIntentDetector:
         result = detector.is_question_context(text, 12, 16)  # "John"
         assert result.is_question is False
 
+    def test_has_question_signal(self):
+        """Test the prefilter agrees with full question context detection."""
+        detector = IntentDetector()
+
+        assert detector.has_question_signal("张三是谁？", 0, 2) is True
+        assert detector.has_question_signal("Tell me about John", 14, 18) is True
+        assert detector.has_question_signal("请给张三发邮件", 2, 4) is False
+        assert detector.has_question_signal("Send email to John", 12, 16) is False
+
+        # Patterns that cannot be merged fall back to the full detector
+        detector = IntentDetector(question_patterns=[r"(a)\1"])
+        assert detector.has_question_signal("Send email to John", 12, 16) is True
+
     def test_should_preserve_entity_question_context(self):
         """Test that entities are preserved in question context."""
         detector = IntentDetector()
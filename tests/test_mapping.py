@@ -35,6 +35,22 @@ class TestPIIMapping:
         assert mapping.get_original("<PERSON_2>") is None
         assert mapping.get_placeholder("PHONE", "13800138000") is None
 
+    def test_get_placeholder_any(self):
+        """Test lookup falling back to the normalized form."""
+        mapping = PIIMapping()
+        mapping.add("PHONE", "138-0013-8000", "<PHONE_1>")
+        mapping.add("PHONE_normalized", "13800138000", "<PHONE_1>")
+
+        assert mapping.get_placeholder_any(
+            "PHONE", "138-0013-8000", "PHONE_normalized", "13800138000"
+        ) == "<PHONE_1>"
+        assert mapping.get_placeholder_any(
+            "PHONE", "138 0013 8000", "PHONE_normalized", "13800138000"
+        ) == "<PHONE_1>"
+        assert mapping.get_placeholder_any(
+            "PHONE", "13900139000", "PHONE_normalized", "13900139000"
+        ) is None
+
     def test_contains(self):
         """Test contains operator."""
         mapping = PIIMapping()
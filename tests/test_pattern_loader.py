@@ -59,6 +59,16 @@ class TestPatternConfig:
         with pytest.raises(ValueError, match="Regex pattern cannot be empty"):
             PatternConfig(name="test", entity_type="TEST", regex="")
 
+    def test_invalid_regex(self):
+        """Test that an uncompilable regex raises ValueError."""
+        with pytest.raises(ValueError, match="has invalid regex"):
+            PatternConfig(name="test", entity_type="TEST", regex="TEST[")
+
+    def test_regex_compiled(self):
+        """Test that the regex is compiled once at construction."""
+        config = PatternConfig(name="test", entity_type="TEST", regex="TEST\\d+")
+        assert config.compiled.search("id TEST42").group() == "TEST42"
+
     def test_invalid_score_too_low(self):
         """Test that score below 0 raises ValueError."""
         with pytest.raises(ValueError, match="Score must be between"):
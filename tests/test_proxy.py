@@ -137,6 +137,17 @@ class TestAnonymizeMessages:
         assert result[0].role == "user"
         assert result[1].role == "assistant"
 
+    def test_anonymize_failure_clears_session(self, proxy_with_anonymizer):
+        """Test that the session mapping is dropped even if anonymization fails."""
+        proxy = proxy_with_anonymizer
+        proxy.anonymizer = MagicMock()
+        proxy.anonymizer.anonymize_batch.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            proxy._anonymize_messages([Message(role="user", content="张三")], "request-1")
+
+        proxy.anonymizer.clear_session.assert_called_once_with("request-1")
+
 
 class TestInjectSystemPrompt:
     """Test the _inject_system_prompt method."""
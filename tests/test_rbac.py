@@ -224,6 +224,34 @@ class TestUserClass:
         assert len(user.permissions) == 0
         assert user.has_permission(Permission.LLM_USE) is False
 
+    def test_has_permission_follows_role_assignment(self):
+        """Test that reassigning roles updates permission checks."""
+        user = User(
+            user_id="u7",
+            name="Promoted",
+            email="promoted@example.com",
+            roles=[Role.USER],
+        )
+        assert user.has_permission(Permission.AUDIT_VIEW) is False
+
+        user.roles = [Role.VIEWER]
+        assert user.has_permission(Permission.AUDIT_VIEW) is True
+        assert user.has_permission(Permission.LLM_USE) is False
+
+    def test_has_permission_follows_in_place_role_edits(self):
+        """Test that mutating the roles list updates permission checks."""
+        user = User(
+            user_id="u8",
+            name="Demoted",
+            email="demoted@example.com",
+            roles=[Role.ADMIN],
+        )
+        assert user.has_permission(Permission.KEY_MANAGE) is True
+
+        user.roles.remove(Role.ADMIN)
+        assert user.permissions == frozenset()
+        assert user.has_permission(Permission.KEY_MANAGE) is False
+
 
 # ============================================================================
 # UserStore Tests
@@ -350,6 +378,20 @@ class TestUserStore:
         assert len(result) == 1
         assert result[0].user_id == "u1"
 
+    def test_list_users_by_role_after_update(self, user_store):
+        """Test that role filtering follows role updates and re-creation."""
+        user_store.create_user("u1", "User 1", "u1@example.com", roles=[Role.USER])
+        user_store.create_user("u2", "User 2", "u2@example.com", roles=[Role.USER])
+
+        user_store.update_user_roles("u1", [Role.ADMIN])
+        assert [u.user_id for u in user_store.list_users(role=Role.ADMIN)] == ["u1"]
+        assert [u.user_id for u in user_store.list_users(role=Role.USER)] == ["u2"]
+
+        # Re-creating a user replaces its index entries
+        user_store.create_user("u2", "User 2", "u2@example.com", roles=[Role.VIEWER])
+        assert user_store.list_users(role=Role.USER) == []
+        assert len(user_store.list_users(role=Role.VIEWER)) == 1
+
 
 class TestUserStoreThreadSafety:
     """Test UserStore thread safety."""
@@ -72,3 +72,60 @@ class TestChinesePhoneRecognizer:
         assert len(recognizer.context) > 0
         assert "电话" in recognizer.context
         assert "手机" in recognizer.context
+
+    def test_analyze_finds_phone_numbers(self, recognizer):
+        """Test detection of plain, prefixed and formatted numbers."""
+        text = "电话13800138000，或+8613900139000，或138-0013-8000"
+        results = recognizer.analyze(text, ["PHONE_NUMBER"])
+        found = {text[r.start:r.end] for r in results}
+        assert {"13800138000", "+8613900139000", "138-0013-8000"} <= found
+
+    def test_analyze_without_candidates(self, recognizer):
+        """Test that text without a mobile prefix yields no results."""
+        assert recognizer.analyze("订单号 12 34 5678", ["PHONE_NUMBER"]) == []
+
+
+class TestDisableUnusedPipes:
+    """Tests for pruning spaCy pipes on the analyzer NLP engine."""
+
+    @pytest.fixture
+    def nlp_engine(self):
+        """Create a minimal engine holding a blank spaCy pipeline."""
+        from types import SimpleNamespace
+
+        spacy = pytest.importorskip("spacy")
+        nlp = spacy.blank("en")
+        for name in ("tok2vec", "tagger", "parser", "attribute_ruler", "ner"):
+            nlp.add_pipe(name)
+        return SimpleNamespace(nlp={"en": nlp})
+
+    def test_keeps_ner_and_lemma_pipes(self, nlp_engine, monkeypatch):
+        """Test that only pipes unused by NER and context scoring are disabled."""
+        from pii_airlock.recognizers.registry import _disable_unused_pipes
+
+        monkeypatch.delenv("PII_AIRLOCK_DISABLE_PIPES", raising=False)
+        _disable_unused_pipes(nlp_engine)
+        assert nlp_engine.nlp["en"].pipe_names == [
+            "tok2vec",
+            "tagger",
+            "attribute_ruler",
+            "ner",
+        ]
+
+    def test_env_override(self, nlp_engine, monkeypatch):
+        """Test that PII_AIRLOCK_DISABLE_PIPES selects the pipes to disable."""
+        from pii_airlock.recognizers.registry import _disable_unused_pipes
+
+        monkeypatch.setenv("PII_AIRLOCK_DISABLE_PIPES", "parser")
+        _disable_unused_pipes(nlp_engine)
+        assert nlp_engine.nlp["en"].pipe_names == [
+            "tok2vec",
+            "tagger",
+            "attribute_ruler",
+            "ner",
+        ]
+
+        monkeypatch.setenv("PII_AIRLOCK_DISABLE_PIPES", "none")
+        nlp_engine.nlp["en"].enable_pipe("parser")
+        _disable_unused_pipes(nlp_engine)
+        assert "parser" in nlp_engine.nlp["en"].pipe_names
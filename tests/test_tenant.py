@@ -107,6 +107,33 @@ class TestTenantConfig:
 
         assert config.get_tenant("to-remove") is None
 
+    def test_snapshot_unaffected_by_later_changes(self):
+        """Test that tenant tables are read-only snapshots."""
+        config = TenantConfig(
+            tenants={"a": Tenant(tenant_id="a", name="A", api_keys=["key-a"])},
+            api_key_index={"key-a": "a"},
+        )
+        before = config.tenants
+
+        config.add_tenant(Tenant(tenant_id="b", name="B"))
+        config.remove_tenant("a")
+
+        assert set(before) == {"a"}
+        assert set(config.tenants) == {"b"}
+        assert config.get_tenant_by_api_key("key-a") is None
+        with pytest.raises(TypeError):
+            config.tenants["c"] = Tenant(tenant_id="c", name="C")
+
+    def test_api_key_prefix_segments(self):
+        """Test tenant extraction from piiak_ keys of different shapes."""
+        config = TenantConfig()
+        config.add_tenant(Tenant(tenant_id="acme", name="Acme"))
+
+        assert config.get_tenant_by_api_key("piiak_acme_secret_part").tenant_id == "acme"
+        assert config.get_tenant_by_api_key("piiak_acme").tenant_id == "acme"
+        assert config.get_tenant_by_api_key("piiak__acme") is None
+        assert config.get_tenant_by_api_key("sk_acme_secret") is None
+
     def test_api_key_index(self):
         """Test API key indexing."""
         config = TenantConfig()
@@ -132,6 +159,40 @@ class TestTenantConfig:
         found = config.get_tenant_by_api_key("piiak_other_key")
         assert found is None
 
+    def test_from_yaml_reloads_changed_file(self, tmp_path):
+        """Test loading tenants from YAML, including after an edit."""
+        path = tmp_path / "tenants.yaml"
+        path.write_text(
+            "tenants:\n"
+            "  - tenant_id: team-a\n"
+            "    name: Team A\n"
+            "    status: DISABLED\n"
+            "    api_keys: [piiak_team-a_k1]\n",
+            encoding="utf-8",
+        )
+
+        config = TenantConfig.from_yaml(path)
+        tenant = config.get_tenant("team-a")
+        assert tenant.status == TenantStatus.DISABLED
+        assert config.get_tenant_by_api_key("piiak_team-a_k1") is tenant
+
+        # Mutating a loaded tenant must not leak into the next load
+        tenant.api_keys.append("piiak_team-a_k2")
+        assert TenantConfig.from_yaml(path).get_tenant("team-a").api_keys == [
+            "piiak_team-a_k1"
+        ]
+
+        path.write_text(
+            "tenants:\n"
+            "  - tenant_id: team-b\n"
+            "    name: Team B\n"
+            "    settings:\n",
+            encoding="utf-8",
+        )
+        reloaded = TenantConfig.from_yaml(path)
+        assert [t.tenant_id for t in reloaded.list_tenants()] == ["team-b"]
+        assert reloaded.get_tenant("team-b").settings == {}
+
 
 class TestGetCurrentTenant:
     """Tests for get_current_tenant function."""